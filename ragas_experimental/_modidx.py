@@ -8,7 +8,9 @@ d = { 'settings': { 'branch': 'main',
   'syms': { 'ragas_experimental.backends.factory': { 'ragas_experimental.backends.factory.RagasApiClientFactory': ( 'backends/factory.html#ragasapiclientfactory',
                                                                                                                     'ragas_experimental/backends/factory.py'),
                                                      'ragas_experimental.backends.factory.RagasApiClientFactory.create': ( 'backends/factory.html#ragasapiclientfactory.create',
-                                                                                                                           'ragas_experimental/backends/factory.py')},
+                                                                                                                           'ragas_experimental/backends/factory.py'),
+                                                     'ragas_experimental.backends.factory.RagasApiClientFactory.create_mock': ( 'backends/factory.html#ragasapiclientfactory.create_mock',
+                                                                                                                                'ragas_experimental/backends/factory.py')},
             'ragas_experimental.backends.mock_notion': { 'ragas_experimental.backends.mock_notion.MockBlockChildrenAPI': ( 'backends/mock_notion_client.html#mockblockchildrenapi',
                                                                                                                            'ragas_experimental/backends/mock_notion.py'),
                                                          'ragas_experimental.backends.mock_notion.MockBlockChildrenAPI.__init__': ( 'backends/mock_notion_client.html#mockblockchildrenapi.__init__',
@@ -63,6 +65,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                             'ragas_experimental/backends/mock_notion.py'),
                                                          'ragas_experimental.backends.mock_notion.MockPagesAPI.update': ( 'backends/mock_notion_client.html#mockpagesapi.update',
                                                                                                                           'ragas_experimental/backends/mock_notion.py')},
+            'ragas_experimental.backends.mock_server': { 'ragas_experimental.backends.mock_server.MockRagasServer': ( 'backends/mock_server.html#mockragasserver',
+                                                                                                                      'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer.__init__': ( 'backends/mock_server.html#mockragasserver.__init__',
+                                                                                                                               'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer._collection_key': ( 'backends/mock_server.html#mockragasserver._collection_key',
+                                                                                                                                      'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer._create': ( 'backends/mock_server.html#mockragasserver._create',
+                                                                                                                              'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer._exists': ( 'backends/mock_server.html#mockragasserver._exists',
+                                                                                                                              'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer._list': ( 'backends/mock_server.html#mockragasserver._list',
+                                                                                                                            'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer._route': ( 'backends/mock_server.html#mockragasserver._route',
+                                                                                                                             'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer.client': ( 'backends/mock_server.html#mockragasserver.client',
+                                                                                                                             'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer.handle': ( 'backends/mock_server.html#mockragasserver.handle',
+                                                                                                                             'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server.MockRagasServer.transport': ( 'backends/mock_server.html#mockragasserver.transport',
+                                                                                                                                'ragas_experimental/backends/mock_server.py'),
+                                                         'ragas_experimental.backends.mock_server._Conflict': ( 'backends/mock_server.html#_conflict',
+                                                                                                                'ragas_experimental/backends/mock_server.py')},
             'ragas_experimental.backends.notion_backend': { 'ragas_experimental.backends.notion_backend.NotionBackend': ( 'backends/notion.html#notionbackend',
                                                                                                                           'ragas_experimental/backends/notion_backend.py'),
                                                             'ragas_experimental.backends.notion_backend.NotionBackend.__init__': ( 'backends/notion.html#notionbackend.__init__',
@@ -99,6 +123,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.RagasApiClient.__init__': ( 'backends/ragas_api_client.html#ragasapiclient.__init__',
                                                                                                                                         'ragas_experimental/backends/ragas_api_client.py'),
+                                                              'ragas_experimental.backends.ragas_api_client.RagasApiClient._aget_http_client': ( 'backends/ragas_api_client.html#ragasapiclient._aget_http_client',
+                                                                                                                                                 'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.RagasApiClient._create_resource': ( 'backends/ragas_api_client.html#ragasapiclient._create_resource',
                                                                                                                                                 'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.RagasApiClient._create_with_data': ( 'backends/ragas_api_client.html#ragasapiclient._create_with_data',
@@ -115,6 +141,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                         'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.RagasApiClient._update_resource': ( 'backends/ragas_api_client.html#ragasapiclient._update_resource',
                                                                                                                                                 'ragas_experimental/backends/ragas_api_client.py'),
+                                                              'ragas_experimental.backends.ragas_api_client.RagasApiClient.aclose': ( 'backends/ragas_api_client.html#ragasapiclient.aclose',
+                                                                                                                                      'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.RagasApiClient.convert_raw_data': ( 'backends/ragas_api_client.html#ragasapiclient.convert_raw_data',
                                                                                                                                                 'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.RagasApiClient.create_column': ( 'backends/ragas_api_client.html#ragasapiclient.create_column',
@@ -207,10 +235,40 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                     'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.RowCell': ( 'backends/ragas_api_client.html#rowcell',
                                                                                                                         'ragas_experimental/backends/ragas_api_client.py'),
+                                                              'ragas_experimental.backends.ragas_api_client._close_on_shutdown': ( 'backends/ragas_api_client.html#_close_on_shutdown',
+                                                                                                                                   'ragas_experimental/backends/ragas_api_client.py'),
                                                               'ragas_experimental.backends.ragas_api_client.create_nano_id': ( 'backends/ragas_api_client.html#create_nano_id',
                                                                                                                                'ragas_experimental/backends/ragas_api_client.py')},
             'ragas_experimental.core': {'ragas_experimental.core.foo': ('core.html#foo', 'ragas_experimental/core.py')},
-            'ragas_experimental.dataset': { 'ragas_experimental.dataset.Dataset': ('dataset.html#dataset', 'ragas_experimental/dataset.py'),
+            'ragas_experimental.dataset': { 'ragas_experimental.dataset.BackgroundAppender': ( 'dataset.html#backgroundappender',
+                                                                                               'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.BackgroundAppender.__aenter__': ( 'dataset.html#backgroundappender.__aenter__',
+                                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.BackgroundAppender.__aexit__': ( 'dataset.html#backgroundappender.__aexit__',
+                                                                                                         'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.BackgroundAppender.__init__': ( 'dataset.html#backgroundappender.__init__',
+                                                                                                        'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.BackgroundAppender._work': ( 'dataset.html#backgroundappender._work',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.BackgroundAppender.put': ( 'dataset.html#backgroundappender.put',
+                                                                                                   'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.ColumnMappingRegistry': ( 'dataset.html#columnmappingregistry',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.ColumnMappingRegistry.__init__': ( 'dataset.html#columnmappingregistry.__init__',
+                                                                                                           'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.ColumnMappingRegistry._build': ( 'dataset.html#columnmappingregistry._build',
+                                                                                                         'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.ColumnMappingRegistry.aget': ( 'dataset.html#columnmappingregistry.aget',
+                                                                                                       'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.ColumnMappingRegistry.get': ( 'dataset.html#columnmappingregistry.get',
+                                                                                                      'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.ColumnMappingRegistry.invalidate': ( 'dataset.html#columnmappingregistry.invalidate',
+                                                                                                             'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset': ('dataset.html#dataset', 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.__aiter__': ( 'dataset.html#dataset.__aiter__',
+                                                                                              'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.__delitem__': ( 'dataset.html#dataset.__delitem__',
+                                                                                                'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.__getitem__': ( 'dataset.html#dataset.__getitem__',
                                                                                                 'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.__init__': ( 'dataset.html#dataset.__init__',
@@ -223,22 +281,186 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.__setitem__': ( 'dataset.html#dataset.__setitem__',
                                                                                                 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._aappend': ( 'dataset.html#dataset._aappend',
+                                                                                             'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._acreate_row': ( 'dataset.html#dataset._acreate_row',
+                                                                                                 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._acreate_rows': ( 'dataset.html#dataset._acreate_rows',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._adelete_rows': ( 'dataset.html#dataset._adelete_rows',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._aensure_dedupe_index': ( 'dataset.html#dataset._aensure_dedupe_index',
+                                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._aget_column_id_map': ( 'dataset.html#dataset._aget_column_id_map',
+                                                                                                        'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._aiter_row_pages': ( 'dataset.html#dataset._aiter_row_pages',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._aload_entries': ( 'dataset.html#dataset._aload_entries',
+                                                                                                   'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._aremove_entries': ( 'dataset.html#dataset._aremove_entries',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._aresolve_column_mapping': ( 'dataset.html#dataset._aresolve_column_mapping',
+                                                                                                             'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._arow_exists': ( 'dataset.html#dataset._arow_exists',
+                                                                                                 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._column_mapping': ( 'dataset.html#dataset._column_mapping',
+                                                                                                    'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._column_table': ( 'dataset.html#dataset._column_table',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._decode_new_rows': ( 'dataset.html#dataset._decode_new_rows',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._decode_rows': ( 'dataset.html#dataset._decode_rows',
+                                                                                                 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._dedupe_key': ( 'dataset.html#dataset._dedupe_key',
+                                                                                                'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._entry_to_row_data': ( 'dataset.html#dataset._entry_to_row_data',
+                                                                                                       'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._forget_rows': ( 'dataset.html#dataset._forget_rows',
+                                                                                                 'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset._get_column_id_map': ( 'dataset.html#dataset._get_column_id_map',
                                                                                                        'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._mutable_entries': ( 'dataset.html#dataset._mutable_entries',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._projected_column_table': ( 'dataset.html#dataset._projected_column_table',
+                                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._records_to_entries': ( 'dataset.html#dataset._records_to_entries',
+                                                                                                        'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._rows_to_records': ( 'dataset.html#dataset._rows_to_records',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._view': ( 'dataset.html#dataset._view',
+                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset._view_of': ( 'dataset.html#dataset._view_of',
+                                                                                             'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.aappend': ( 'dataset.html#dataset.aappend',
+                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.aclear': ( 'dataset.html#dataset.aclear',
+                                                                                           'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.aexport': ( 'dataset.html#dataset.aexport',
+                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.aextend': ( 'dataset.html#dataset.aextend',
+                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.aload': ( 'dataset.html#dataset.aload',
+                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.apop': ( 'dataset.html#dataset.apop',
+                                                                                         'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.append': ( 'dataset.html#dataset.append',
                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.appender': ( 'dataset.html#dataset.appender',
+                                                                                             'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.aremove_where': ( 'dataset.html#dataset.aremove_where',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.asample': ( 'dataset.html#dataset.asample',
+                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.asave': ( 'dataset.html#dataset.asave',
+                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.ashard': ( 'dataset.html#dataset.ashard',
+                                                                                           'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.async_sync_from': ( 'dataset.html#dataset.async_sync_from',
+                                                                                                    'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.clear': ( 'dataset.html#dataset.clear',
+                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.disable_dedupe': ( 'dataset.html#dataset.disable_dedupe',
+                                                                                                   'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.enable_dedupe': ( 'dataset.html#dataset.enable_dedupe',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.export': ( 'dataset.html#dataset.export',
+                                                                                           'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.extend': ( 'dataset.html#dataset.extend',
+                                                                                           'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.get': ( 'dataset.html#dataset.get',
                                                                                         'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.head': ( 'dataset.html#dataset.head',
+                                                                                         'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.load': ( 'dataset.html#dataset.load',
                                                                                          'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.load_as_dicts': ( 'dataset.html#dataset.load_as_dicts',
                                                                                                   'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.pop': ( 'dataset.html#dataset.pop',
                                                                                         'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.remove_where': ( 'dataset.html#dataset.remove_where',
+                                                                                                 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.sample': ( 'dataset.html#dataset.sample',
+                                                                                           'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.save': ( 'dataset.html#dataset.save',
                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.shard': ( 'dataset.html#dataset.shard',
+                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.Dataset.sync_from': ( 'dataset.html#dataset.sync_from',
+                                                                                              'ragas_experimental/dataset.py'),
                                             'ragas_experimental.dataset.Dataset.to_pandas': ( 'dataset.html#dataset.to_pandas',
-                                                                                              'ragas_experimental/dataset.py')},
+                                                                                              'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RecordWriter': ( 'dataset.html#recordwriter',
+                                                                                         'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RecordWriter.__enter__': ( 'dataset.html#recordwriter.__enter__',
+                                                                                                   'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RecordWriter.__exit__': ( 'dataset.html#recordwriter.__exit__',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RecordWriter.__init__': ( 'dataset.html#recordwriter.__init__',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RecordWriter.write': ( 'dataset.html#recordwriter.write',
+                                                                                               'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RowIdentityMap': ( 'dataset.html#rowidentitymap',
+                                                                                           'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RowIdentityMap.__init__': ( 'dataset.html#rowidentitymap.__init__',
+                                                                                                    'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RowIdentityMap.__len__': ( 'dataset.html#rowidentitymap.__len__',
+                                                                                                   'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RowIdentityMap.disable': ( 'dataset.html#rowidentitymap.disable',
+                                                                                                   'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RowIdentityMap.enable': ( 'dataset.html#rowidentitymap.enable',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RowIdentityMap.get': ( 'dataset.html#rowidentitymap.get',
+                                                                                               'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.RowIdentityMap.put': ( 'dataset.html#rowidentitymap.put',
+                                                                                               'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._EntriesView': ( 'dataset.html#_entriesview',
+                                                                                         'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._EntriesView.__getitem__': ( 'dataset.html#_entriesview.__getitem__',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._EntriesView.__init__': ( 'dataset.html#_entriesview.__init__',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._EntriesView.__iter__': ( 'dataset.html#_entriesview.__iter__',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._EntriesView.__len__': ( 'dataset.html#_entriesview.__len__',
+                                                                                                 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._EntriesView.select': ( 'dataset.html#_entriesview.select',
+                                                                                                'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._StratifiedReservoir': ( 'dataset.html#_stratifiedreservoir',
+                                                                                                 'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._StratifiedReservoir.__init__': ( 'dataset.html#_stratifiedreservoir.__init__',
+                                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._StratifiedReservoir._allocate': ( 'dataset.html#_stratifiedreservoir._allocate',
+                                                                                                           'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._StratifiedReservoir.add': ( 'dataset.html#_stratifiedreservoir.add',
+                                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._StratifiedReservoir.sample': ( 'dataset.html#_stratifiedreservoir.sample',
+                                                                                                        'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._adedupe_row_id': ( 'dataset.html#_adedupe_row_id',
+                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._bounded_gather': ( 'dataset.html#_bounded_gather',
+                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._field_adapter': ( 'dataset.html#_field_adapter',
+                                                                                           'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._import_pyarrow': ( 'dataset.html#_import_pyarrow',
+                                                                                            'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._is_text_annotation': ( 'dataset.html#_is_text_annotation',
+                                                                                                'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._list_adapter': ( 'dataset.html#_list_adapter',
+                                                                                          'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._metric_result_fields': ( 'dataset.html#_metric_result_fields',
+                                                                                                  'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._reserve_dedupe_key': ( 'dataset.html#_reserve_dedupe_key',
+                                                                                                'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._settle_dedupe_key': ( 'dataset.html#_settle_dedupe_key',
+                                                                                               'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._shard_of': ( 'dataset.html#_shard_of',
+                                                                                      'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset._stratum': ( 'dataset.html#_stratum',
+                                                                                     'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.infer_format': ( 'dataset.html#infer_format',
+                                                                                         'ragas_experimental/dataset.py'),
+                                            'ragas_experimental.dataset.iter_records': ( 'dataset.html#iter_records',
+                                                                                         'ragas_experimental/dataset.py')},
             'ragas_experimental.embedding.base': { 'ragas_experimental.embedding.base.BaseEmbedding': ( 'embedding/base.html#baseembedding',
                                                                                                         'ragas_experimental/embedding/base.py'),
                                                    'ragas_experimental.embedding.base.BaseEmbedding.aembed_document': ( 'embedding/base.html#baseembedding.aembed_document',
@@ -263,7 +485,17 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                       'ragas_experimental/embedding/base.py'),
                                                    'ragas_experimental.embedding.base.ragas_embedding': ( 'embedding/base.html#ragas_embedding',
                                                                                                           'ragas_experimental/embedding/base.py')},
-            'ragas_experimental.exceptions': { 'ragas_experimental.exceptions.DatasetNotFoundError': ( 'exceptions.html#datasetnotfounderror',
+            'ragas_experimental.exceptions': { 'ragas_experimental.exceptions.ApiConflictError': ( 'exceptions.html#apiconflicterror',
+                                                                                                   'ragas_experimental/exceptions.py'),
+                                               'ragas_experimental.exceptions.ApiError': ( 'exceptions.html#apierror',
+                                                                                           'ragas_experimental/exceptions.py'),
+                                               'ragas_experimental.exceptions.ApiError.__init__': ( 'exceptions.html#apierror.__init__',
+                                                                                                    'ragas_experimental/exceptions.py'),
+                                               'ragas_experimental.exceptions.ApiNotFoundError': ( 'exceptions.html#apinotfounderror',
+                                                                                                   'ragas_experimental/exceptions.py'),
+                                               'ragas_experimental.exceptions.BudgetExceededError': ( 'exceptions.html#budgetexceedederror',
+                                                                                                      'ragas_experimental/exceptions.py'),
+                                               'ragas_experimental.exceptions.DatasetNotFoundError': ( 'exceptions.html#datasetnotfounderror',
                                                                                                        'ragas_experimental/exceptions.py'),
                                                'ragas_experimental.exceptions.DuplicateDatasetError': ( 'exceptions.html#duplicatedataseterror',
                                                                                                         'ragas_experimental/exceptions.py'),
@@ -309,6 +541,54 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'ragas_experimental/llm/llm.py'),
                                             'ragas_experimental.llm.llm.ragas_llm': ( 'llm/llm.html#ragas_llm',
                                                                                       'ragas_experimental/llm/llm.py')},
+            'ragas_experimental.llm.quota': { 'ragas_experimental.llm.quota.ModelQuota': ( 'llm/quota.html#modelquota',
+                                                                                           'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota.__init__': ( 'llm/quota.html#modelquota.__init__',
+                                                                                                    'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota._cancel': ( 'llm/quota.html#modelquota._cancel',
+                                                                                                   'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota._delay': ( 'llm/quota.html#modelquota._delay',
+                                                                                                  'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota._dispatch': ( 'llm/quota.html#modelquota._dispatch',
+                                                                                                     'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota._enqueue': ( 'llm/quota.html#modelquota._enqueue',
+                                                                                                    'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota._redispatch': ( 'llm/quota.html#modelquota._redispatch',
+                                                                                                       'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota._refill': ( 'llm/quota.html#modelquota._refill',
+                                                                                                   'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota.acquire': ( 'llm/quota.html#modelquota.acquire',
+                                                                                                   'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota.acquire_sync': ( 'llm/quota.html#modelquota.acquire_sync',
+                                                                                                        'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota.reconcile': ( 'llm/quota.html#modelquota.reconcile',
+                                                                                                     'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.ModelQuota.release': ( 'llm/quota.html#modelquota.release',
+                                                                                                   'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.QuotaScheduler': ( 'llm/quota.html#quotascheduler',
+                                                                                               'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.QuotaScheduler.__init__': ( 'llm/quota.html#quotascheduler.__init__',
+                                                                                                        'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.QuotaScheduler.clear': ( 'llm/quota.html#quotascheduler.clear',
+                                                                                                     'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.QuotaScheduler.get': ( 'llm/quota.html#quotascheduler.get',
+                                                                                                   'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.QuotaScheduler.remove': ( 'llm/quota.html#quotascheduler.remove',
+                                                                                                      'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.QuotaScheduler.set_limits': ( 'llm/quota.html#quotascheduler.set_limits',
+                                                                                                          'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota._Waiter': ( 'llm/quota.html#_waiter',
+                                                                                        'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota._Waiter.__init__': ( 'llm/quota.html#_waiter.__init__',
+                                                                                                 'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota._resolve': ( 'llm/quota.html#_resolve',
+                                                                                         'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.estimate_tokens': ( 'llm/quota.html#estimate_tokens',
+                                                                                                'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.quota_tenant': ( 'llm/quota.html#quota_tenant',
+                                                                                             'ragas_experimental/llm/quota.py'),
+                                              'ragas_experimental.llm.quota.usage_tokens': ( 'llm/quota.html#usage_tokens',
+                                                                                             'ragas_experimental/llm/quota.py')},
             'ragas_experimental.metric.base': { 'ragas_experimental.metric.base.Metric': ( 'metric/base.html#metric',
                                                                                            'ragas_experimental/metric/base.py'),
                                                 'ragas_experimental.metric.base.Metric.__post_init__': ( 'metric/base.html#metric.__post_init__',
@@ -539,8 +819,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                  'ragas_experimental/model/notion_typing.py')},
             'ragas_experimental.model.pydantic_model': { 'ragas_experimental.model.pydantic_model.ExtendedPydanticBaseModel': ( 'model/pydantic_mode.html#extendedpydanticbasemodel',
                                                                                                                                 'ragas_experimental/model/pydantic_model.py'),
-                                                         'ragas_experimental.model.pydantic_model.ExtendedPydanticBaseModel.__init__': ( 'model/pydantic_mode.html#extendedpydanticbasemodel.__init__',
-                                                                                                                                         'ragas_experimental/model/pydantic_model.py'),
+                                                         'ragas_experimental.model.pydantic_model.ExtendedPydanticBaseModel.__pydantic_init_subclass__': ( 'model/pydantic_mode.html#extendedpydanticbasemodel.__pydantic_init_subclass__',
+                                                                                                                                                           'ragas_experimental/model/pydantic_model.py'),
                                                          'ragas_experimental.model.pydantic_model.ExtendedPydanticBaseModel._initialize_column_mapping': ( 'model/pydantic_mode.html#extendedpydanticbasemodel._initialize_column_mapping',
                                                                                                                                                            'ragas_experimental/model/pydantic_model.py'),
                                                          'ragas_experimental.model.pydantic_model.ExtendedPydanticBaseModel._is_metric_result_field': ( 'model/pydantic_mode.html#extendedpydanticbasemodel._is_metric_result_field',
@@ -563,6 +843,118 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'ragas_experimental/project.py'),
                                             'ragas_experimental.project.Project.get_experiment': ( 'project/experiments.html#project.get_experiment',
                                                                                                    'ragas_experimental/project.py')},
+            'ragas_experimental.project.benchmark': { 'ragas_experimental.project.benchmark.BenchmarkResult': ( 'project/benchmark.html#benchmarkresult',
+                                                                                                                'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.BenchmarkResult.to_dict': ( 'project/benchmark.html#benchmarkresult.to_dict',
+                                                                                                                        'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.FakeLLM': ( 'project/benchmark.html#fakellm',
+                                                                                                        'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.FakeLLM.__init__': ( 'project/benchmark.html#fakellm.__init__',
+                                                                                                                 'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.FakeLLM._draw': ( 'project/benchmark.html#fakellm._draw',
+                                                                                                              'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.FakeLLM._respond': ( 'project/benchmark.html#fakellm._respond',
+                                                                                                                 'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.FakeLLM.agenerate': ( 'project/benchmark.html#fakellm.agenerate',
+                                                                                                                  'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.FakeLLM.generate': ( 'project/benchmark.html#fakellm.generate',
+                                                                                                                 'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.LoopLagMonitor': ( 'project/benchmark.html#looplagmonitor',
+                                                                                                               'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.LoopLagMonitor.__init__': ( 'project/benchmark.html#looplagmonitor.__init__',
+                                                                                                                        'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.LoopLagMonitor._watch': ( 'project/benchmark.html#looplagmonitor._watch',
+                                                                                                                      'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.LoopLagMonitor.quantile': ( 'project/benchmark.html#looplagmonitor.quantile',
+                                                                                                                        'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.LoopLagMonitor.start': ( 'project/benchmark.html#looplagmonitor.start',
+                                                                                                                     'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.LoopLagMonitor.stop': ( 'project/benchmark.html#looplagmonitor.stop',
+                                                                                                                    'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark._Answer': ( 'project/benchmark.html#_answer',
+                                                                                                        'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark._Question': ( 'project/benchmark.html#_question',
+                                                                                                          'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark._Reply': ( 'project/benchmark.html#_reply',
+                                                                                                       'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark._benchmark_once': ( 'project/benchmark.html#_benchmark_once',
+                                                                                                                'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.find_regressions': ( 'project/benchmark.html#find_regressions',
+                                                                                                                 'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.fixed_latency': ( 'project/benchmark.html#fixed_latency',
+                                                                                                              'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.lognormal_latency': ( 'project/benchmark.html#lognormal_latency',
+                                                                                                                  'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.run_benchmark': ( 'project/benchmark.html#run_benchmark',
+                                                                                                              'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.save_benchmark': ( 'project/benchmark.html#save_benchmark',
+                                                                                                               'ragas_experimental/project/benchmark.py'),
+                                                      'ragas_experimental.project.benchmark.uniform_latency': ( 'project/benchmark.html#uniform_latency',
+                                                                                                                'ragas_experimental/project/benchmark.py')},
+            'ragas_experimental.project.cache': { 'ragas_experimental.project.cache.ResultCache': ( 'project/cache.html#resultcache',
+                                                                                                    'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.__init__': ( 'project/cache.html#resultcache.__init__',
+                                                                                                             'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.__len__': ( 'project/cache.html#resultcache.__len__',
+                                                                                                            'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache._delete': ( 'project/cache.html#resultcache._delete',
+                                                                                                            'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache._evict': ( 'project/cache.html#resultcache._evict',
+                                                                                                           'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache._total_size': ( 'project/cache.html#resultcache._total_size',
+                                                                                                                'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.acall': ( 'project/cache.html#resultcache.acall',
+                                                                                                          'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.amap': ( 'project/cache.html#resultcache.amap',
+                                                                                                         'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.clear': ( 'project/cache.html#resultcache.clear',
+                                                                                                          'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.close': ( 'project/cache.html#resultcache.close',
+                                                                                                          'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.get': ( 'project/cache.html#resultcache.get',
+                                                                                                        'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.ResultCache.put': ( 'project/cache.html#resultcache.put',
+                                                                                                        'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache._fingerprint_value': ( 'project/cache.html#_fingerprint_value',
+                                                                                                           'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache._function_parts': ( 'project/cache.html#_function_parts',
+                                                                                                        'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache._global_names': ( 'project/cache.html#_global_names',
+                                                                                                      'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.cache_key': ( 'project/cache.html#cache_key',
+                                                                                                  'ragas_experimental/project/cache.py'),
+                                                  'ragas_experimental.project.cache.function_fingerprint': ( 'project/cache.html#function_fingerprint',
+                                                                                                             'ragas_experimental/project/cache.py')},
+            'ragas_experimental.project.checkpoint': { 'ragas_experimental.project.checkpoint.RunJournal': ( 'project/checkpoint.html#runjournal',
+                                                                                                             'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.__init__': ( 'project/checkpoint.html#runjournal.__init__',
+                                                                                                                      'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal._replay': ( 'project/checkpoint.html#runjournal._replay',
+                                                                                                                     'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal._write': ( 'project/checkpoint.html#runjournal._write',
+                                                                                                                    'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.aentries_to_upload': ( 'project/checkpoint.html#runjournal.aentries_to_upload',
+                                                                                                                                'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.close': ( 'project/checkpoint.html#runjournal.close',
+                                                                                                                   'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.create': ( 'project/checkpoint.html#runjournal.create',
+                                                                                                                    'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.finished': ( 'project/checkpoint.html#runjournal.finished',
+                                                                                                                      'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.open': ( 'project/checkpoint.html#runjournal.open',
+                                                                                                                  'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.record_result': ( 'project/checkpoint.html#runjournal.record_result',
+                                                                                                                           'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.record_uploaded': ( 'project/checkpoint.html#runjournal.record_uploaded',
+                                                                                                                             'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.RunJournal.remove': ( 'project/checkpoint.html#runjournal.remove',
+                                                                                                                    'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.checkpoint_path': ( 'project/checkpoint.html#checkpoint_path',
+                                                                                                                  'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.input_row_ids': ( 'project/checkpoint.html#input_row_ids',
+                                                                                                                'ragas_experimental/project/checkpoint.py'),
+                                                       'ragas_experimental.project.checkpoint.item_key': ( 'project/checkpoint.html#item_key',
+                                                                                                           'ragas_experimental/project/checkpoint.py')},
             'ragas_experimental.project.comparison': { 'ragas_experimental.project.comparison.Project.compare_experiments': ( 'project/comparison.html#project.compare_experiments',
                                                                                                                               'ragas_experimental/project/comparison.py'),
                                                        'ragas_experimental.project.comparison._combine_experiments': ( 'project/comparison.html#_combine_experiments',
@@ -591,14 +983,22 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'ragas_experimental/project/core.py'),
                                                  'ragas_experimental.project.core.Project.get_dataset_by_id': ( 'project/core.html#project.get_dataset_by_id',
                                                                                                                 'ragas_experimental/project/core.py'),
+                                                 'ragas_experimental.project.core.Project.import_dataset': ( 'project/core.html#project.import_dataset',
+                                                                                                             'ragas_experimental/project/core.py'),
                                                  'ragas_experimental.project.core.create_dataset_columns': ( 'project/core.html#create_dataset_columns',
                                                                                                              'ragas_experimental/project/core.py')},
             'ragas_experimental.project.experiments': { 'ragas_experimental.project.experiments.ExperimentProtocol': ( 'project/experiments.html#experimentprotocol',
                                                                                                                        'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.ExperimentProtocol.__call__': ( 'project/experiments.html#experimentprotocol.__call__',
                                                                                                                                 'ragas_experimental/project/experiments.py'),
+                                                        'ragas_experimental.project.experiments.ExperimentProtocol.publish_async': ( 'project/experiments.html#experimentprotocol.publish_async',
+                                                                                                                                     'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.ExperimentProtocol.run_async': ( 'project/experiments.html#experimentprotocol.run_async',
                                                                                                                                  'ragas_experimental/project/experiments.py'),
+                                                        'ragas_experimental.project.experiments.ExperimentProtocol.run_sweep': ( 'project/experiments.html#experimentprotocol.run_sweep',
+                                                                                                                                 'ragas_experimental/project/experiments.py'),
+                                                        'ragas_experimental.project.experiments.ExperimentProtocol.work_async': ( 'project/experiments.html#experimentprotocol.work_async',
+                                                                                                                                  'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.Project.compare_and_plot': ( 'project/experiments.html#project.compare_and_plot',
                                                                                                                              'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.Project.create_experiment': ( 'project/experiments.html#project.create_experiment',
@@ -611,14 +1011,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                  'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.Project.langfuse_experiment': ( 'project/experiments.html#project.langfuse_experiment',
                                                                                                                                 'ragas_experimental/project/experiments.py'),
+                                                        'ragas_experimental.project.experiments.Project.merge_experiments': ( 'project/experiments.html#project.merge_experiments',
+                                                                                                                              'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.Project.mlflow_experiment': ( 'project/experiments.html#project.mlflow_experiment',
                                                                                                                               'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.cleanup_experiment_branches': ( 'project/experiments.html#cleanup_experiment_branches',
                                                                                                                                 'ragas_experimental/project/experiments.py'),
+                                                        'ragas_experimental.project.experiments.cleanup_experiment_snapshots': ( 'project/experiments.html#cleanup_experiment_snapshots',
+                                                                                                                                 'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.create_experiment_columns': ( 'project/experiments.html#create_experiment_columns',
                                                                                                                               'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.find_git_root': ( 'project/experiments.html#find_git_root',
                                                                                                                   'ragas_experimental/project/experiments.py'),
+                                                        'ragas_experimental.project.experiments.snapshot_experiment': ( 'project/experiments.html#snapshot_experiment',
+                                                                                                                        'ragas_experimental/project/experiments.py'),
                                                         'ragas_experimental.project.experiments.version_experiment': ( 'project/experiments.html#version_experiment',
                                                                                                                        'ragas_experimental/project/experiments.py')},
             'ragas_experimental.project.naming': { 'ragas_experimental.project.naming.MemorableNames': ( 'project/naming.html#memorablenames',
@@ -631,6 +1037,98 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                               'ragas_experimental/project/naming.py'),
                                                    'ragas_experimental.project.naming.MemorableNames.generate_unique_names': ( 'project/naming.html#memorablenames.generate_unique_names',
                                                                                                                                'ragas_experimental/project/naming.py')},
+            'ragas_experimental.project.scheduler': { 'ragas_experimental.project.scheduler.FunctionRef': ( 'project/scheduler.html#functionref',
+                                                                                                            'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.FunctionRef.of': ( 'project/scheduler.html#functionref.of',
+                                                                                                               'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.FunctionRef.resolve': ( 'project/scheduler.html#functionref.resolve',
+                                                                                                                    'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.LatencyTracker': ( 'project/scheduler.html#latencytracker',
+                                                                                                               'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.LatencyTracker.__init__': ( 'project/scheduler.html#latencytracker.__init__',
+                                                                                                                        'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.LatencyTracker.quantile': ( 'project/scheduler.html#latencytracker.quantile',
+                                                                                                                        'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.LatencyTracker.record': ( 'project/scheduler.html#latencytracker.record',
+                                                                                                                      'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.RateLimiter': ( 'project/scheduler.html#ratelimiter',
+                                                                                                            'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.RateLimiter.__init__': ( 'project/scheduler.html#ratelimiter.__init__',
+                                                                                                                     'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.RateLimiter._refill': ( 'project/scheduler.html#ratelimiter._refill',
+                                                                                                                    'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.RateLimiter.acquire': ( 'project/scheduler.html#ratelimiter.acquire',
+                                                                                                                    'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler._Failure': ( 'project/scheduler.html#_failure',
+                                                                                                         'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler._chunked': ( 'project/scheduler.html#_chunked',
+                                                                                                         'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler._gather_chunk': ( 'project/scheduler.html#_gather_chunk',
+                                                                                                              'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler._init_worker': ( 'project/scheduler.html#_init_worker',
+                                                                                                             'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler._run_chunk': ( 'project/scheduler.html#_run_chunk',
+                                                                                                           'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.guarded': ( 'project/scheduler.html#guarded',
+                                                                                                        'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.map_bounded': ( 'project/scheduler.html#map_bounded',
+                                                                                                            'ragas_experimental/project/scheduler.py'),
+                                                      'ragas_experimental.project.scheduler.map_in_processes': ( 'project/scheduler.html#map_in_processes',
+                                                                                                                 'ragas_experimental/project/scheduler.py')},
+            'ragas_experimental.project.telemetry': { 'ragas_experimental.project.telemetry.RunStats': ( 'project/telemetry.html#runstats',
+                                                                                                         'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunStats.to_dict': ( 'project/telemetry.html#runstats.to_dict',
+                                                                                                                 'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry': ( 'project/telemetry.html#runtelemetry',
+                                                                                                             'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.__init__': ( 'project/telemetry.html#runtelemetry.__init__',
+                                                                                                                      'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry._report_periodically': ( 'project/telemetry.html#runtelemetry._report_periodically',
+                                                                                                                                  'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.item_completed': ( 'project/telemetry.html#runtelemetry.item_completed',
+                                                                                                                            'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.report': ( 'project/telemetry.html#runtelemetry.report',
+                                                                                                                    'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.result_ready': ( 'project/telemetry.html#runtelemetry.result_ready',
+                                                                                                                          'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.result_uploaded': ( 'project/telemetry.html#runtelemetry.result_uploaded',
+                                                                                                                             'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.retried': ( 'project/telemetry.html#runtelemetry.retried',
+                                                                                                                     'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.snapshot': ( 'project/telemetry.html#runtelemetry.snapshot',
+                                                                                                                      'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.start': ( 'project/telemetry.html#runtelemetry.start',
+                                                                                                                   'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.stop': ( 'project/telemetry.html#runtelemetry.stop',
+                                                                                                                  'ragas_experimental/project/telemetry.py'),
+                                                      'ragas_experimental.project.telemetry.RunTelemetry.timed': ( 'project/telemetry.html#runtelemetry.timed',
+                                                                                                                   'ragas_experimental/project/telemetry.py')},
+            'ragas_experimental.project.work_queue': { 'ragas_experimental.project.work_queue.Lease': ( 'project/work_queue.html#lease',
+                                                                                                        'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue': ( 'project/work_queue.html#workqueue',
+                                                                                                            'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.__init__': ( 'project/work_queue.html#workqueue.__init__',
+                                                                                                                     'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue._transaction': ( 'project/work_queue.html#workqueue._transaction',
+                                                                                                                         'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.close': ( 'project/work_queue.html#workqueue.close',
+                                                                                                                  'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.complete': ( 'project/work_queue.html#workqueue.complete',
+                                                                                                                     'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.experiment_id': ( 'project/work_queue.html#workqueue.experiment_id',
+                                                                                                                          'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.fail': ( 'project/work_queue.html#workqueue.fail',
+                                                                                                                 'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.heartbeat': ( 'project/work_queue.html#workqueue.heartbeat',
+                                                                                                                      'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.lease': ( 'project/work_queue.html#workqueue.lease',
+                                                                                                                  'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.publish': ( 'project/work_queue.html#workqueue.publish',
+                                                                                                                    'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.WorkQueue.status': ( 'project/work_queue.html#workqueue.status',
+                                                                                                                   'ragas_experimental/project/work_queue.py'),
+                                                       'ragas_experimental.project.work_queue.default_worker_id': ( 'project/work_queue.html#default_worker_id',
+                                                                                                                    'ragas_experimental/project/work_queue.py')},
             'ragas_experimental.prompt.base': { 'ragas_experimental.prompt.base.Prompt': ( 'prompt/base.html#prompt',
                                                                                            'ragas_experimental/prompt/base.py'),
                                                 'ragas_experimental.prompt.base.Prompt.__init__': ( 'prompt/base.html#prompt.__init__',
@@ -743,6 +1241,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'ragas_experimental/typing.py')},
             'ragas_experimental.utils': { 'ragas_experimental.utils.async_to_sync': ( 'utils.html#async_to_sync',
                                                                                       'ragas_experimental/utils.py'),
+                                          'ragas_experimental.utils.content_hash': ( 'utils.html#content_hash',
+                                                                                     'ragas_experimental/utils.py'),
                                           'ragas_experimental.utils.create_nano_id': ( 'utils.html#create_nano_id',
                                                                                        'ragas_experimental/utils.py'),
                                           'ragas_experimental.utils.plot_experiments_as_subplots': ( 'utils.html#plot_experiments_as_subplots',
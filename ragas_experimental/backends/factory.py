@@ -42,3 +42,19 @@ class RagasApiClientFactory:
             base_url = "https://api.dev.app.ragas.io"
 
         return RagasApiClient(app_token=app_token, base_url=base_url)
+
+    @staticmethod
+    def create_mock(server: t.Optional["MockRagasServer"] = None) -> RagasApiClient:
+        """Create a Ragas API client backed by an in-memory mock server.
+
+        Args:
+            server: The mock server to use, a new empty one by default
+
+        Returns:
+            RagasApiClient: A Ragas API client instance
+        """
+        from ragas_experimental.backends.mock_server import MockRagasServer
+
+        if server is None:
+            server = MockRagasServer()
+        return server.client()
@@ -0,0 +1,167 @@
+"""An in-memory stand-in for the Ragas API, for tests, examples and benchmarks."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/backends/mock_server.ipynb.
+
+# %% auto 0
+__all__ = ['MockRagasServer']
+
+# %% ../../nbs/backends/mock_server.ipynb 3
+import asyncio
+import json
+import typing as t
+from datetime import datetime, timezone
+
+import httpx
+
+from .ragas_api_client import RagasApiClient, create_nano_id
+
+# %% ../../nbs/backends/mock_server.ipynb 5
+class _Conflict(Exception):
+    """A resource with the requested id already exists."""
+
+
+class MockRagasServer:
+    """In-memory implementation of the Ragas API routes used by `RagasApiClient`.
+
+    Attributes:
+        latency: Seconds to wait before answering each request
+        requests: Method and path of every request received
+        bytes_sent: Total size of the response bodies sent
+    """
+
+    API_PREFIX = "/api/v1/"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests: t.List[t.Tuple[str, str]] = []
+        self.bytes_sent = 0
+        # collection path -> resource id -> resource
+        self._collections: t.Dict[str, t.Dict[str, t.Dict]] = {}
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        """An httpx transport that sends requests to this server."""
+        return httpx.MockTransport(self.handle)
+
+    def client(self, app_token: str = "mock-token") -> RagasApiClient:
+        """Create an API client that talks to this server."""
+        return RagasApiClient(
+            base_url="http://ragas.mock", app_token=app_token, transport=self.transport
+        )
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request in the envelope used by the API."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        path = request.url.path[len(self.API_PREFIX) :].strip("/")
+        self.requests.append((request.method, path))
+
+        body = json.loads(request.content) if request.content else {}
+        try:
+            payload = {
+                "status": "success",
+                "data": self._route(
+                    request.method, path, dict(request.url.params), body
+                ),
+            }
+            status_code = 200
+        except KeyError:
+            payload = {"status": "error", "message": f"Not found: {path}"}
+            status_code = 404
+        except _Conflict as e:
+            payload = {"status": "error", "message": f"Already exists: {path}/{e}"}
+            status_code = 409
+
+        content = json.dumps(payload).encode()
+        self.bytes_sent += len(content)
+        return httpx.Response(
+            status_code, content=content, headers={"Content-Type": "application/json"}
+        )
+
+    def _collection_key(self, segments: t.List[str]) -> str:
+        """Storage key of a collection, with experiment children stored as dataset ones."""
+        if len(segments) > 3 and segments[2] == "experiments":
+            segments = segments[:2] + ["datasets"] + segments[3:]
+        return "/".join(segments)
+
+    def _exists(self, segments: t.List[str]) -> bool:
+        """Whether the resource at `segments` exists."""
+        collection = self._collections.get(self._collection_key(segments[:-1]), {})
+        if segments[-1] in collection:
+            return True
+        # experiments and datasets share ids for their columns and rows
+        if len(segments) == 4 and segments[2] in ("datasets", "experiments"):
+            other = "experiments" if segments[2] == "datasets" else "datasets"
+            return segments[-1] in self._collections.get(
+                "/".join(segments[:2] + [other]), {}
+            )
+        return False
+
+    def _route(self, method: str, path: str, params: t.Dict, body: t.Dict) -> t.Any:
+        segments = path.split("/")
+        parent = segments[:-1] if len(segments) % 2 else segments[:-2]
+        if parent and not self._exists(parent):
+            raise KeyError(path)
+
+        if len(segments) % 2:
+            collection = self._collections.setdefault(
+                self._collection_key(segments), {}
+            )
+            if method == "GET":
+                return self._list(collection, params, is_rows=segments[-1] == "rows")
+            if method == "POST":
+                if segments[-1] in ("projects", "datasets", "experiments"):
+                    body = {"description": None, **body}
+                return self._create(collection, body)
+        else:
+            collection = self._collections.get(self._collection_key(segments[:-1]), {})
+            resource = collection[segments[-1]]
+            if method == "GET":
+                return resource
+            if method == "PATCH":
+                resource.update(body)
+                resource["updated_at"] = datetime.now(timezone.utc).isoformat()
+                return resource
+            if method == "DELETE":
+                del collection[segments[-1]]
+                prefix = self._collection_key(segments) + "/"
+                for key in [k for k in self._collections if k.startswith(prefix)]:
+                    del self._collections[key]
+                return None
+        raise KeyError(path)
+
+    def _list(
+        self, collection: t.Dict[str, t.Dict], params: t.Dict, is_rows: bool
+    ) -> t.Dict:
+        items = list(collection.values())
+        if "ids" in params:
+            ids = set(params["ids"].split(","))
+            items = [item for item in items if item["id"] in ids]
+        if "order_by" in params:
+            items.sort(
+                key=lambda item: str(item.get(params["order_by"], "")),
+                reverse=params.get("sort_dir") == "desc",
+            )
+        total = len(items)
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 50))
+        items = items[offset : offset + limit]
+        if is_rows and params.get("fields"):
+            fields = set(params["fields"].split(","))
+            items = [
+                {**row, "data": {k: v for k, v in row["data"].items() if k in fields}}
+                for row in items
+            ]
+        return {"items": items, "total": total}
+
+    def _create(self, collection: t.Dict[str, t.Dict], body: t.Dict) -> t.Dict:
+        if body.get("id") in collection:
+            raise _Conflict(body["id"])
+        now = datetime.now(timezone.utc).isoformat()
+        resource = {
+            "id": create_nano_id(),
+            **body,
+            "created_at": now,
+            "updated_at": now,
+        }
+        collection[resource["id"]] = resource
+        return resource
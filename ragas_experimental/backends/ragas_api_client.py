@@ -8,6 +8,7 @@ __all__ = ['DEFAULT_SETTINGS', 'RagasApiClient', 'create_nano_id', 'Column', 'Ro
 # %% ../../nbs/backends/ragas_api_client.ipynb 3
 import httpx
 import asyncio
+import threading
 import typing as t
 from pydantic import BaseModel, Field
 from fastcore.utils import patch
@@ -20,24 +21,71 @@ from ragas_experimental.exceptions import (
     DuplicateProjectError,
     ExperimentNotFoundError,
     DuplicateExperimentError,
+    ApiError,
+    ApiNotFoundError,
+    ApiConflictError,
 )
 
 # %% ../../nbs/backends/ragas_api_client.ipynb 5
+async def _close_on_shutdown(client: httpx.AsyncClient) -> t.AsyncGenerator[None, None]:
+    """Close `client` when this generator is closed.
+
+    The event loop keeps track of the async generators started on it, and
+    `asyncio.run` closes those still open before it closes the loop.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
 class RagasApiClient:
     """Client for the Ragas Relay API."""
 
-    def __init__(self, base_url: str, app_token: t.Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        app_token: t.Optional[str] = None,
+        transport: t.Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """Initialize the Ragas API client.
 
         Args:
             base_url: Base URL for the API (e.g., "http://localhost:8087")
             app_token: API token for authentication
+            transport: httpx transport to send requests with, e.g. a mock server
         """
         if not app_token:
             raise ValueError("app_token must be provided")
 
         self.base_url = f"{base_url.rstrip('/')}/api/v1"
         self.app_token = app_token
+        self._transport = transport
+        self._local = threading.local()
+
+    async def _aget_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop.
+
+        An httpx client is bound to the event loop it is first used on, so every
+        thread keeps one client for its current loop and replaces it when the loop
+        changes (as it does for each call made through `async_to_sync`). Requests
+        made from the same loop share one connection pool, and the client is
+        closed when `asyncio.run` shuts the loop down.
+        """
+        loop = asyncio.get_running_loop()
+        local = self._local
+        if getattr(local, "loop", None) is not loop or local.client.is_closed:
+            local.loop = loop
+            local.client = httpx.AsyncClient(transport=self._transport)
+            local.closer = _close_on_shutdown(local.client)
+            await local.closer.asend(None)
+        return local.client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client of the running event loop."""
+        closer = getattr(self._local, "closer", None)
+        if closer is not None and self._local.loop is asyncio.get_running_loop():
+            await closer.aclose()
 
     async def _request(
         self,
@@ -60,18 +108,21 @@ class RagasApiClient:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         headers = {"X-App-Token": self.app_token}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method, url=url, params=params, json=json_data, headers=headers
-            )
+        client = await self._aget_http_client()
+        response = await client.request(
+            method=method, url=url, params=params, json=json_data, headers=headers
+        )
 
-            data = response.json()
+        data = response.json()
 
-            if response.status_code >= 400 or data.get("status") == "error":
-                error_msg = data.get("message", "Unknown error")
-                raise Exception(f"API Error ({response.status_code}): {error_msg}")
+        if response.status_code >= 400 or data.get("status") == "error":
+            error_msg = data.get("message", "Unknown error")
+            error_type = {404: ApiNotFoundError, 409: ApiConflictError}.get(
+                response.status_code, ApiError
+            )
+            raise error_type(response.status_code, error_msg)
 
-            return data.get("data")
+        return data.get("data")
 
     # ---- Resource Handlers ----
     async def _create_resource(self, path, data):
@@ -557,13 +608,19 @@ async def list_dataset_rows(
     offset: int = 0,
     order_by: t.Optional[str] = None,
     sort_dir: t.Optional[str] = None,
+    fields: t.Optional[t.List[str]] = None,
 ) -> t.Dict:
-    """List rows in a dataset."""
+    """List rows in a dataset.
+
+    Pass the ids of some columns as `fields` to only get the data of those columns.
+    """
     params = {"limit": limit, "offset": offset}
     if order_by:
         params["order_by"] = order_by
     if sort_dir:
         params["sort_dir"] = sort_dir
+    if fields:
+        params["fields"] = ",".join(fields)
     return await self._list_resources(
         f"projects/{project_id}/datasets/{dataset_id}/rows", **params
     )
@@ -894,13 +951,19 @@ async def list_experiment_rows(
     offset: int = 0,
     order_by: t.Optional[str] = None,
     sort_dir: t.Optional[str] = None,
+    fields: t.Optional[t.List[str]] = None,
 ) -> t.Dict:
-    """List rows in an experiment."""
+    """List rows in an experiment.
+
+    Pass the ids of some columns as `fields` to only get the data of those columns.
+    """
     params = {"limit": limit, "offset": offset}
     if order_by:
         params["order_by"] = order_by
     if sort_dir:
         params["sort_dir"] = sort_dir
+    if fields:
+        params["fields"] = ",".join(fields)
     return await self._list_resources(
         f"projects/{project_id}/experiments/{experiment_id}/rows", **params
     )
@@ -3,10 +3,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/dataset.ipynb.
 
 # %% auto 0
-__all__ = ['BaseModelType', 'Dataset']
+__all__ = ['column_mapping_registry', 'row_identity_map', 'BaseModelType', 'DEFAULT_PAGE_SIZE', 'DATASET_FORMATS',
+           'ColumnMappingRegistry', 'RowIdentityMap', 'Dataset', 'BackgroundAppender', 'infer_format', 'RecordWriter',
+           'iter_records']
 
 # %% ../nbs/dataset.ipynb 3
 import typing as t
+import asyncio
+import threading
+import weakref
+from collections.abc import Sequence
 
 from fastcore.utils import patch
 import pandas as pd
@@ -14,13 +20,199 @@ import pandas as pd
 from ragas_experimental.model.pydantic_model import (
     ExtendedPydanticBaseModel as BaseModel,
 )
-from .utils import create_nano_id, async_to_sync
+from .utils import create_nano_id, async_to_sync, content_hash
 from .backends.ragas_api_client import RagasApiClient
+from .exceptions import ApiNotFoundError
 
 # %% ../nbs/dataset.ipynb 4
+class ColumnMappingRegistry:
+    """Process-wide cache of the column mappings of datasets and experiments.
+
+    A column mapping maps the fields of a model to the ids of the backend columns
+    that store them. Mappings are keyed by `(model, project_id, dataset_id)`, so
+    datasets that share a model class never overwrite each other, and each one is
+    fetched from the backend only once. Concurrent lookups of the same key wait
+    for a single fetch instead of issuing their own.
+    """
+
+    def __init__(self):
+        self._mappings: t.Dict[t.Tuple, t.Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: t.Dict[t.Tuple, threading.Lock] = {}
+        self._pending: t.Dict[t.Tuple, asyncio.Task] = {}
+
+    @staticmethod
+    def _build(
+        model: t.Type[BaseModel], column_id_map: t.Dict[str, str]
+    ) -> t.Dict[str, str]:
+        """Overlay the column ids from the backend on the model's default mapping."""
+        return {**model.__column_mapping__, **column_id_map}
+
+    def get(
+        self,
+        model: t.Type[BaseModel],
+        project_id: str,
+        dataset_id: str,
+        fetch: t.Callable[[], t.Dict[str, str]],
+    ) -> t.Dict[str, str]:
+        """Get the column mapping for a dataset, calling `fetch` on a cache miss.
+
+        `fetch` should return a map of column name to column id from the backend.
+        The returned mapping is shared and must not be mutated.
+        """
+        key = (model, project_id, dataset_id)
+        mapping = self._mappings.get(key)
+        if mapping is not None:
+            return mapping
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            mapping = self._mappings.get(key)
+            if mapping is None:
+                mapping = self._build(model, fetch())
+                self._mappings[key] = mapping
+        return mapping
+
+    async def aget(
+        self,
+        model: t.Type[BaseModel],
+        project_id: str,
+        dataset_id: str,
+        fetch: t.Callable[[], t.Awaitable[t.Dict[str, str]]],
+    ) -> t.Dict[str, str]:
+        """Async version of `get`; concurrent lookups on a loop share one fetch."""
+        key = (model, project_id, dataset_id)
+        mapping = self._mappings.get(key)
+        if mapping is not None:
+            return mapping
+
+        async def _fetch_and_store():
+            column_id_map = await fetch()
+            with self._lock:
+                return self._mappings.setdefault(key, self._build(model, column_id_map))
+
+        loop = asyncio.get_running_loop()
+        pending_key = (key, loop)
+        with self._lock:
+            task = self._pending.get(pending_key)
+            if task is None:
+                task = loop.create_task(_fetch_and_store())
+                self._pending[pending_key] = task
+                task.add_done_callback(lambda _: self._pending.pop(pending_key, None))
+        # shield the shared fetch from the cancellation of a single caller
+        return await asyncio.shield(task)
+
+    def invalidate(
+        self,
+        model: t.Optional[t.Type[BaseModel]] = None,
+        project_id: t.Optional[str] = None,
+        dataset_id: t.Optional[str] = None,
+    ) -> None:
+        """Drop cached mappings matching all of the given parts of the key."""
+        with self._lock:
+            for key in list(self._mappings):
+                if (
+                    (model is None or key[0] is model)
+                    and (project_id is None or key[1] == project_id)
+                    and (dataset_id is None or key[2] == dataset_id)
+                ):
+                    del self._mappings[key]
+
+
+column_mapping_registry = ColumnMappingRegistry()
+
+# %% ../nbs/dataset.ipynb 5
+class RowIdentityMap:
+    """Process-wide map of decoded rows, so that loading a row again reuses its instance.
+
+    Entries are held by weak reference, keyed by model, dataset id and row id,
+    together with a hash of the row content they were decoded from. When a row
+    is loaded again with the same content the live instance is returned, so only
+    new or changed rows are decoded. Off by default, turn it on with `enable()`.
+
+    Instances are shared between every dataset that loads the row, so an unsaved
+    change made through one is seen by the others.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # (model, dataset id, row id) -> (content hash, weak reference to entry)
+        self._items: t.Dict[t.Tuple, t.Tuple[str, weakref.ref]] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop reusing instances and forget every row."""
+        self.enabled = False
+        self._items.clear()
+
+    def get(
+        self, model: t.Type[BaseModel], dataset_id: str, row_id: str, row_hash: str
+    ) -> t.Optional[BaseModel]:
+        """Get the live instance of a row if it was decoded from the same content."""
+        item = self._items.get((model, dataset_id, row_id))
+        if item is None or item[0] != row_hash:
+            return None
+        return item[1]()
+
+    def put(
+        self,
+        model: t.Type[BaseModel],
+        dataset_id: str,
+        row_id: str,
+        row_hash: str,
+        entry: BaseModel,
+    ) -> None:
+        """Remember the instance decoded from a row with the given content hash."""
+        key = (model, dataset_id, row_id)
+
+        def _drop(ref):
+            # only drop the item if it was not replaced in the meantime
+            if self._items.get(key, (None, None))[1] is ref:
+                self._items.pop(key, None)
+
+        self._items[key] = (row_hash, weakref.ref(entry, _drop))
+
+    def __len__(self) -> int:
+        return sum(1 for _, ref in list(self._items.values()) if ref() is not None)
+
+
+row_identity_map = RowIdentityMap()
+
+# %% ../nbs/dataset.ipynb 6
 BaseModelType = t.TypeVar("BaseModelType", bound=BaseModel)
 
 
+class _EntriesView(Sequence):
+    """A read-only window onto a list of entries owned by another dataset."""
+
+    __slots__ = ("_source", "_indices")
+
+    def __init__(self, source: t.List, indices: t.Sequence[int]):
+        self._source = source
+        self._indices = indices
+
+    def select(self, key: t.Union[slice, t.Sequence[int]]) -> "_EntriesView":
+        """Narrow the window by a slice or by positions within the window."""
+        if isinstance(key, slice):
+            return _EntriesView(self._source, self._indices[key])
+        return _EntriesView(self._source, [self._indices[i] for i in key])
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.select(key)
+        return self._source[self._indices[key]]
+
+    def __iter__(self):
+        source = self._source
+        return (source[i] for i in self._indices)
+
+
 class Dataset(t.Generic[BaseModelType]):
     """A list-like interface for managing dataset entries with backend synchronization.
 
@@ -41,45 +233,82 @@ class Dataset(t.Generic[BaseModelType]):
         self.project_id = project_id
         self.dataset_id = dataset_id
         self._ragas_api_client = ragas_api_client
-        self._entries: t.List[BaseModelType] = []
+        self._entries: t.Union[t.List[BaseModelType], _EntriesView] = []
+        # set when a view shares `_entries`, so that we copy before mutating
+        self._entries_shared = False
 
-        # Initialize column mapping if it doesn't exist yet
-        if not hasattr(self.model, "__column_mapping__"):
-            self.model.__column_mapping__ = {}
+        # resolved lazily from the process-wide registry on first use
+        self._resolved_column_mapping: t.Optional[t.Dict[str, str]] = None
 
-        # Get column mappings from API and update the model's mapping
-        column_id_map = self._get_column_id_map(dataset_id=dataset_id)
+        # opt-in index of row content hash to row id, see `enable_dedupe`
+        self._dedupe_fields: t.Optional[t.Tuple[str, ...]] = None
+        self._dedupe_index: t.Optional[t.Dict[str, t.Union[str, asyncio.Future]]] = None
 
-        # Update the model's column mapping with the values from the API
-        for field_name, column_id in column_id_map.items():
-            self.model.__column_mapping__[field_name] = column_id
+    async def _aget_column_id_map(self: "Dataset", dataset_id: str) -> dict:
+        """Get a map of column name to column id"""
+        columns = await self._ragas_api_client.list_dataset_columns(
+            project_id=self.project_id, dataset_id=dataset_id
+        )
+        return {column["name"]: column["id"] for column in columns["items"]}
 
     def _get_column_id_map(self: "Dataset", dataset_id: str) -> dict:
         """Get a map of column name to column id"""
-        sync_func = async_to_sync(self._ragas_api_client.list_dataset_columns)
-        columns = sync_func(project_id=self.project_id, dataset_id=dataset_id)
-        column_id_map = {column["name"]: column["id"] for column in columns["items"]}
+        return async_to_sync(self._aget_column_id_map)(dataset_id=dataset_id)
 
-        # add the column id map to the model, selectively overwriting existing column mapping
-        for field in self.model.__column_mapping__.keys():
-            if field in column_id_map:
-                self.model.__column_mapping__[field] = column_id_map[field]
-        return column_id_map
+    @property
+    def _column_mapping(self) -> t.Dict[str, str]:
+        """Map of field name to column id, fetched once per process."""
+        if self._resolved_column_mapping is None:
+            self._resolved_column_mapping = column_mapping_registry.get(
+                self.model,
+                self.project_id,
+                self.dataset_id,
+                fetch=lambda: self._get_column_id_map(dataset_id=self.dataset_id),
+            )
+        return self._resolved_column_mapping
+
+    async def _aresolve_column_mapping(self) -> t.Dict[str, str]:
+        """Resolve the column mapping without blocking the event loop."""
+        if self._resolved_column_mapping is None:
+            self._resolved_column_mapping = await column_mapping_registry.aget(
+                self.model,
+                self.project_id,
+                self.dataset_id,
+                fetch=lambda: self._aget_column_id_map(dataset_id=self.dataset_id),
+            )
+        return self._resolved_column_mapping
+
+    def _mutable_entries(self) -> t.List[BaseModelType]:
+        """Get the entries for mutation, copying them first if a view shares them."""
+        if self._entries_shared or isinstance(self._entries, _EntriesView):
+            self._entries = list(self._entries)
+            self._entries_shared = False
+        return self._entries
+
+    def _view(self, key: t.Union[slice, t.Sequence[int]]) -> "Dataset[BaseModelType]":
+        """Create a dataset over some of the entries of this one.
+
+        The view shares the column mapping and the backing entries, so no request is
+        made and nothing is copied until either side is mutated.
+        """
+        if isinstance(self._entries, _EntriesView):
+            window = self._entries
+        else:
+            window = _EntriesView(self._entries, range(len(self._entries)))
+            self._entries_shared = True
+
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view._entries = window.select(key)
+        view._entries_shared = False
+        return view
 
     def __getitem__(
         self, key: t.Union[int, slice]
     ) -> t.Union[BaseModelType, "Dataset[BaseModelType]"]:
-        """Get an entry by index or slice."""
+        """Get an entry by index or a lightweight view of the dataset by slice."""
         if isinstance(key, slice):
-            new_dataset = type(self)(
-                name=self.name,
-                model=self.model,
-                project_id=self.project_id,
-                dataset_id=self.dataset_id,
-                ragas_api_client=self._ragas_api_client,
-            )
-            new_dataset._entries = self._entries[key]
-            return new_dataset
+            return self._view(key)
         else:
             return self._entries[key]
 
@@ -95,7 +324,7 @@ class Dataset(t.Generic[BaseModelType]):
         self.save(entry)
 
         # Update local cache
-        self._entries[index] = entry
+        self._mutable_entries()[index] = entry
 
     def __repr__(self) -> str:
         return (
@@ -108,42 +337,482 @@ class Dataset(t.Generic[BaseModelType]):
     def __iter__(self) -> t.Iterator[BaseModelType]:
         return iter(self._entries)
 
-# %% ../nbs/dataset.ipynb 16
-import ragas_experimental.typing as rt
+    def head(self, n: int = 5) -> "Dataset[BaseModelType]":
+        """Get a view of the first `n` entries."""
+        return self[:n]
 
 # %% ../nbs/dataset.ipynb 17
+import ragas_experimental.typing as rt
+
+# %% ../nbs/dataset.ipynb 18
+import functools
+
+from pydantic import TypeAdapter
+
+from .metric.result import MetricResult
+
+# number of rows requested per call when paging through the backend
+DEFAULT_PAGE_SIZE = 50
+
+# %% ../nbs/dataset.ipynb 19
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: t.Type[BaseModel]) -> TypeAdapter:
+    """Cached adapter that validates a whole page of rows of `model` in one call."""
+    return TypeAdapter(t.List[model])
+
+
+@functools.lru_cache(maxsize=None)
+def _field_adapter(model: t.Type[BaseModel], field_name: str) -> TypeAdapter:
+    """Cached adapter that validates a whole column of one field of `model`."""
+    return TypeAdapter(t.List[model.model_fields[field_name].rebuild_annotation()])
+
+
+@functools.lru_cache(maxsize=None)
+def _metric_result_fields(model: t.Type[BaseModel]) -> t.Tuple[str, ...]:
+    """Names of the fields of `model` that hold a `MetricResult`."""
+    return tuple(
+        field_name
+        for field_name, field_info in model.model_fields.items()
+        if model._is_metric_result_field(field_info.annotation)
+    )
+
+# %% ../nbs/dataset.ipynb 20
+@patch
+def _column_table(self: Dataset) -> t.Dict[str, str]:
+    """Get a map of column id to field name, the inverse of the column mapping."""
+    return {v: k for k, v in self._column_mapping.items()}
+
+
 @patch
-def append(self: Dataset, entry: BaseModelType) -> None:
-    """Add a new entry to the dataset and sync to Notion."""
-    # Create row inside the table
+def _projected_column_table(
+    self: Dataset, columns: t.Optional[t.Sequence[str]]
+) -> t.Dict[str, str]:
+    """Get the column table restricted to the columns of the given fields."""
+    column_mapping = self._column_mapping
+    if columns is None:
+        return self._column_table()
+    unknown = [column for column in columns if column not in column_mapping]
+    if unknown:
+        raise ValueError(f"Unknown columns for {self.model.__name__}: {unknown}")
+    return {column_mapping[column]: column for column in columns}
 
-    # first get the columns for the dataset
-    column_id_map = self.model.__column_mapping__
 
-    # create the rows
+@patch
+async def _aiter_row_pages(
+    self: Dataset,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    first_page: int = 0,
+    page_step: int = 1,
+    fields: t.Optional[t.List[str]] = None,
+) -> t.AsyncIterator[t.List[t.Dict]]:
+    """Yield the raw rows of the dataset from the backend, one page at a time.
+
+    With `page_step > 1` only every `page_step`-th page from `first_page` on is
+    fetched. With `fields`, a list of column ids, rows only hold those columns.
+    """
+    offset = first_page * page_size
+    while True:
+        response = await self._ragas_api_client.list_dataset_rows(
+            project_id=self.project_id,
+            dataset_id=self.dataset_id,
+            limit=page_size,
+            offset=offset,
+            fields=fields,
+        )
+        items = response.get("items", [])
+        if items:
+            yield items
+
+        # a short page means we have reached the end
+        if len(items) < page_size:
+            break
+        offset += page_size * page_step
+
+
+@patch
+def _rows_to_records(
+    self: Dataset, rows: t.List[t.Dict], column_table: t.Dict[str, str]
+) -> t.List[t.Dict]:
+    """Convert rows from the API data format to dicts keyed by field name."""
+    return [
+        {
+            column_table[col_id]: value
+            for col_id, value in row.get("data", {}).items()
+            if col_id in column_table
+        }
+        for row in rows
+    ]
+
+
+@patch
+def _records_to_entries(
+    self: Dataset,
+    records: t.List[t.Dict],
+    trusted: bool = False,
+    partial: bool = False,
+) -> t.List[BaseModelType]:
+    """Build model instances from dicts keyed by field name.
+
+    The whole batch is validated in a single call. With `trusted=True` validation
+    is skipped and entries are built with `model_construct`, which is only safe for
+    rows that were written by this library in the first place. With `partial=True`
+    records may lack fields; only the fields present are validated, a column at a
+    time, and the missing ones are left at their default or unset.
+    """
+    # metric results are stored as two columns, the value and the reason
+    for field_name in _metric_result_fields(self.model):
+        reason_field_name = f"{field_name}_reason"
+        for record in records:
+            if field_name in record:
+                record[field_name] = MetricResult(
+                    result=record[field_name],
+                    reason=record.pop(reason_field_name, None),
+                )
+
+    if partial and not trusted:
+        present = {name for record in records for name in record}
+        for field_name in present & self.model.model_fields.keys():
+            holders = [record for record in records if field_name in record]
+            values = _field_adapter(self.model, field_name).validate_python(
+                [record[field_name] for record in holders]
+            )
+            for record, value in zip(holders, values):
+                record[field_name] = value
+
+    if trusted or partial:
+        return [self.model.model_construct(**record) for record in records]
+    return _list_adapter(self.model).validate_python(records)
+
+
+@patch
+def _decode_rows(
+    self: Dataset,
+    rows: t.List[t.Dict],
+    column_table: t.Dict[str, str],
+    trusted: bool = False,
+    partial: bool = False,
+) -> t.List[BaseModelType]:
+    """Decode a page of rows from the backend into model instances.
+
+    With the row identity map enabled, rows whose content is unchanged since they
+    were last decoded reuse the live instance and only the others are decoded.
+    """
+    if not row_identity_map.enabled or partial:
+        return self._decode_new_rows(
+            rows, column_table, trusted=trusted, partial=partial
+        )
+
+    row_hashes = [content_hash(row.get("data", {})) for row in rows]
+    entries = [
+        row_identity_map.get(self.model, self.dataset_id, row.get("id"), row_hash)
+        for row, row_hash in zip(rows, row_hashes)
+    ]
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    if missing:
+        decoded = self._decode_new_rows(
+            [rows[i] for i in missing], column_table, trusted=trusted
+        )
+        for i, entry in zip(missing, decoded):
+            entries[i] = entry
+            row_identity_map.put(
+                self.model, self.dataset_id, entry._row_id, row_hashes[i], entry
+            )
+    return entries
+
+
+@patch
+def _decode_new_rows(
+    self: Dataset,
+    rows: t.List[t.Dict],
+    column_table: t.Dict[str, str],
+    trusted: bool = False,
+    partial: bool = False,
+) -> t.List[BaseModelType]:
+    """Decode rows into new model instances."""
+    records = self._rows_to_records(rows, column_table)
+    entries = self._records_to_entries(records, trusted=trusted, partial=partial)
+
+    # Store row ID for future operations
+    for entry, row in zip(entries, rows):
+        entry._row_id = row.get("id")
+    return entries
+
+# %% ../nbs/dataset.ipynb 21
+@patch
+def _dedupe_key(self: Dataset, row_data: t.Dict) -> str:
+    """Hash the deduplicated fields of a row, keyed by column id."""
+    column_mapping = self._column_mapping
+    column_ids = {
+        column_mapping[name]
+        for field in self._dedupe_fields
+        for name in (field, f"{field}_reason")
+        if name in column_mapping
+    }
+    return content_hash({k: v for k, v in row_data.items() if k in column_ids})
+
+
+@patch
+async def _aensure_dedupe_index(
+    self: Dataset, page_size: int = DEFAULT_PAGE_SIZE
+) -> t.Optional[t.Dict[str, t.Union[str, asyncio.Future]]]:
+    """Get the dedupe index, building it from the backend if needed.
+
+    Returns None if dedupe is not enabled.
+    """
+    if self._dedupe_fields is None:
+        return None
+    if self._dedupe_index is None:
+        await self._aresolve_column_mapping()
+        index = {}
+        async for rows in self._aiter_row_pages(page_size=page_size):
+            for row in rows:
+                index.setdefault(self._dedupe_key(row.get("data", {})), row["id"])
+        # a concurrent append may have built the index meanwhile, keep its reservations
+        if self._dedupe_index is None:
+            self._dedupe_index = index
+    return self._dedupe_index
+
+
+@patch
+def _forget_rows(self: Dataset, row_ids: t.Iterable[str]) -> None:
+    """Drop deleted rows from the dedupe index."""
+    if not self._dedupe_index:
+        return
+    row_ids = set(row_ids)
+    for key in [k for k, row_id in self._dedupe_index.items() if row_id in row_ids]:
+        del self._dedupe_index[key]
+
+
+def _reserve_dedupe_key(index: t.Dict, key: str) -> asyncio.Future:
+    """Mark the content `key` as being appended, before its row is created."""
+    reservation = asyncio.get_running_loop().create_future()
+    index[key] = reservation
+    return reservation
+
+
+def _settle_dedupe_key(
+    index: t.Dict, key: str, reservation: asyncio.Future, row_id: t.Optional[str]
+) -> None:
+    """Replace a reservation by the id of the created row, or drop it if `row_id` is None."""
+    if index.get(key) is reservation:
+        if row_id is None:
+            del index[key]
+        else:
+            index[key] = row_id
+    if not reservation.done():
+        reservation.set_result(row_id)
+
+
+async def _adedupe_row_id(index: t.Dict, key: str) -> t.Optional[str]:
+    """Get the row id of the content `key`, waiting for an append of it in flight.
+
+    Returns None if there is no such row.
+    """
+    while key in index:
+        row_id = index[key]
+        if not isinstance(row_id, asyncio.Future):
+            return row_id
+        # shielded so that a cancelled waiter does not cancel the reservation
+        row_id = await asyncio.shield(row_id)
+        if row_id is not None:
+            return row_id
+    return None
+
+# %% ../nbs/dataset.ipynb 22
+@patch
+def _entry_to_row_data(self: Dataset, entry: BaseModelType) -> t.Dict:
+    """Convert an entry to the API data format, keyed by column id."""
+    column_id_map = self._column_mapping
     row_dict_converted = rt.ModelConverter.instance_to_row(entry)
-    row_id = create_nano_id()
     row_data = {}
     for column in row_dict_converted["data"]:
         if column["column_id"] in column_id_map:
             row_data[column_id_map[column["column_id"]]] = column["data"]
+    return row_data
+
 
-    sync_func = async_to_sync(self._ragas_api_client.create_dataset_row)
-    response = sync_func(
+@patch
+async def _acreate_row(
+    self: Dataset, entry: BaseModelType, row_id: t.Optional[str] = None
+) -> str:
+    """Create a row for the entry in the backend and return its row id."""
+    row_data = self._entry_to_row_data(entry)
+    response = await self._ragas_api_client.create_dataset_row(
         project_id=self.project_id,
         dataset_id=self.dataset_id,
-        id=row_id,
+        id=row_id or create_nano_id(),
         data=row_data,
     )
     # add the row id to the entry
     entry._row_id = response["id"]
-    # Update entry with Notion data (like ID)
-    self._entries.append(entry)
+    if row_identity_map.enabled:
+        row_identity_map.put(
+            self.model, self.dataset_id, entry._row_id, content_hash(row_data), entry
+        )
+    return entry._row_id
+
 
-# %% ../nbs/dataset.ipynb 20
 @patch
-def pop(self: Dataset, index: int = -1) -> BaseModelType:
-    """Remove and return entry at index, sync deletion to Notion."""
+async def _aappend(
+    self: Dataset,
+    entry: BaseModelType,
+    row_id: t.Optional[str] = None,
+    keep: bool = True,
+) -> str:
+    """Create a row for the entry, adding the entry to the local ones if `keep`."""
+    await self._aresolve_column_mapping()
+    index = await self._aensure_dedupe_index()
+    reservation = None
+    if index is not None:
+        key = self._dedupe_key(self._entry_to_row_data(entry))
+        existing = await _adedupe_row_id(index, key)
+        if existing is not None:
+            entry._row_id = existing
+            return existing
+        reservation = _reserve_dedupe_key(index, key)
+
+    try:
+        row_id = await self._acreate_row(entry, row_id)
+    except BaseException:
+        if reservation is not None:
+            _settle_dedupe_key(index, key, reservation, None)
+        raise
+    if reservation is not None:
+        _settle_dedupe_key(index, key, reservation, row_id)
+    if keep:
+        self._mutable_entries().append(entry)
+    return row_id
+
+
+@patch
+async def aappend(
+    self: Dataset, entry: BaseModelType, row_id: t.Optional[str] = None
+) -> str:
+    """Add a new entry to the dataset and sync to the backend.
+
+    The row is created with `row_id` if given, else with a new id. Returns the
+    row id of the entry. With dedupe enabled an entry whose content
+    matches an existing row is not added, and the id of that row is returned.
+    """
+    return await self._aappend(entry, row_id)
+
+
+@patch
+def append(self: Dataset, entry: BaseModelType, row_id: t.Optional[str] = None) -> str:
+    """Add a new entry to the dataset and sync to the backend."""
+    return async_to_sync(self.aappend)(entry, row_id)
+
+
+@patch
+async def _arow_exists(self: Dataset, row_id: str) -> bool:
+    """Check whether the backend has a row with this id."""
+    try:
+        await self._ragas_api_client.get_dataset_row(
+            project_id=self.project_id, dataset_id=self.dataset_id, row_id=row_id
+        )
+    except ApiNotFoundError:
+        return False
+    return True
+
+
+async def _bounded_gather(
+    aws: t.Iterable[t.Awaitable], max_concurrency: int
+) -> t.List[t.Any]:
+    """Await `aws` with at most `max_concurrency` running at once.
+
+    Returns the result, or the error raised, for each awaitable in order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws), return_exceptions=True)
+
+
+@patch
+async def _acreate_rows(
+    self: Dataset, entries: t.List[BaseModelType], max_concurrency: int = 16
+) -> t.List[t.Union[str, BaseException]]:
+    """Create rows for the entries, at most `max_concurrency` at a time.
+
+    Returns the row id, or the error raised, for each entry in order.
+    """
+    await self._aresolve_column_mapping()
+    return await _bounded_gather(
+        (self._acreate_row(entry) for entry in entries), max_concurrency
+    )
+
+
+@patch
+async def aextend(
+    self: Dataset, entries: t.Iterable[BaseModelType], max_concurrency: int = 16
+) -> None:
+    """Add several entries to the dataset, creating up to `max_concurrency` rows at once.
+
+    Entries whose row was created are added in order even if others fail; the
+    first error is raised afterwards. With dedupe enabled, entries whose content
+    matches an existing row or an earlier entry are skipped.
+    """
+    entries = list(entries)
+    await self._aresolve_column_mapping()
+    index = await self._aensure_dedupe_index()
+    keys = [None] * len(entries)
+    reservations = [None] * len(entries)
+    repeated = []
+    if index is not None:
+        batch = {}
+        for entry in entries:
+            key = self._dedupe_key(self._entry_to_row_data(entry))
+            if key in batch:
+                repeated.append((key, entry))
+                continue
+            existing = await _adedupe_row_id(index, key)
+            if existing is None:
+                batch[key] = entry
+            else:
+                entry._row_id = existing
+        keys, entries = list(batch), list(batch.values())
+        # reserve the keys so that concurrent appends of the same content wait for these rows
+        reservations = [_reserve_dedupe_key(index, key) for key in keys]
+
+    try:
+        results = await self._acreate_rows(entries, max_concurrency=max_concurrency)
+    except BaseException:
+        for key, reservation in zip(keys, reservations):
+            if reservation is not None:
+                _settle_dedupe_key(index, key, reservation, None)
+        raise
+    local_entries = self._mutable_entries()
+    errors = []
+    for key, entry, reservation, result in zip(keys, entries, reservations, results):
+        if isinstance(result, BaseException):
+            errors.append(result)
+            result = None
+        else:
+            local_entries.append(entry)
+        if reservation is not None:
+            _settle_dedupe_key(index, key, reservation, result)
+    for key, entry in repeated:
+        row_id = index.get(key)
+        if isinstance(row_id, str):
+            entry._row_id = row_id
+    if errors:
+        raise errors[0]
+
+
+@patch
+def extend(
+    self: Dataset, entries: t.Iterable[BaseModelType], max_concurrency: int = 16
+) -> None:
+    """Add several entries to the dataset, creating up to `max_concurrency` rows at once."""
+    async_to_sync(self.aextend)(entries, max_concurrency=max_concurrency)
+
+# %% ../nbs/dataset.ipynb 25
+@patch
+async def apop(self: Dataset, index: int = -1) -> BaseModelType:
+    """Remove and return entry at index, sync deletion to the backend."""
     entry = self._entries[index]
     # get the row id
     row_id = entry._row_id
@@ -153,69 +822,217 @@ def pop(self: Dataset, index: int = -1) -> BaseModelType:
         )
 
     # soft delete the row
-    sync_func = async_to_sync(self._ragas_api_client.delete_dataset_row)
-    sync_func(project_id=self.project_id, dataset_id=self.dataset_id, row_id=row_id)
+    await self._ragas_api_client.delete_dataset_row(
+        project_id=self.project_id, dataset_id=self.dataset_id, row_id=row_id
+    )
+    self._forget_rows([row_id])
 
     # Remove from local cache
-    return self._entries.pop(index)
+    return self._mutable_entries().pop(index)
+
 
-# %% ../nbs/dataset.ipynb 24
 @patch
-def load(self: Dataset) -> None:
-    """Load all entries from the backend API."""
-    # Get all rows
-    sync_func = async_to_sync(self._ragas_api_client.list_dataset_rows)
-    response = sync_func(project_id=self.project_id, dataset_id=self.dataset_id)
+def pop(self: Dataset, index: int = -1) -> BaseModelType:
+    """Remove and return entry at index, sync deletion to the backend."""
+    return async_to_sync(self.apop)(index)
 
-    # Get column mapping (ID -> name)
-    column_map = {v: k for k, v in self.model.__column_mapping__.items()}
+# %% ../nbs/dataset.ipynb 33
+class BackgroundAppender:
+    """Append entries to a dataset from a bounded queue, a few at a time.
 
-    # Clear existing entries
-    self._entries.clear()
+    Use it as an async context manager: `put` waits while the queue is full and
+    leaving the block waits for every queued entry to be uploaded. The first
+    upload error, or error of `on_append`, is raised by the next `put` or when
+    leaving the block. With `keep_entries` off, the entries are uploaded without
+    being added to the dataset's local entries, so memory does not grow with them.
+    """
+
+    _STOP = object()
 
-    # Process rows
-    for row in response.get("items", []):
-        model_data = {}
-        row_id = row.get("id")
+    def __init__(
+        self,
+        dataset: "Dataset",
+        max_concurrency: int = 8,
+        max_pending: t.Optional[int] = None,
+        on_append: t.Optional[t.Callable[[BaseModel], None]] = None,
+        keep_entries: bool = True,
+    ):
+        self.dataset = dataset
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending or 2 * max_concurrency
+        self.on_append = on_append
+        self.keep_entries = keep_entries
+        self._queue: t.Optional[asyncio.Queue] = None
+        self._workers: t.List[asyncio.Task] = []
+        self._error: t.Optional[BaseException] = None
 
-        # Convert from API data format to model fields
-        for col_id, value in row.get("data", {}).items():
-            if col_id in column_map:
-                field_name = column_map[col_id]
-                model_data[field_name] = value
+    async def __aenter__(self) -> "BackgroundAppender":
+        await self.dataset._aresolve_column_mapping()
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self.max_concurrency)
+        ]
+        return self
 
-        # Create model instance
-        entry = self.model(**model_data)
+    async def _work(self) -> None:
+        while (job := await self._queue.get()) is not self._STOP:
+            if self._error is not None:
+                continue
+            entry, row_id = job
+            try:
+                await self.dataset._aappend(entry, row_id, keep=self.keep_entries)
+                if self.on_append is not None:
+                    self.on_append(entry)
+            except Exception as e:
+                self._error = self._error or e
 
-        # Store row ID for future operations
-        entry._row_id = row_id
+    async def put(self, entry: BaseModel, row_id: t.Optional[str] = None) -> None:
+        """Queue an entry to be appended, waiting while the queue is full.
+
+        The row is created with `row_id` if given, else with a new id.
+        """
+        if self._error is not None:
+            raise self._error
+        await self._queue.put((entry, row_id))
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            return
+        for _ in self._workers:
+            await self._queue.put(self._STOP)
+        await asyncio.gather(*self._workers)
+        if self._error is not None:
+            raise self._error
+
+
+@patch
+def appender(
+    self: Dataset,
+    max_concurrency: int = 8,
+    max_pending: t.Optional[int] = None,
+    on_append: t.Optional[t.Callable[[BaseModelType], None]] = None,
+    keep_entries: bool = True,
+) -> BackgroundAppender:
+    """Append entries in the background, see `BackgroundAppender`.
+
+    Args:
+        max_concurrency: Maximum number of rows created at once
+        max_pending: Maximum number of entries waiting to be uploaded, twice
+            `max_concurrency` by default
+        on_append: Called with each entry once its row is created
+        keep_entries: Also add the entries to the local entries of the dataset
+    """
+    return BackgroundAppender(
+        self,
+        max_concurrency=max_concurrency,
+        max_pending=max_pending,
+        on_append=on_append,
+        keep_entries=keep_entries,
+    )
+
+# %% ../nbs/dataset.ipynb 36
+@patch
+async def _aload_entries(
+    self: Dataset,
+    trusted: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    columns: t.Optional[t.Sequence[str]] = None,
+) -> t.List[BaseModelType]:
+    """Fetch and decode every row of the dataset, page by page."""
+    await self._aresolve_column_mapping()
+    column_table = self._projected_column_table(columns)
+    fields = list(column_table) if columns is not None else None
+    entries = []
+    async for rows in self._aiter_row_pages(page_size=page_size, fields=fields):
+        entries.extend(
+            self._decode_rows(
+                rows, column_table, trusted=trusted, partial=columns is not None
+            )
+        )
+    return entries
+
+
+@patch
+async def aload(
+    self: Dataset,
+    trusted: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    columns: t.Optional[t.Sequence[str]] = None,
+) -> None:
+    """Load all entries from the backend API.
+
+    Args:
+        trusted: Skip validation and build entries with `model_construct`. Only use
+            this for datasets written by this library.
+        page_size: Number of rows fetched and decoded per request
+        columns: Only request and decode these fields. Entries are then partial,
+            with the other fields left at their default or unset, and should not
+            be saved back.
+    """
+    entries = await self._aload_entries(
+        trusted=trusted, page_size=page_size, columns=columns
+    )
+
+    # Replace existing entries, leaving any views on the old ones untouched
+    self._entries = entries
+    self._entries_shared = False
+
+
+@patch
+def load(
+    self: Dataset,
+    trusted: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    columns: t.Optional[t.Sequence[str]] = None,
+) -> None:
+    """Load all entries from the backend API.
+
+    Args:
+        trusted: Skip validation and build entries with `model_construct`. Only use
+            this for datasets written by this library.
+        page_size: Number of rows fetched and decoded per request
+        columns: Only request and decode these fields. Entries are then partial,
+            with the other fields left at their default or unset, and should not
+            be saved back.
+    """
+    async_to_sync(self.aload)(trusted=trusted, page_size=page_size, columns=columns)
 
-        self._entries.append(entry)
 
-# %% ../nbs/dataset.ipynb 26
 @patch
-def load_as_dicts(self: Dataset) -> t.List[t.Dict]:
-    """Load all entries as dictionaries."""
-    # Get all rows
-    sync_func = async_to_sync(self._ragas_api_client.list_dataset_rows)
-    response = sync_func(project_id=self.project_id, dataset_id=self.dataset_id)
+async def __aiter__(self: Dataset) -> t.AsyncIterator[BaseModelType]:
+    """Iterate over the entries, streaming them page by page if none are loaded."""
+    if self._entries:
+        for entry in self._entries:
+            yield entry
+        return
 
-    # Get column mapping (ID -> name)
-    column_map = {v: k for k, v in self.model.__column_mapping__.items()}
+    await self._aresolve_column_mapping()
+    column_table = self._column_table()
+    async for rows in self._aiter_row_pages():
+        for entry in self._decode_rows(rows, column_table):
+            yield entry
 
-    # Convert to dicts with field names
-    result = []
-    for row in response.get("items", []):
-        item_dict = {}
-        for col_id, value in row.get("data", {}).items():
-            if col_id in column_map:
-                field_name = column_map[col_id]
-                item_dict[field_name] = value
-        result.append(item_dict)
+# %% ../nbs/dataset.ipynb 45
+@patch
+def load_as_dicts(
+    self: Dataset, columns: t.Optional[t.Sequence[str]] = None
+) -> t.List[t.Dict]:
+    """Load all entries as dictionaries, optionally only the given `columns`."""
+    column_table = self._projected_column_table(columns)
+    fields = list(column_table) if columns is not None else None
 
-    return result
+    async def _load_records():
+        result = []
+        async for rows in self._aiter_row_pages(fields=fields):
+            result.extend(self._rows_to_records(rows, column_table))
+        return result
 
-# %% ../nbs/dataset.ipynb 28
+    return async_to_sync(_load_records)()
+
+# %% ../nbs/dataset.ipynb 48
 @patch
 def to_pandas(self: Dataset) -> "pd.DataFrame":
     """Convert dataset to pandas DataFrame."""
@@ -228,9 +1045,9 @@ def to_pandas(self: Dataset) -> "pd.DataFrame":
     data = [entry.model_dump() for entry in self._entries]
     return pd.DataFrame(data)
 
-# %% ../nbs/dataset.ipynb 30
+# %% ../nbs/dataset.ipynb 50
 @patch
-def save(self: Dataset, item: BaseModelType) -> None:
+async def asave(self: Dataset, item: BaseModelType) -> None:
     """Save changes to an item to the backend."""
     if not isinstance(item, self.model):
         raise TypeError(f"Item must be an instance of {self.model.__name__}")
@@ -252,33 +1069,38 @@ def save(self: Dataset, item: BaseModelType) -> None:
             "Cannot save: item is not from this dataset or was not properly synced"
         )
 
-    # Get column mapping and prepare data
-    column_id_map = self.model.__column_mapping__
-    row_dict = rt.ModelConverter.instance_to_row(item)["data"]
-    row_data = {}
-
-    for column in row_dict:
-        if column["column_id"] in column_id_map:
-            row_data[column_id_map[column["column_id"]]] = column["data"]
-
     # Update in backend
-    sync_func = async_to_sync(self._ragas_api_client.update_dataset_row)
-    response = sync_func(
+    await self._aresolve_column_mapping()
+    row_data = self._entry_to_row_data(item)
+    await self._ragas_api_client.update_dataset_row(
         project_id=self.project_id,
         dataset_id=self.dataset_id,
         row_id=row_id,
         data=row_data,
     )
+    if row_identity_map.enabled:
+        row_identity_map.put(
+            self.model, self.dataset_id, row_id, content_hash(row_data), item
+        )
+    if self._dedupe_index is not None:
+        self._forget_rows([row_id])
+        self._dedupe_index.setdefault(self._dedupe_key(row_data), row_id)
 
     # Find and update in local cache if needed
     for i, entry in enumerate(self._entries):
         if hasattr(entry, "_row_id") and entry._row_id == row_id:
             # If it's not the same object, update our copy
             if id(entry) != id(item):
-                self._entries[i] = item
+                self._mutable_entries()[i] = item
             break
 
-# %% ../nbs/dataset.ipynb 34
+
+@patch
+def save(self: Dataset, item: BaseModelType) -> None:
+    """Save changes to an item to the backend."""
+    async_to_sync(self.asave)(item)
+
+# %% ../nbs/dataset.ipynb 54
 @patch
 def get(
     self: Dataset, field_value: str, field_name: str = "_row_id"
@@ -304,10 +1126,10 @@ def get(
     # If not found and field is "id", try to get directly from API
     if field_name == "id":
         # Get column ID for field
-        if field_name not in self.model.__column_mapping__:
+        if field_name not in self._column_mapping:
             return None
 
-        column_id = self.model.__column_mapping__[field_name]
+        column_id = self._column_mapping[field_name]
 
         # Get rows with filter
         sync_func = async_to_sync(self._ragas_api_client.list_dataset_rows)
@@ -322,3 +1144,746 @@ def get(
         # Would parse response here if we had filtering
 
     return None
+
+# %% ../nbs/dataset.ipynb 58
+@patch
+async def _adelete_rows(
+    self: Dataset, row_ids: t.List[str], max_concurrency: int = 16
+) -> t.List[t.Optional[BaseException]]:
+    """Delete rows from the backend, at most `max_concurrency` at a time."""
+    results = await _bounded_gather(
+        (
+            self._ragas_api_client.delete_dataset_row(
+                project_id=self.project_id, dataset_id=self.dataset_id, row_id=row_id
+            )
+            for row_id in row_ids
+        ),
+        max_concurrency,
+    )
+    self._forget_rows(
+        row_id
+        for row_id, result in zip(row_ids, results)
+        if not isinstance(result, BaseException)
+    )
+    return results
+
+
+@patch
+async def async_sync_from(
+    self: Dataset,
+    entries: t.Iterable[BaseModelType],
+    key: t.Union[str, t.Callable[[BaseModelType], t.Hashable]],
+    delete_missing: bool = True,
+    max_concurrency: int = 16,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> t.Dict[str, int]:
+    """Make the backend hold `entries`, writing only the rows that differ.
+
+    Rows are matched to entries by `key` and compared by a hash of their content.
+    Entries without a matching row are created, rows whose content changed are
+    updated and, with `delete_missing`, rows without a matching entry are deleted.
+
+    Args:
+        entries: The entries the dataset should hold
+        key: Field name, or function of an entry, identifying the same row across syncs
+        delete_missing: Delete rows that have no matching entry
+        max_concurrency: Maximum number of write requests in flight
+        page_size: Number of rows fetched per request while diffing
+
+    Returns:
+        The number of rows created, updated, deleted and left unchanged
+    """
+    await self._aresolve_column_mapping()
+    entries = list(entries)
+    key_of = (lambda entry: getattr(entry, key)) if isinstance(key, str) else key
+    column_ids = set(self._column_mapping.values())
+
+    def _row_hash(data: t.Dict) -> str:
+        return content_hash({k: v for k, v in data.items() if k in column_ids})
+
+    local = {}
+    for entry in entries:
+        entry_key = key_of(entry)
+        if entry_key in local:
+            raise ValueError(f"Duplicate key {entry_key!r} in entries to sync")
+        local[entry_key] = entry
+
+    # key -> (row id, content hash) of every row in the backend
+    column_table = self._column_table()
+    remote, duplicate_row_ids = {}, []
+    async for rows in self._aiter_row_pages(page_size=page_size):
+        # compare decoded values, raw API values differ from typed attributes
+        row_keys = [key_of(entry) for entry in self._decode_rows(rows, column_table)]
+        for row, row_key in zip(rows, row_keys):
+            if row_key in remote:
+                duplicate_row_ids.append(row["id"])
+            else:
+                remote[row_key] = (row["id"], _row_hash(row.get("data", {})))
+
+    to_create, to_update, unchanged = [], [], 0
+    for entry_key, entry in local.items():
+        if entry_key not in remote:
+            to_create.append(entry)
+            continue
+        row_id, row_hash = remote.pop(entry_key)
+        entry._row_id = row_id
+        row_data = self._entry_to_row_data(entry)
+        if _row_hash(row_data) != row_hash:
+            to_update.append((row_id, row_data))
+        else:
+            unchanged += 1
+
+    to_delete = duplicate_row_ids
+    if delete_missing:
+        to_delete = to_delete + [row_id for row_id, _ in remote.values()]
+
+    results = await self._acreate_rows(to_create, max_concurrency=max_concurrency)
+    results += await _bounded_gather(
+        (
+            self._ragas_api_client.update_dataset_row(
+                project_id=self.project_id,
+                dataset_id=self.dataset_id,
+                row_id=row_id,
+                data=row_data,
+            )
+            for row_id, row_data in to_update
+        ),
+        max_concurrency,
+    )
+    results += await self._adelete_rows(to_delete, max_concurrency=max_concurrency)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    # rebuild the dedupe index on the next append, rows may have been rewritten
+    self._dedupe_index = None
+
+    # the backend now holds exactly these entries
+    if delete_missing:
+        self._entries = entries
+        self._entries_shared = False
+
+    return {
+        "created": len(to_create),
+        "updated": len(to_update),
+        "deleted": len(to_delete),
+        "unchanged": unchanged,
+    }
+
+
+@patch
+def sync_from(
+    self: Dataset,
+    entries: t.Iterable[BaseModelType],
+    key: t.Union[str, t.Callable[[BaseModelType], t.Hashable]],
+    delete_missing: bool = True,
+    max_concurrency: int = 16,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> t.Dict[str, int]:
+    """Make the backend hold `entries`, writing only the rows that differ."""
+    return async_to_sync(self.async_sync_from)(
+        entries,
+        key=key,
+        delete_missing=delete_missing,
+        max_concurrency=max_concurrency,
+        page_size=page_size,
+    )
+
+# %% ../nbs/dataset.ipynb 65
+def _shard_of(value: t.Any, num_shards: int) -> int:
+    """Get the shard a value belongs to, stable across processes and machines."""
+    return int(content_hash(value)[:16], 16) % num_shards
+
+
+@patch
+def _view_of(self: Dataset, entries: t.List[BaseModelType]) -> "Dataset[BaseModelType]":
+    """Create a dataset sharing this one's column mapping that holds `entries`."""
+    view = self._view([])
+    view._entries = entries
+    return view
+
+
+@patch
+async def ashard(
+    self: Dataset,
+    num_shards: int,
+    index: int,
+    key: t.Optional[t.Union[str, t.Callable[[BaseModelType], t.Hashable]]] = None,
+    by_page: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> "Dataset[BaseModelType]":
+    """Get shard `index` of `num_shards` of the dataset.
+
+    Rows are assigned to shards by a stable hash of their row id or of `key`, a field
+    name or function of an entry. If the entries are loaded this returns a view and
+    makes no request. Otherwise the rows are streamed from the backend and only the
+    ones in this shard are decoded and kept.
+
+    With `by_page=True` shard `index` is made of every `num_shards`-th page instead,
+    so each worker fetches only its own pages. This is cheaper, but shards move when
+    rows are added or removed, so all workers must run against the same snapshot.
+    """
+    if not 0 <= index < num_shards:
+        raise ValueError(f"index must be in [0, {num_shards}), got {index}")
+
+    def _key_of(entry):
+        if key is None:
+            if entry._row_id is None:
+                raise ValueError(
+                    "Cannot shard entries that were not synced to the dataset."
+                )
+            return entry._row_id
+        return getattr(entry, key) if isinstance(key, str) else key(entry)
+
+    if self._entries:
+        if by_page:
+            positions = [
+                i
+                for i in range(len(self._entries))
+                if (i // page_size) % num_shards == index
+            ]
+        else:
+            positions = [
+                i
+                for i, entry in enumerate(self._entries)
+                if _shard_of(_key_of(entry), num_shards) == index
+            ]
+        return self._view(positions)
+
+    await self._aresolve_column_mapping()
+    column_table = self._column_table()
+    entries = []
+    if by_page:
+        async for rows in self._aiter_row_pages(
+            page_size=page_size, first_page=index, page_step=num_shards
+        ):
+            entries.extend(self._decode_rows(rows, column_table))
+    else:
+        async for rows in self._aiter_row_pages(page_size=page_size):
+            if key is None or isinstance(key, str):
+                # pick the rows of this shard before paying to decode them
+                records = self._rows_to_records(rows, column_table)
+                rows = [
+                    row
+                    for row, record in zip(rows, records)
+                    if _shard_of(
+                        row.get("id") if key is None else record.get(key), num_shards
+                    )
+                    == index
+                ]
+                entries.extend(self._decode_rows(rows, column_table))
+            else:
+                entries.extend(
+                    entry
+                    for entry in self._decode_rows(rows, column_table)
+                    if _shard_of(_key_of(entry), num_shards) == index
+                )
+    return self._view_of(entries)
+
+
+@patch
+def shard(
+    self: Dataset,
+    num_shards: int,
+    index: int,
+    key: t.Optional[t.Union[str, t.Callable[[BaseModelType], t.Hashable]]] = None,
+    by_page: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> "Dataset[BaseModelType]":
+    """Get shard `index` of `num_shards` of the dataset."""
+    return async_to_sync(self.ashard)(
+        num_shards, index, key=key, by_page=by_page, page_size=page_size
+    )
+
+# %% ../nbs/dataset.ipynb 69
+import json
+import random
+
+
+class _StratifiedReservoir:
+    """Uniform sample of a stream of items, stratified by a key per item.
+
+    Each stratum keeps a reservoir of `n` items, so that whatever share of the
+    sample it ends up with can be drawn uniformly from it.
+    """
+
+    def __init__(self, n: int, rng: random.Random):
+        self.n = n
+        self.rng = rng
+        self._seen: t.Dict[t.Hashable, int] = {}
+        self._reservoirs: t.Dict[t.Hashable, t.List] = {}
+
+    def add(self, stratum: t.Hashable, item: t.Any) -> None:
+        seen = self._seen.get(stratum, 0) + 1
+        self._seen[stratum] = seen
+        reservoir = self._reservoirs.setdefault(stratum, [])
+        if len(reservoir) < self.n:
+            reservoir.append(item)
+        else:
+            j = self.rng.randrange(seen)
+            if j < self.n:
+                reservoir[j] = item
+
+    def _allocate(self) -> t.Dict[t.Hashable, int]:
+        """Split the sample between strata in proportion to their size."""
+        total = sum(self._seen.values())
+        if self.n >= total:
+            return dict(self._seen)
+        quotas = {k: self.n * seen / total for k, seen in self._seen.items()}
+        allocation = {k: int(quota) for k, quota in quotas.items()}
+        remaining = self.n - sum(allocation.values())
+        by_remainder = sorted(
+            quotas, key=lambda k: quotas[k] - allocation[k], reverse=True
+        )
+        for k in by_remainder[:remaining]:
+            allocation[k] += 1
+        return allocation
+
+    def sample(self) -> t.List:
+        sample = []
+        for stratum, size in self._allocate().items():
+            sample.extend(self.rng.sample(self._reservoirs[stratum], size))
+        return sample
+
+
+def _stratum(value: t.Any) -> t.Hashable:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+@patch
+async def asample(
+    self: Dataset,
+    n: int,
+    seed: t.Optional[int] = None,
+    stratify_by: t.Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> "Dataset[BaseModelType]":
+    """Get a random sample of `n` entries, in dataset order.
+
+    If the entries are loaded this returns a view and makes no request. Otherwise
+    the rows are streamed through a reservoir, so memory is bounded by `n` (per
+    stratum) and only the sampled rows are decoded.
+
+    Args:
+        n: Size of the sample
+        seed: Seed for a reproducible sample
+        stratify_by: Field whose values should keep their proportions in the sample
+        page_size: Number of rows fetched per request when streaming
+    """
+    reservoir = _StratifiedReservoir(n, random.Random(seed))
+
+    if self._entries:
+        for position, entry in enumerate(self._entries):
+            value = getattr(entry, stratify_by) if stratify_by else None
+            reservoir.add(_stratum(value), position)
+        return self._view(sorted(reservoir.sample()))
+
+    await self._aresolve_column_mapping()
+    column_table = self._column_table()
+    position = 0
+    async for rows in self._aiter_row_pages(page_size=page_size):
+        records = self._rows_to_records(rows, column_table) if stratify_by else rows
+        for row, record in zip(rows, records):
+            value = record.get(stratify_by) if stratify_by else None
+            reservoir.add(_stratum(value), (position, row))
+            position += 1
+
+    rows = [row for _, row in sorted(reservoir.sample(), key=lambda item: item[0])]
+    return self._view_of(self._decode_rows(rows, column_table))
+
+
+@patch
+def sample(
+    self: Dataset,
+    n: int,
+    seed: t.Optional[int] = None,
+    stratify_by: t.Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> "Dataset[BaseModelType]":
+    """Get a random sample of `n` entries, in dataset order."""
+    return async_to_sync(self.asample)(
+        n, seed=seed, stratify_by=stratify_by, page_size=page_size
+    )
+
+# %% ../nbs/dataset.ipynb 73
+import csv
+import json
+from pathlib import Path
+
+from tqdm import tqdm
+
+DATASET_FORMATS = ("jsonl", "csv", "parquet")
+
+
+def infer_format(path: t.Union[str, Path], format: t.Optional[str] = None) -> str:
+    """Get the file format to use for `path`, from `format` or the file suffix."""
+    if format is None:
+        format = Path(path).suffix.lstrip(".").lower()
+        format = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(
+            format, format
+        )
+    if format not in DATASET_FORMATS:
+        raise ValueError(
+            f"Unsupported format '{format}' for {path}. Use one of {DATASET_FORMATS}."
+        )
+    return format
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "You must install pyarrow: `pip install pyarrow` if you wish to use parquet files"
+        )
+    return pyarrow
+
+
+def _is_text_annotation(annotation) -> bool:
+    """Check if values of a field are plain text, so CSV cells should not be parsed."""
+    origin = t.get_origin(annotation)
+    if annotation is str:
+        return True
+    if origin is t.Literal:
+        return all(isinstance(arg, str) for arg in t.get_args(annotation))
+    if origin is t.Union:
+        args = [arg for arg in t.get_args(annotation) if arg is not type(None)]
+        return len(args) == 1 and _is_text_annotation(args[0])
+    return False
+
+# %% ../nbs/dataset.ipynb 74
+class RecordWriter:
+    """Write dicts keyed by field name to a JSONL, CSV or Parquet file, chunk by chunk."""
+
+    def __init__(
+        self,
+        path: t.Union[str, Path],
+        format: t.Optional[str] = None,
+        fieldnames: t.Optional[t.List[str]] = None,
+    ):
+        self.path = Path(path)
+        self.format = infer_format(path, format)
+        self.fieldnames = fieldnames
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> "RecordWriter":
+        if self.format == "parquet":
+            _import_pyarrow()
+        else:
+            self._file = open(self.path, "w", encoding="utf-8", newline="")
+        return self
+
+    def write(self, records: t.List[t.Dict]) -> None:
+        """Append a chunk of records to the file."""
+        if not records:
+            return
+        if self.format == "jsonl":
+            self._file.writelines(
+                json.dumps(record, default=str) + "\n" for record in records
+            )
+        elif self.format == "csv":
+            if self._writer is None:
+                fieldnames = self.fieldnames or list(records[0])
+                self._writer = csv.DictWriter(
+                    self._file, fieldnames=fieldnames, extrasaction="ignore"
+                )
+                self._writer.writeheader()
+            # anything that is not text is stored as JSON so it can be read back,
+            # missing values are left empty
+            self._writer.writerows(
+                {
+                    k: (
+                        v
+                        if isinstance(v, str) or v is None
+                        else json.dumps(v, default=str)
+                    )
+                    for k, v in record.items()
+                }
+                for record in records
+            )
+        else:
+            pa = _import_pyarrow()
+            if self._writer is None:
+                table = pa.Table.from_pylist(records)
+                self._writer = pa.parquet.ParquetWriter(self.path, table.schema)
+            else:
+                table = pa.Table.from_pylist(records, schema=self._writer.schema)
+            self._writer.write_table(table)
+
+    def __exit__(self, *exc_info) -> None:
+        if self.format == "parquet":
+            if self._writer is not None:
+                self._writer.close()
+        else:
+            self._file.close()
+
+
+def iter_records(
+    path: t.Union[str, Path],
+    format: t.Optional[str] = None,
+    chunk_size: int = 1000,
+    model: t.Optional[t.Type[BaseModel]] = None,
+) -> t.Iterator[t.List[t.Dict]]:
+    """Read a JSONL, CSV or Parquet file as chunks of at most `chunk_size` records.
+
+    For CSV files, cells of fields that are not plain text in `model` are parsed as
+    JSON, reversing what `RecordWriter` does. Empty cells are left out so the field
+    takes its default, unless it is a required text field.
+    """
+    format = infer_format(path, format)
+    if format == "parquet":
+        pa = _import_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pylist()
+        return
+
+    text_fields, required_text_fields = set(), set()
+    if model is not None:
+        for name, info in model.model_fields.items():
+            if _is_text_annotation(info.annotation):
+                text_fields.add(name)
+                if info.is_required():
+                    required_text_fields.add(name)
+
+    def _parse_csv_cell(field_name, value):
+        if field_name in text_fields or field_name.endswith("_reason"):
+            return value
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if format == "jsonl":
+            lines = (json.loads(line) for line in f if line.strip())
+        else:
+            lines = (
+                {
+                    k: _parse_csv_cell(k, v)
+                    for k, v in row.items()
+                    if v != "" or k in required_text_fields
+                }
+                for row in csv.DictReader(f)
+            )
+        chunk = []
+        for record in lines:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+# %% ../nbs/dataset.ipynb 75
+@patch
+async def aexport(
+    self: Dataset,
+    path: t.Union[str, Path],
+    format: t.Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    progress: bool = True,
+) -> int:
+    """Stream every row of the dataset from the backend to a file.
+
+    Rows are fetched and written one page at a time, so memory use does not grow
+    with the size of the dataset.
+
+    Args:
+        path: File to write to
+        format: One of "jsonl", "csv" or "parquet", inferred from the suffix by default
+        page_size: Number of rows fetched per request
+        progress: Show a progress bar
+
+    Returns:
+        The number of rows written
+    """
+    await self._aresolve_column_mapping()
+    column_table = self._column_table()
+    written = 0
+    with RecordWriter(
+        path, format, fieldnames=list(self._column_mapping)
+    ) as writer, tqdm(
+        desc=f"Exporting {self.name}", unit="rows", disable=not progress
+    ) as progress_bar:
+        async for rows in self._aiter_row_pages(page_size=page_size):
+            records = self._rows_to_records(rows, column_table)
+            writer.write(records)
+            written += len(records)
+            progress_bar.update(len(records))
+    return written
+
+
+@patch
+def export(
+    self: Dataset,
+    path: t.Union[str, Path],
+    format: t.Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    progress: bool = True,
+) -> int:
+    """Stream every row of the dataset from the backend to a JSONL, CSV or Parquet file."""
+    return async_to_sync(self.aexport)(
+        path, format=format, page_size=page_size, progress=progress
+    )
+
+# %% ../nbs/dataset.ipynb 79
+@patch
+async def _aremove_entries(
+    self: Dataset, positions: t.Iterable[int], max_concurrency: int = 16
+) -> int:
+    """Delete the rows of the entries at `positions` and drop them from the dataset.
+
+    Entries whose row was deleted are dropped even if others fail; the first error
+    is raised afterwards. Returns the number of entries removed.
+    """
+    positions = sorted(set(positions))
+    row_ids = []
+    for position in positions:
+        row_id = self._entries[position]._row_id
+        if row_id is None:
+            raise ValueError(
+                "Entry has no row id. This likely means it was not added or synced to the dataset."
+            )
+        row_ids.append(row_id)
+
+    results = await self._adelete_rows(row_ids, max_concurrency=max_concurrency)
+    removed = {
+        position
+        for position, result in zip(positions, results)
+        if not isinstance(result, BaseException)
+    }
+    self._entries = [
+        entry for position, entry in enumerate(self._entries) if position not in removed
+    ]
+    self._entries_shared = False
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return len(removed)
+
+
+@patch
+def __delitem__(self: Dataset, key: t.Union[int, slice]) -> None:
+    """Delete the entry at an index, or the entries in a slice, from the dataset and backend."""
+    positions = range(len(self._entries))[key]
+    if isinstance(positions, int):
+        positions = [positions]
+    async_to_sync(self._aremove_entries)(positions)
+
+
+@patch
+async def aremove_where(
+    self: Dataset,
+    predicate: t.Callable[[BaseModelType], bool],
+    max_concurrency: int = 16,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Delete every entry for which `predicate` returns True.
+
+    If the entries are loaded only those are checked. Otherwise the rows are
+    streamed from the backend and checked a page at a time.
+
+    Args:
+        predicate: Function of an entry that returns True for entries to delete
+        max_concurrency: Maximum number of delete requests in flight
+        page_size: Number of rows fetched per request when streaming
+
+    Returns:
+        The number of entries removed
+    """
+    if self._entries:
+        positions = [i for i, entry in enumerate(self._entries) if predicate(entry)]
+        return await self._aremove_entries(positions, max_concurrency=max_concurrency)
+
+    await self._aresolve_column_mapping()
+    column_table = self._column_table()
+    # collect first, deleting while paging would shift the offsets
+    row_ids = []
+    async for rows in self._aiter_row_pages(page_size=page_size):
+        entries = self._decode_rows(rows, column_table)
+        row_ids.extend(entry._row_id for entry in entries if predicate(entry))
+
+    results = await self._adelete_rows(row_ids, max_concurrency=max_concurrency)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return len(row_ids)
+
+
+@patch
+def remove_where(
+    self: Dataset,
+    predicate: t.Callable[[BaseModelType], bool],
+    max_concurrency: int = 16,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Delete every entry for which `predicate` returns True."""
+    return async_to_sync(self.aremove_where)(
+        predicate, max_concurrency=max_concurrency, page_size=page_size
+    )
+
+
+@patch
+async def aclear(
+    self: Dataset, max_concurrency: int = 16, page_size: int = DEFAULT_PAGE_SIZE
+) -> int:
+    """Delete every row of the dataset, including rows that are not loaded.
+
+    Returns the number of rows removed.
+    """
+    row_ids = []
+    async for rows in self._aiter_row_pages(page_size=page_size):
+        row_ids.extend(row["id"] for row in rows)
+
+    results = await self._adelete_rows(row_ids, max_concurrency=max_concurrency)
+    deleted = {
+        row_id
+        for row_id, result in zip(row_ids, results)
+        if not isinstance(result, BaseException)
+    }
+    self._entries = [entry for entry in self._entries if entry._row_id not in deleted]
+    self._entries_shared = False
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return len(row_ids)
+
+
+@patch
+def clear(
+    self: Dataset, max_concurrency: int = 16, page_size: int = DEFAULT_PAGE_SIZE
+) -> int:
+    """Delete every row of the dataset, including rows that are not loaded."""
+    return async_to_sync(self.aclear)(
+        max_concurrency=max_concurrency, page_size=page_size
+    )
+
+# %% ../nbs/dataset.ipynb 83
+@patch
+def enable_dedupe(self: Dataset, fields: t.Optional[t.Sequence[str]] = None) -> None:
+    """Skip appending entries whose content matches a row already in the dataset.
+
+    The index is built from the backend on the next append and kept up to date as
+    rows are added, saved and deleted through this dataset.
+
+    Args:
+        fields: Fields to compare, all fields of the model by default
+    """
+    fields = tuple(self.model.model_fields if fields is None else fields)
+    unknown = [field for field in fields if field not in self.model.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields for {self.model.__name__}: {unknown}")
+    self._dedupe_fields = fields
+    self._dedupe_index = None
+
+
+@patch
+def disable_dedupe(self: Dataset) -> None:
+    """Append every entry again, even if its content is already in the dataset."""
+    self._dedupe_fields = None
+    self._dedupe_index = None
@@ -5,7 +5,8 @@
 # %% auto 0
 __all__ = ['RagasError', 'ValidationError', 'DuplicateError', 'NotFoundError', 'ResourceNotFoundError', 'ProjectNotFoundError',
            'DatasetNotFoundError', 'ExperimentNotFoundError', 'DuplicateResourceError', 'DuplicateProjectError',
-           'DuplicateDatasetError', 'DuplicateExperimentError']
+           'DuplicateDatasetError', 'DuplicateExperimentError', 'ApiError', 'ApiNotFoundError', 'ApiConflictError',
+           'BudgetExceededError']
 
 # %% ../nbs/exceptions.ipynb 2
 class RagasError(Exception):
@@ -78,3 +79,30 @@ class DuplicateExperimentError(DuplicateResourceError):
     """Exception raised when multiple experiments exist with the same name."""
 
     pass
+
+# %% ../nbs/exceptions.ipynb 6
+class ApiError(RagasError):
+    """Exception raised when the Ragas API answers a request with an error."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"API Error ({status_code}): {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+class ApiNotFoundError(ApiError, ResourceNotFoundError):
+    """Exception raised when the Ragas API has no resource at the requested path."""
+
+    pass
+
+
+class ApiConflictError(ApiError, DuplicateResourceError):
+    """Exception raised when the Ragas API already has a resource with the given id."""
+
+    pass
+
+# %% ../nbs/exceptions.ipynb 7
+class BudgetExceededError(RagasError):
+    """Exception raised when a call would exceed a spending budget."""
+
+    pass
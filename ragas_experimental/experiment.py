@@ -15,6 +15,7 @@ from ragas_experimental.model.pydantic_model import (
 )
 from .backends.ragas_api_client import RagasApiClient
 from .dataset import Dataset
+from .project.telemetry import RunStats
 
 # %% ../nbs/experiment.ipynb 3
 class Experiment(Dataset):
@@ -27,6 +28,8 @@ class Experiment(Dataset):
         ragas_api_client: RagasApiClient,
     ):
         self.experiment_id = experiment_id
+        # set by run_async to the final RunStats of the run
+        self.run_summary: t.Optional[RunStats] = None
         super().__init__(name, model, project_id, experiment_id, ragas_api_client)
 
     def __str__(self):
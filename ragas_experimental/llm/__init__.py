@@ -1,3 +1,4 @@
 from ragas_experimental.llm.llm import RagasLLM, ragas_llm
+from ragas_experimental.llm.quota import quota_scheduler, quota_tenant
 
-__all__ = ["RagasLLM", "ragas_llm"]
\ No newline at end of file
+__all__ = ["RagasLLM", "ragas_llm", "quota_scheduler", "quota_tenant"]
@@ -11,6 +11,8 @@ import threading
 from pydantic import BaseModel
 import instructor
 
+from .quota import estimate_tokens, quota_scheduler, usage_tokens
+
 T = t.TypeVar("T", bound=BaseModel)
 
 
@@ -115,7 +117,8 @@ class RagasLLM:
             return self._run_async_in_current_loop(
                 self.agenerate(prompt, response_model)
             )
-        else:
+        quota = quota_scheduler.get(self.provider, self.model)
+        if quota is None:
             # Regular sync client, just call the method directly
             return self.client.chat.completions.create(
                 model=self.model,
@@ -124,6 +127,22 @@ class RagasLLM:
                 **self.model_args,
             )
 
+        # Wait for the quota of the model, then correct it with the actual usage
+        estimate = estimate_tokens(prompt, self.model_args.get("max_tokens"))
+        quota.acquire_sync(estimate)
+        try:
+            response, completion = self.client.chat.completions.create_with_completion(
+                model=self.model,
+                messages=messages,
+                response_model=response_model,
+                **self.model_args,
+            )
+        except BaseException:
+            quota.release(estimate)
+            raise
+        quota.reconcile(estimate, usage_tokens(completion))
+        return response
+
     async def agenerate(self, prompt: str, response_model: t.Type[T]) -> T:
         """Asynchronously generate a response using the configured LLM."""
         messages = [{"role": "user", "content": prompt}]
@@ -134,13 +153,33 @@ class RagasLLM:
                 "Cannot use agenerate() with a synchronous client. Use generate() instead."
             )
 
-        # Regular async client, call the method directly
-        return await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            response_model=response_model,
-            **self.model_args,
-        )
+        quota = quota_scheduler.get(self.provider, self.model)
+        if quota is None:
+            # Regular async client, call the method directly
+            return await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_model=response_model,
+                **self.model_args,
+            )
+
+        # Wait for the quota of the model, then correct it with the actual usage
+        estimate = estimate_tokens(prompt, self.model_args.get("max_tokens"))
+        await quota.acquire(estimate)
+        try:
+            response, completion = (
+                await self.client.chat.completions.create_with_completion(
+                    model=self.model,
+                    messages=messages,
+                    response_model=response_model,
+                    **self.model_args,
+                )
+            )
+        except BaseException:
+            quota.release(estimate)
+            raise
+        quota.reconcile(estimate, usage_tokens(completion))
+        return response
 
 
 def ragas_llm(provider: str, model: str, client: t.Any, **model_args) -> RagasLLM:
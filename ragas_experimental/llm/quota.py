@@ -0,0 +1,252 @@
+"""Share request and token budgets of LLM providers between everything running in a process."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/llm/quota.ipynb.
+
+# %% auto 0
+__all__ = ['current_tenant', 'quota_scheduler', 'quota_tenant', 'estimate_tokens', 'usage_tokens', 'ModelQuota', 'QuotaScheduler']
+
+# %% ../../nbs/llm/quota.ipynb 3
+import asyncio
+import collections
+import contextvars
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+
+from ..exceptions import BudgetExceededError
+
+# %% ../../nbs/llm/quota.ipynb 5
+current_tenant: contextvars.ContextVar[t.Any] = contextvars.ContextVar(
+    "ragas_quota_tenant", default=None
+)
+
+
+@contextmanager
+def quota_tenant(name: t.Any) -> t.Iterator[None]:
+    """Share quotas fairly between the LLM calls made in this block and other tenants."""
+    token = current_tenant.set(name)
+    try:
+        yield
+    finally:
+        current_tenant.reset(token)
+
+
+def estimate_tokens(prompt: str, max_output_tokens: t.Optional[int] = None) -> int:
+    """Estimate the tokens of a call before it is made, about four characters a token."""
+    return len(prompt) // 4 + 1 + (max_output_tokens or 256)
+
+
+def usage_tokens(completion: t.Any) -> t.Optional[int]:
+    """Get the tokens a provider reports a completion used, if it does."""
+    usage = getattr(completion, "usage", None)
+    if usage is None:
+        return None
+    total = getattr(usage, "total_tokens", None)
+    if total is not None:
+        return total
+    # Anthropic reports input and output tokens separately
+    parts = [getattr(usage, name, None) for name in ("input_tokens", "output_tokens")]
+    return sum(parts) if all(p is not None for p in parts) else None
+
+
+class _Waiter:
+    __slots__ = ("tokens", "wake", "admitted")
+
+    def __init__(self, tokens: int, wake: t.Callable[[], None]):
+        self.tokens = tokens
+        self.wake = wake
+        self.admitted = False
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ModelQuota:
+    """Requests and tokens per minute, and total tokens, one model may use.
+
+    Safe to use from any thread and event loop.
+    """
+
+    def __init__(
+        self,
+        rpm: t.Optional[float] = None,
+        tpm: t.Optional[float] = None,
+        max_total_tokens: t.Optional[int] = None,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_total_tokens = max_total_tokens
+        self.spent_tokens = 0
+        self._lock = threading.Lock()
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        # waiters of each tenant, in the order the tenants take turns
+        self._queues: t.Dict[t.Any, t.Deque[_Waiter]] = collections.OrderedDict()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed, self._updated = now - self._updated, now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _delay(self, tokens: int) -> float:
+        """Seconds until a call of `tokens` fits in the budget."""
+        delay = 0.0
+        if self.rpm:
+            delay = max(delay, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm:
+            # a call larger than a minute's budget goes once the budget is full
+            delay = max(delay, (min(tokens, self.tpm) - self._tokens) * 60 / self.tpm)
+        return delay
+
+    def _dispatch(self) -> float:
+        """Admit waiters while the budget allows.
+
+        Returns the seconds until the next waiter fits, 0 when none are left.
+        """
+        self._refill()
+        while self._queues:
+            tenant, queue = next(iter(self._queues.items()))
+            waiter = queue[0]
+            delay = self._delay(waiter.tokens)
+            if delay > 0:
+                return delay
+            self._requests -= 1
+            self._tokens -= waiter.tokens
+            queue.popleft()
+            # the tenant goes to the back of the line
+            del self._queues[tenant]
+            if queue:
+                self._queues[tenant] = queue
+            waiter.admitted = True
+            waiter.wake()
+        return 0.0
+
+    def _enqueue(self, waiter: _Waiter) -> float:
+        with self._lock:
+            if (
+                self.max_total_tokens is not None
+                and self.spent_tokens + waiter.tokens > self.max_total_tokens
+            ):
+                raise BudgetExceededError(
+                    f"A call of about {waiter.tokens} tokens would exceed the budget "
+                    f"of {self.max_total_tokens} tokens, {self.spent_tokens} are spent"
+                )
+            self.spent_tokens += waiter.tokens
+            self._queues.setdefault(current_tenant.get(), collections.deque()).append(
+                waiter
+            )
+            return self._dispatch()
+
+    def _redispatch(self) -> float:
+        with self._lock:
+            return self._dispatch()
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        """Give back what a waiter that will not make its call holds."""
+        with self._lock:
+            self.spent_tokens -= waiter.tokens
+            if waiter.admitted:
+                self._requests += 1
+                self._tokens += waiter.tokens
+                return
+            for tenant, queue in self._queues.items():
+                if waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._queues[tenant]
+                    break
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a call of about `tokens` tokens may be made."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = _Waiter(tokens, lambda: loop.call_soon_threadsafe(_resolve, future))
+        delay = self._enqueue(waiter)
+        try:
+            while not waiter.admitted:
+                try:
+                    await asyncio.wait_for(asyncio.shield(future), delay or None)
+                except asyncio.TimeoutError:
+                    delay = self._redispatch()
+        except BaseException:
+            self._cancel(waiter)
+            raise
+
+    def acquire_sync(self, tokens: int) -> None:
+        """Block until a call of about `tokens` tokens may be made."""
+        event = threading.Event()
+        waiter = _Waiter(tokens, event.set)
+        delay = self._enqueue(waiter)
+        try:
+            while not waiter.admitted:
+                if not event.wait(delay or None):
+                    delay = self._redispatch()
+        except BaseException:
+            self._cancel(waiter)
+            raise
+
+    def reconcile(self, estimated: int, actual: t.Optional[int]) -> None:
+        """Correct the budget with the tokens a call actually used."""
+        if actual is None:
+            return
+        with self._lock:
+            self.spent_tokens += actual - estimated
+            self._tokens -= actual - estimated
+
+    def release(self, estimated: int) -> None:
+        """Give back the tokens of a call that failed before reporting its usage."""
+        self.reconcile(estimated, 0)
+
+
+class QuotaScheduler:
+    """The quotas of the provider models used in this process."""
+
+    def __init__(self):
+        self._quotas: t.Dict[t.Tuple[str, t.Optional[str]], ModelQuota] = {}
+        self._lock = threading.Lock()
+
+    def set_limits(
+        self,
+        provider: str,
+        model: t.Optional[str] = None,
+        rpm: t.Optional[float] = None,
+        tpm: t.Optional[float] = None,
+        max_total_tokens: t.Optional[int] = None,
+    ) -> ModelQuota:
+        """Limit the calls to a model, or to every model of a provider without `model`.
+
+        Args:
+            provider: Provider name as given to `ragas_llm`, e.g. "openai"
+            model: Model name, all the provider's models share the limits if None
+            rpm: Requests per minute
+            tpm: Tokens per minute, prompt and completion together
+            max_total_tokens: Tokens that may be spent in total, further calls
+                raise `BudgetExceededError`
+        """
+        quota = ModelQuota(rpm=rpm, tpm=tpm, max_total_tokens=max_total_tokens)
+        with self._lock:
+            self._quotas[(provider.lower(), model)] = quota
+        return quota
+
+    def get(self, provider: str, model: str) -> t.Optional[ModelQuota]:
+        """Get the quota calls to a model count against, if any."""
+        provider = provider.lower()
+        return self._quotas.get((provider, model)) or self._quotas.get((provider, None))
+
+    def remove(self, provider: str, model: t.Optional[str] = None) -> None:
+        with self._lock:
+            self._quotas.pop((provider.lower(), model), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotas.clear()
+
+
+quota_scheduler = QuotaScheduler()
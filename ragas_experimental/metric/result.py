@@ -164,6 +164,9 @@ class MetricResult:
         This allows calling string methods on discrete results,
         numeric methods on numeric results, and list methods on ranking results.
         """
+        # pickle and copy look attributes up before `_result` is set
+        if name == "_result":
+            raise AttributeError(name)
         if hasattr(self._result, name):
             attr = getattr(self._result, name)
             if callable(attr):
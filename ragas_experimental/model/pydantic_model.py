@@ -22,11 +22,17 @@ class ExtendedPydanticBaseModel(BaseModel):
     # Class variable for storing column mapping overrides
     __column_mapping__: t.ClassVar[t.Dict[str, str]] = {}
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Initialize column mapping if not already defined
-        if not self.__class__.__column_mapping__:
-            self._initialize_column_mapping()
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        # Every model gets its own column mapping, built once when the class is
+        # defined. Doing this here instead of in `__init__` keeps pydantic from
+        # calling back into Python for each row it validates. It starts from the
+        # parent's mapping and the one the class declares, which take precedence.
+        inherited = getattr(super(cls, cls), "__column_mapping__", {})
+        declared = cls.__dict__.get("__column_mapping__", {})
+        cls.__column_mapping__ = {**inherited, **declared}
+        cls._initialize_column_mapping()
 
     @classmethod
     def _initialize_column_mapping(cls):
@@ -43,14 +49,15 @@ class ExtendedPydanticBaseModel(BaseModel):
             if not column_id:
                 column_id = field_name
 
-            cls.__column_mapping__[field_name] = column_id
+            # a declared or inherited mapping wins over the default
+            column_id = cls.__column_mapping__.setdefault(field_name, column_id)
 
             # check if the field is a MetricResult
             if cls._is_metric_result_field(field_info.annotation):
                 # add additional mapping for the metric result
                 reason_field_name = f"{field_name}_reason"
                 reason_column_id = f"{column_id}_reason"
-                cls.__column_mapping__[reason_field_name] = reason_column_id
+                cls.__column_mapping__.setdefault(reason_field_name, reason_column_id)
 
     @staticmethod
     def _is_metric_result_field(annotation):
@@ -0,0 +1,337 @@
+"""Measure the overhead of running experiments, offline, with a fake LLM and a fake Ragas API."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/project/benchmark.ipynb.
+
+# %% auto 0
+__all__ = ['LatencyDistribution', 'fixed_latency', 'uniform_latency', 'lognormal_latency', 'FakeLLM', 'LoopLagMonitor',
+           'BenchmarkResult', 'run_benchmark', 'save_benchmark', 'find_regressions']
+
+# %% ../../nbs/project/benchmark.ipynb 3
+import asyncio
+import dataclasses
+import json
+import math
+import random
+import time
+import tracemalloc
+import typing as t
+from pathlib import Path
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from ..backends.mock_server import MockRagasServer
+from ..model.pydantic_model import ExtendedPydanticBaseModel
+from .core import Project
+from .scheduler import LatencyTracker
+
+# `Project.experiment` is patched onto `Project` by the experiments module,
+# which `project.core` does not import
+from . import experiments  # noqa: F401
+
+# %% ../../nbs/project/benchmark.ipynb 5
+LatencyDistribution = t.Callable[[random.Random], float]
+
+
+def fixed_latency(seconds: float) -> LatencyDistribution:
+    """Every call takes `seconds`."""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    """Calls take between `low` and `high` seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyDistribution:
+    """Calls take about `median` seconds, with a long tail of slow ones like LLM APIs."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+# %% ../../nbs/project/benchmark.ipynb 6
+_ZERO_VALUES = {str: "", int: 0, float: 0.0, bool: False}
+
+
+class FakeLLM:
+    """Stand-in for `RagasLLM` that answers after a simulated latency.
+
+    Responses use the defaults of the response model's fields, or zero values.
+    A fraction `failure_rate` of the calls raise an error instead.
+    """
+
+    def __init__(
+        self,
+        latency: t.Union[float, LatencyDistribution] = 0.5,
+        failure_rate: float = 0.0,
+        seed: t.Optional[int] = None,
+    ):
+        self.latency = (
+            fixed_latency(latency) if isinstance(latency, (int, float)) else latency
+        )
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.is_async = True
+        self.calls = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+        self.longest_call = 0.0
+
+    def _draw(self) -> t.Tuple[float, bool]:
+        # drawn together, so the n-th call gets the same outcome at any concurrency
+        delay = max(0.0, self.latency(self.rng))
+        fails = self.rng.random() < self.failure_rate
+        self.calls += 1
+        self.busy_seconds += delay
+        self.longest_call = max(self.longest_call, delay)
+        return delay, fails
+
+    def _respond(
+        self, response_model: t.Type[PydanticBaseModel], fails: bool
+    ) -> PydanticBaseModel:
+        if fails:
+            self.failures += 1
+            raise RuntimeError("Simulated LLM failure")
+        values = {}
+        for name, field in response_model.model_fields.items():
+            if field.is_required():
+                values[name] = _ZERO_VALUES.get(field.annotation)
+            else:
+                values[name] = field.get_default(call_default_factory=True)
+        return response_model.model_construct(**values)
+
+    def generate(
+        self, prompt: str, response_model: t.Type[PydanticBaseModel]
+    ) -> PydanticBaseModel:
+        delay, fails = self._draw()
+        time.sleep(delay)
+        return self._respond(response_model, fails)
+
+    async def agenerate(
+        self, prompt: str, response_model: t.Type[PydanticBaseModel]
+    ) -> PydanticBaseModel:
+        delay, fails = self._draw()
+        await asyncio.sleep(delay)
+        return self._respond(response_model, fails)
+
+# %% ../../nbs/project/benchmark.ipynb 10
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a task sleeping `interval` seconds."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.max_lag = 0.0
+        self._lags = LatencyTracker(window=100_000, min_samples=1)
+        self._task: t.Optional[asyncio.Task] = None
+
+    async def _watch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self._lags.record(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._watch())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def quantile(self, q: float) -> float:
+        lag = self._lags.quantile(q)
+        return lag if lag is not None else 0.0
+
+# %% ../../nbs/project/benchmark.ipynb 13
+class _Question(ExtendedPydanticBaseModel):
+    id: int
+    question: str
+
+
+class _Answer(ExtendedPydanticBaseModel):
+    id: int
+    question: str
+    answer: str
+
+
+class _Reply(PydanticBaseModel):
+    answer: str = "42"
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """Measurements of one experiment run with a fake LLM."""
+
+    size: int
+    max_concurrency: int
+    elapsed: float
+    items_per_second: float
+    llm_seconds: float
+    ideal_seconds: float
+    overhead_per_item: float
+    loop_lag_p50: float
+    loop_lag_p99: float
+    loop_lag_max: float
+    peak_memory_mb: t.Optional[float] = None
+    upload_lag_p95: t.Optional[float] = None
+    errors: int = 0
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return dataclasses.asdict(self)
+
+
+async def _benchmark_once(
+    size: int,
+    max_concurrency: int,
+    llm: FakeLLM,
+    api_latency: float,
+    trace_memory: bool,
+    run_kwargs: t.Dict[str, t.Any],
+) -> BenchmarkResult:
+    # the dataset is uploaded without latency, it is not part of the measurement
+    server = MockRagasServer()
+    project = Project.create("benchmark", ragas_api_client=server.client())
+    dataset = project.create_dataset(_Question, "questions")
+    await dataset.aextend(
+        [_Question(id=i, question=f"Question {i}?") for i in range(size)],
+        max_concurrency=64,
+    )
+    server.latency = api_latency
+
+    @project.experiment(_Answer, save_to_git=False)
+    async def answer(item: _Question) -> _Answer:
+        reply = await llm.agenerate(item.question, _Reply)
+        return _Answer(id=item.id, question=item.question, answer=reply.answer)
+
+    tracing = tracemalloc.is_tracing()
+    if trace_memory:
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+    monitor = LoopLagMonitor()
+    monitor.start()
+    start = time.perf_counter()
+    try:
+        experiment = await answer.run_async(
+            dataset,
+            name=f"benchmark-{size}-{max_concurrency}",
+            max_concurrency=max_concurrency,
+            **run_kwargs,
+        )
+    finally:
+        elapsed = time.perf_counter() - start
+        monitor.stop()
+        peak_memory_mb = None
+        if trace_memory:
+            peak_memory_mb = (
+                tracemalloc.get_traced_memory()[1] - memory_before
+            ) / 2**20
+            if not tracing:
+                tracemalloc.stop()
+
+    ideal = max(llm.busy_seconds / min(max_concurrency, size), llm.longest_call)
+    summary = experiment.run_summary
+    return BenchmarkResult(
+        size=size,
+        max_concurrency=max_concurrency,
+        elapsed=elapsed,
+        items_per_second=size / elapsed,
+        llm_seconds=llm.busy_seconds,
+        ideal_seconds=ideal,
+        overhead_per_item=max(0.0, elapsed - ideal) / size,
+        loop_lag_p50=monitor.quantile(0.5),
+        loop_lag_p99=monitor.quantile(0.99),
+        loop_lag_max=monitor.max_lag,
+        peak_memory_mb=peak_memory_mb,
+        upload_lag_p95=summary.upload_lag_p95 if summary is not None else None,
+        errors=summary.errors if summary is not None else 0,
+    )
+
+
+async def run_benchmark(
+    sizes: t.Sequence[int] = (100, 1000),
+    concurrency: t.Sequence[int] = (16, 64),
+    llm_latency: t.Union[float, LatencyDistribution] = lognormal_latency(0.1),
+    api_latency: float = 0.005,
+    failure_rate: float = 0.0,
+    seed: int = 0,
+    trace_memory: bool = True,
+    **run_kwargs,
+) -> t.List[BenchmarkResult]:
+    """Run an experiment with a fake LLM and a fake Ragas API at every size and concurrency.
+
+    Args:
+        sizes: Numbers of items in the dataset
+        concurrency: Values of `max_concurrency` to run each size with
+        llm_latency: Seconds each LLM call takes, or a distribution to draw them from
+        api_latency: Seconds each request to the Ragas API takes
+        failure_rate: Fraction of LLM calls that fail
+        seed: Seed of the simulated latencies and failures
+        trace_memory: Measure peak memory with `tracemalloc`. It slows Python
+            down, so compare throughput only between runs with the same setting.
+        **run_kwargs: Passed to `run_async`, e.g. `retries`. Runs are not
+            checkpointed unless `checkpoint=True` is passed.
+    """
+    results = []
+    for size in sizes:
+        for max_concurrency in concurrency:
+            llm = FakeLLM(llm_latency, failure_rate=failure_rate, seed=seed)
+            results.append(
+                await _benchmark_once(
+                    size, max_concurrency, llm, api_latency, trace_memory, run_kwargs
+                )
+            )
+    return results
+
+# %% ../../nbs/project/benchmark.ipynb 17
+def save_benchmark(
+    results: t.Sequence[BenchmarkResult], path: t.Union[str, Path]
+) -> None:
+    """Save benchmark results as JSON, to use as a baseline."""
+    Path(path).write_text(json.dumps([r.to_dict() for r in results], indent=2))
+
+
+def find_regressions(
+    results: t.Sequence[BenchmarkResult],
+    baseline: t.Union[str, Path, t.Sequence[t.Dict[str, t.Any]]],
+    tolerance: float = 0.25,
+    min_overhead: float = 0.0005,
+) -> t.List[str]:
+    """Describe the configurations that got slower or bigger than in the baseline.
+
+    Configurations are matched by dataset size and concurrency; those missing
+    from the baseline are skipped.
+    """
+    if isinstance(baseline, (str, Path)):
+        baseline = json.loads(Path(baseline).read_text())
+    previous = {(b["size"], b["max_concurrency"]): b for b in baseline}
+
+    regressions = []
+    for result in results:
+        base = previous.get((result.size, result.max_concurrency))
+        if base is None:
+            continue
+        label = f"size={result.size} concurrency={result.max_concurrency}"
+        if result.items_per_second < base["items_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{label}: {result.items_per_second:.1f} items/s, "
+                f"was {base['items_per_second']:.1f}"
+            )
+        allowed = base["overhead_per_item"] * (1 + tolerance) + min_overhead
+        if result.overhead_per_item > allowed:
+            regressions.append(
+                f"{label}: {result.overhead_per_item * 1000:.2f} ms overhead per item, "
+                f"was {base['overhead_per_item'] * 1000:.2f}"
+            )
+        if (
+            result.peak_memory_mb is not None
+            and base.get("peak_memory_mb") is not None
+            and result.peak_memory_mb > base["peak_memory_mb"] * (1 + tolerance)
+        ):
+            regressions.append(
+                f"{label}: {result.peak_memory_mb:.1f} MB peak memory, "
+                f"was {base['peak_memory_mb']:.1f}"
+            )
+    return regressions
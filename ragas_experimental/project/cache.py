@@ -0,0 +1,261 @@
+"""Reuse the results of experiment items whose code and input did not change."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/project/cache.ipynb.
+
+# %% auto 0
+__all__ = ['DEFAULT_CACHE_DIR', 'logger', 'function_fingerprint', 'cache_key', 'ResultCache']
+
+# %% ../../nbs/project/cache.ipynb 3
+import dataclasses
+import inspect
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from ..utils import content_hash
+
+# %% ../../nbs/project/cache.ipynb 5
+_MAX_DEPTH = 4
+
+
+def _fingerprint_value(
+    value: t.Any, module: str, seen: t.Set[int], depth: int
+) -> t.Any:
+    """Turn a value into JSON-like content that only changes when the value does."""
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if depth > _MAX_DEPTH or id(value) in seen:
+        return type(value).__qualname__
+    if inspect.ismodule(value):
+        return value.__name__
+    if inspect.isclass(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    if inspect.isfunction(value) or inspect.ismethod(value):
+        return _function_parts(value, module, seen, depth)
+    seen = seen | {id(value)}
+    # containers do not count towards the depth, only the objects holding them
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = (
+            sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        )
+        return [_fingerprint_value(v, module, seen, depth) for v in items]
+    if isinstance(value, dict):
+        return {
+            str(k): _fingerprint_value(v, module, seen, depth) for k, v in value.items()
+        }
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if dataclasses.is_dataclass(value):
+        attributes = {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    else:
+        attributes = getattr(value, "__dict__", None)
+    if attributes is None:
+        # no content to look at, e.g. objects implemented in C
+        return type(value).__qualname__
+    return {
+        "type": type(value).__qualname__,
+        "attributes": _fingerprint_value(attributes, module, seen, depth + 1),
+    }
+
+
+def _global_names(code: t.Any) -> t.Set[str]:
+    """Names a code object, and the code nested in it, look up."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _global_names(const)
+    return names
+
+
+def _function_parts(
+    func: t.Callable, module: str, seen: t.Set[int], depth: int
+) -> t.Any:
+    func = inspect.unwrap(getattr(func, "__func__", func))
+    # functions from other modules, like libraries, are identified by name
+    if func.__module__ != module or id(func) in seen:
+        return f"{func.__module__}.{func.__qualname__}"
+    seen = seen | {id(func)}
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__code__.co_code.hex()
+    closure = [cell.cell_contents for cell in func.__closure__ or ()]
+    referenced = {
+        name: func.__globals__[name]
+        for name in sorted(_global_names(func.__code__))
+        if name in func.__globals__
+    }
+    return {
+        "source": source,
+        "defaults": _fingerprint_value(func.__defaults__, module, seen, depth + 1),
+        "closure": _fingerprint_value(closure, module, seen, depth + 1),
+        "globals": _fingerprint_value(referenced, module, seen, depth + 1),
+    }
+
+
+def function_fingerprint(func: t.Callable, config: t.Any = None) -> str:
+    """Hash the code of a function, the values it depends on and a declared `config`.
+
+    `config` is hashed like the values the function depends on, so metrics and
+    prompts passed in it are compared by their content. The fingerprint covers
+    the function as a whole: any change invalidates the results of every item.
+    """
+    module = inspect.unwrap(func).__module__
+    return content_hash(
+        {
+            "function": _function_parts(func, module, set(), 0),
+            "config": _fingerprint_value(config, module, set(), 0),
+        }
+    )
+
+# %% ../../nbs/project/cache.ipynb 9
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("RAGAS_CACHE_DIR", "~/.cache/ragas/results")
+).expanduser()
+
+_MISSING = object()
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(fingerprint: str, item: t.Any) -> str:
+    """Key the result of running a function with this fingerprint on `item`."""
+    content = item.model_dump(mode="json") if isinstance(item, BaseModel) else item
+    return content_hash([fingerprint, content])
+
+
+class ResultCache:
+    """Size-bounded disk cache of experiment results."""
+
+    def __init__(
+        self,
+        path: t.Optional[t.Union[str, Path]] = None,
+        max_size: int = 2**30,
+    ):
+        self.path = Path(path) if path is not None else DEFAULT_CACHE_DIR / "results.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS results_by_access ON results (accessed);
+            """)
+        self._size = self._total_size()
+
+    def _total_size(self) -> int:
+        return self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        """Get the result stored under `key`, or `default` if there is none."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            self._db.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            # e.g. written by an incompatible version of the code, compute it again
+            logger.warning("Dropping cached result %s that cannot be read: %r", key, e)
+            with self._lock:
+                self._delete(key)
+            return default
+
+    def _delete(self, key: str) -> None:
+        row = self._db.execute(
+            "SELECT size FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._size -= row[0]
+
+    def put(self, key: str, value: t.Any) -> None:
+        """Store a result, evicting the least recently used ones if the cache is full."""
+        data = pickle.dumps(value)
+        with self._lock:
+            # a result stored again under the same key replaces the old one
+            self._delete(key)
+            self._db.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        # other processes may have added or evicted results too
+        self._size = self._total_size()
+        evicted = []
+        rows = self._db.execute("SELECT key, size FROM results ORDER BY accessed")
+        for key, size in rows:
+            if self._size <= self.max_size:
+                break
+            evicted.append((key,))
+            self._size -= size
+        self._db.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+            self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    async def acall(self, fingerprint: str, func: t.Callable, item: t.Any) -> t.Any:
+        """Await `func(item)`, or get its result from the cache."""
+        key = cache_key(fingerprint, item)
+        result = self.get(key, _MISSING)
+        if result is _MISSING:
+            result = await func(item)
+            self.put(key, result)
+        return result
+
+    async def amap(
+        self,
+        fingerprint: str,
+        items: t.Sequence[t.Any],
+        run: t.Callable[[t.List[t.Any]], t.AsyncIterator[t.Tuple[int, t.Any]]],
+    ) -> t.AsyncIterator[t.Tuple[int, t.Any]]:
+        """Yield `(index, result)` for the items, running only those not in the cache.
+
+        `run` gets the items missing from the cache and yields `(index, result)`
+        for them, with indices into the list it got.
+        """
+        keys = [cache_key(fingerprint, item) for item in items]
+        misses = []
+        for index, key in enumerate(keys):
+            result = self.get(key, _MISSING)
+            if result is _MISSING:
+                misses.append(index)
+            else:
+                yield index, result
+        async for i, result in run([items[index] for index in misses]):
+            self.put(keys[misses[i]], result)
+            yield misses[i], result
+
+    def close(self) -> None:
+        self._db.close()
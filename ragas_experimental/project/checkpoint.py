@@ -0,0 +1,172 @@
+"""Journal the progress of experiment runs so they can be resumed."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/project/checkpoint.ipynb.
+
+# %% auto 0
+__all__ = ['DEFAULT_CHECKPOINT_DIR', 'checkpoint_path', 'item_key', 'input_row_ids', 'RunJournal']
+
+# %% ../../nbs/project/checkpoint.ipynb 3
+import json
+import os
+import typing as t
+from pathlib import Path
+
+from ..dataset import Dataset
+from ragas_experimental.model.pydantic_model import (
+    ExtendedPydanticBaseModel as BaseModel,
+)
+from ..utils import content_hash
+
+# %% ../../nbs/project/checkpoint.ipynb 5
+DEFAULT_CHECKPOINT_DIR = Path(
+    os.getenv("RAGAS_CHECKPOINT_DIR", "~/.cache/ragas/checkpoints")
+).expanduser()
+
+
+def checkpoint_path(
+    project_id: str, experiment_name: str, checkpoint_dir: t.Optional[Path] = None
+) -> Path:
+    """Get the path of the journal of an experiment run."""
+    return (
+        Path(checkpoint_dir or DEFAULT_CHECKPOINT_DIR)
+        / project_id
+        / f"{experiment_name}.jsonl"
+    )
+
+
+def item_key(item: BaseModel) -> str:
+    """Identify a dataset item across runs, by its row id or else its content."""
+    row_id = getattr(item, "_row_id", None)
+    return row_id if row_id else content_hash(item.model_dump())
+
+
+def input_row_ids(
+    items: t.Sequence[BaseModel], experiment_id: str
+) -> t.List[t.Optional[str]]:
+    """Get the row ids to store the results of the items under in an experiment.
+
+    The id of a result is derived from the experiment and from the id and the
+    content of its item, so the rows of an experiment tell which items it ran on
+    and which changed since, and no two experiments share row ids. Items that
+    repeat an earlier one get None, for a new random id.
+    """
+    row_ids, seen = [], set()
+    for item in items:
+        row_id = content_hash(
+            [experiment_id, item_key(item), item.model_dump(mode="json")]
+        )[:12]
+        row_ids.append(None if row_id in seen else row_id)
+        seen.add(row_id)
+    return row_ids
+
+# %% ../../nbs/project/checkpoint.ipynb 7
+class RunJournal:
+    """Append-only journal of the items an experiment run has finished.
+
+    Attributes:
+        experiment_id: Id of the experiment the results are uploaded to
+        uploaded: Keys of the items whose result is in the experiment, or that
+            had no result
+        pending: Row data of the results computed but not uploaded yet, by key
+    """
+
+    def __init__(self, path: t.Union[str, Path]):
+        self.path = Path(path)
+        self.experiment_id: t.Optional[str] = None
+        self.uploaded: t.Set[str] = set()
+        self.pending: t.Dict[str, t.Dict] = {}
+        self._file: t.Optional[t.TextIO] = None
+
+    @classmethod
+    def create(
+        cls, path: t.Union[str, Path], experiment_id: str, name: str
+    ) -> "RunJournal":
+        """Start the journal of a new run, replacing any previous one at `path`."""
+        journal = cls(path)
+        journal.path.parent.mkdir(parents=True, exist_ok=True)
+        journal._file = open(journal.path, "w", encoding="utf-8")
+        journal.experiment_id = experiment_id
+        journal._write({"type": "run", "experiment_id": experiment_id, "name": name})
+        return journal
+
+    @classmethod
+    def open(cls, path: t.Union[str, Path]) -> "RunJournal":
+        """Reopen the journal of an interrupted run to continue it."""
+        journal = cls(path)
+        if not journal.path.exists():
+            raise FileNotFoundError(f"No checkpoint found at {journal.path}")
+        complete = 0
+        with open(journal.path, "rb") as f:
+            for line in f:
+                # the last line may have been cut short by a crash
+                if not line.endswith(b"\n"):
+                    break
+                journal._replay(json.loads(line))
+                complete += len(line)
+        os.truncate(journal.path, complete)
+        journal._file = open(journal.path, "a", encoding="utf-8")
+        return journal
+
+    def _replay(self, record: t.Dict) -> None:
+        if record["type"] == "run":
+            self.experiment_id = record["experiment_id"]
+        elif record["type"] == "result":
+            self.pending[record["key"]] = record["data"]
+        elif record["type"] == "uploaded":
+            self.pending.pop(record["key"], None)
+            self.uploaded.add(record["key"])
+
+    def _write(self, record: t.Dict) -> None:
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    @property
+    def finished(self) -> t.Set[str]:
+        """Keys of the items that do not need to be run again."""
+        return self.uploaded | self.pending.keys()
+
+    def record_result(self, key: str, row_data: t.Dict) -> None:
+        """Record the result of an item, in the API data format."""
+        self.pending[key] = row_data
+        self._write({"type": "result", "key": key, "data": row_data})
+
+    def record_uploaded(self, key: str, row_id: t.Optional[str]) -> None:
+        """Record that the result of an item is in the experiment."""
+        self.pending.pop(key, None)
+        self.uploaded.add(key)
+        self._write({"type": "uploaded", "key": key, "row_id": row_id})
+
+    async def aentries_to_upload(
+        self, experiment: Dataset
+    ) -> t.AsyncIterator[t.Tuple[str, BaseModel]]:
+        """Yield the pending results that did not make it to the experiment.
+
+        Results whose upload finished before the journal could record it are
+        found by content in the experiment and marked as uploaded instead.
+        """
+        if not self.pending:
+            return
+        existing = {}
+        async for rows in experiment._aiter_row_pages():
+            for row in rows:
+                existing[content_hash(row.get("data", {}))] = row["id"]
+
+        await experiment._aresolve_column_mapping()
+        column_table = experiment._column_table()
+        for key, row_data in list(self.pending.items()):
+            row_id = existing.get(content_hash(row_data))
+            if row_id is not None:
+                self.record_uploaded(key, row_id)
+                continue
+            rows = [{"id": None, "data": row_data}]
+            yield key, experiment._decode_new_rows(rows, column_table)[0]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal, once the run has finished."""
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -9,15 +9,17 @@ __all__ = ['Project', 'create_dataset_columns']
 import typing as t
 import os
 import asyncio
+from pathlib import Path
 
 from fastcore.utils import patch
+from tqdm import tqdm
 from pydantic import BaseModel
 
 from ..backends.factory import RagasApiClientFactory
 from ..backends.ragas_api_client import RagasApiClient
 import ragas_experimental.typing as rt
 from ..utils import async_to_sync, create_nano_id
-from ..dataset import Dataset
+from ..dataset import Dataset, infer_format, iter_records
 from ..experiment import Experiment
 
 # %% ../../nbs/project/core.ipynb 5
@@ -50,7 +52,8 @@ class Project:
         description: str = "",
         ragas_api_client: t.Optional[RagasApiClient] = None,
     ):
-        ragas_api_client = RagasApiClientFactory.create()
+        if ragas_api_client is None:
+            ragas_api_client = RagasApiClientFactory.create()
         sync_version = async_to_sync(ragas_api_client.create_project)
         new_project = sync_version(title=name, description=description)
         return cls(new_project["id"], ragas_api_client)
@@ -174,3 +177,56 @@ def get_dataset(self: Project, dataset_name: str, model) -> Dataset:
         dataset_id=dataset_info["id"],
         ragas_api_client=self._ragas_api_client,
     )
+
+# %% ../../nbs/project/core.ipynb 21
+@patch
+def import_dataset(
+    self: Project,
+    path: t.Union[str, Path],
+    model: t.Type[BaseModel],
+    name: t.Optional[str] = None,
+    format: t.Optional[str] = None,
+    batch_size: int = 1000,
+    max_concurrency: int = 16,
+    progress: bool = True,
+) -> Dataset:
+    """Create a new dataset from a JSONL, CSV or Parquet file.
+
+    The file is read and uploaded `batch_size` rows at a time, so memory use does not
+    grow with the size of the file.
+
+    Args:
+        path: File to read from
+        model: Model class defining the dataset structure
+        name: Name of the dataset, defaults to the file name
+        format: One of "jsonl", "csv" or "parquet", inferred from the suffix by default
+        batch_size: Number of rows read, validated and uploaded together
+        max_concurrency: Maximum number of rows being created at once
+        progress: Show a progress bar
+
+    Returns:
+        Dataset: The new dataset. Its entries are not loaded.
+    """
+    format = infer_format(path, format)
+    dataset = self.create_dataset(
+        model=model, name=name if name is not None else Path(path).stem
+    )
+
+    async def _upload():
+        with tqdm(
+            desc=f"Importing {dataset.name}", unit="rows", disable=not progress
+        ) as progress_bar:
+            for records in iter_records(
+                path, format, chunk_size=batch_size, model=model
+            ):
+                entries = dataset._records_to_entries(records)
+                results = await dataset._acreate_rows(
+                    entries, max_concurrency=max_concurrency
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                progress_bar.update(len(entries))
+
+    async_to_sync(_upload)()
+    return dataset
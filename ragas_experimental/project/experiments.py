@@ -3,14 +3,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/project/experiments.ipynb.
 
 # %% auto 0
-__all__ = ['memorable_names', 'create_experiment_columns', 'find_git_root', 'version_experiment', 'cleanup_experiment_branches',
-           'ExperimentProtocol']
+__all__ = ['memorable_names', 'create_experiment_columns', 'find_git_root', 'version_experiment', 'snapshot_experiment',
+           'cleanup_experiment_branches', 'cleanup_experiment_snapshots', 'ExperimentProtocol']
 
 # %% ../../nbs/project/experiments.ipynb 2
 from tqdm import tqdm
 from functools import wraps
 import asyncio
-from tqdm import tqdm
+import inspect
+import warnings
+from contextlib import AsyncExitStack
 
 import typing as t
 
@@ -20,9 +22,17 @@ from .core import Project
 from ragas_experimental.model.pydantic_model import (
     ExtendedPydanticBaseModel as BaseModel,
 )
-from ..utils import async_to_sync, create_nano_id
+from ..utils import async_to_sync, content_hash, create_nano_id
 from ..dataset import Dataset, BaseModelType
 from ..experiment import Experiment
+from .scheduler import map_bounded, map_in_processes, guarded
+from .checkpoint import RunJournal, checkpoint_path
+from .checkpoint import input_row_ids, item_key
+from .work_queue import WorkQueue, default_worker_id
+from .cache import ResultCache, function_fingerprint
+from ..llm.quota import current_tenant
+from ..exceptions import ApiConflictError
+from .telemetry import RunStats, RunTelemetry
 import ragas_experimental.typing as rt
 
 # %% ../../nbs/project/experiments.ipynb 4
@@ -119,11 +129,57 @@ def get_experiment(self: Project, experiment_name: str, model) -> Dataset:
         ragas_api_client=self._ragas_api_client,
     )
 
-# %% ../../nbs/project/experiments.ipynb 16
+# %% ../../nbs/project/experiments.ipynb 15
+@patch
+def merge_experiments(
+    self: Project,
+    experiments: t.List[Experiment],
+    name: str,
+    max_concurrency: int = 16,
+    batch_size: int = 100,
+) -> Experiment:
+    """Combine the results of several experiments into a new one.
+
+    This is how the results of workers that each ran on one shard of a dataset
+    are brought back together.
+
+    Args:
+        experiments: Experiments to merge, all using the same model
+        name: Name of the merged experiment
+        max_concurrency: Maximum number of rows being created at once
+        batch_size: Number of rows held in memory while copying
+
+    Returns:
+        Experiment: The merged experiment
+    """
+    models = {experiment.model for experiment in experiments}
+    if len(models) != 1:
+        raise ValueError("Can only merge experiments that use the same model")
+    merged = self.create_experiment(name=name, model=models.pop())
+
+    async def _copy():
+        batch = []
+        for experiment in experiments:
+            async for entry in experiment:
+                # copies, so the row ids of the source entries are left alone
+                batch.append(entry.model_copy())
+                if len(batch) >= batch_size:
+                    await merged.aextend(batch, max_concurrency=max_concurrency)
+                    batch = []
+        if batch:
+            await merged.aextend(batch, max_concurrency=max_concurrency)
+
+    async_to_sync(_copy)()
+    return merged
+
+# %% ../../nbs/project/experiments.ipynb 17
+import os
+import shutil
+import tempfile
 import git
 from pathlib import Path
 
-# %% ../../nbs/project/experiments.ipynb 17
+# %% ../../nbs/project/experiments.ipynb 18
 def find_git_root(
     start_path: t.Union[str, Path, None] = None,  # starting path to search from
 ) -> Path:
@@ -150,7 +206,7 @@ def find_git_root(
     # No git repository found
     raise ValueError(f"No git repository found in or above {start_path}")
 
-# %% ../../nbs/project/experiments.ipynb 20
+# %% ../../nbs/project/experiments.ipynb 21
 def version_experiment(
     experiment_name: str,
     commit_message: t.Optional[str] = None,
@@ -202,7 +258,56 @@ def version_experiment(
 
     return commit_hash
 
-# %% ../../nbs/project/experiments.ipynb 21
+# %% ../../nbs/project/experiments.ipynb 22
+def snapshot_experiment(
+    experiment_name: str,
+    commit_message: t.Optional[str] = None,
+    repo_path: t.Union[str, Path, None] = None,
+    include_untracked: bool = True,
+) -> str:
+    """Record the current state of the codebase for an experiment without touching the index or branches.
+
+    The work tree is written as a commit on top of HEAD that is kept under
+    `refs/ragas/<experiment_name>`, so `git checkout ragas/<experiment_name>`
+    brings it back. Files are added to a copy of the index, which keeps the
+    sizes and modification times git cached for them: only files that changed
+    since are read and hashed. It is safe to keep working in the repo meanwhile.
+    """
+    if repo_path is None:
+        repo_path = find_git_root()
+    repo = git.Repo(repo_path)
+    git_dir = Path(repo.git_dir)
+
+    fd, index_path = tempfile.mkstemp(prefix="ragas-index-", dir=git_dir)
+    os.close(fd)
+    try:
+        if (git_dir / "index").exists():
+            shutil.copyfile(git_dir / "index", index_path)
+        else:
+            # git starts a new index when the file does not exist, not when it is empty
+            os.remove(index_path)
+        env = {"GIT_INDEX_FILE": index_path}
+        repo.git.add("--all" if include_untracked else "--update", env=env)
+        tree = repo.git.write_tree(env=env)
+    finally:
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+    head = repo.head.commit if repo.head.is_valid() else None
+    if head is not None and head.tree.hexsha == tree:
+        # No changes, the snapshot is the current HEAD
+        commit_hash = head.hexsha
+    else:
+        if commit_message is None:
+            commit_message = f"Experiment: {experiment_name}"
+        parents = ["-p", head.hexsha] if head is not None else []
+        commit_hash = repo.git.commit_tree(tree, *parents, "-m", commit_message)
+
+    repo.git.update_ref(f"refs/ragas/{experiment_name}", commit_hash)
+    print(f"Snapshot {commit_hash[:8]} saved as refs/ragas/{experiment_name}")
+    return commit_hash
+
+# %% ../../nbs/project/experiments.ipynb 24
 def cleanup_experiment_branches(
     prefix: str = "ragas/",
     repo_path: t.Union[str, Path, None] = None,
@@ -281,19 +386,140 @@ def cleanup_experiment_branches(
 
     return deleted_branches
 
-# %% ../../nbs/project/experiments.ipynb 24
+# %% ../../nbs/project/experiments.ipynb 25
+def cleanup_experiment_snapshots(
+    prefix: str = "",
+    repo_path: t.Union[str, Path, None] = None,
+    interactive: bool = True,
+    dry_run: bool = False,
+) -> t.List[str]:
+    """Clean up the snapshots of experiments whose name starts with the prefix."""
+    # Find the git repository root if not provided
+    if repo_path is None:
+        try:
+            repo_path = find_git_root()
+        except ValueError as e:
+            raise ValueError(f"Cannot cleanup snapshots: {str(e)}")
+
+    repo = git.Repo(repo_path)
+    refs = repo.git.for_each_ref("--format=%(refname)", "refs/ragas/").split()
+    matching_refs = [
+        ref for ref in refs if ref[len("refs/ragas/") :].startswith(prefix)
+    ]
+
+    if not matching_refs:
+        print(f"No snapshots found with prefix '{prefix}'")
+        return []
+
+    print(f"Found {len(matching_refs)} snapshots with prefix '{prefix}':")
+    for ref in matching_refs:
+        print(f"- {ref}")
+
+    if interactive and not dry_run:
+        confirm = (
+            input(f"\nDelete these {len(matching_refs)} snapshots? (y/n): ")
+            .strip()
+            .lower()
+        )
+        if confirm != "y":
+            print("Operation cancelled")
+            return []
+
+    deleted_refs = []
+    for ref in matching_refs:
+        if dry_run:
+            print(f"Would delete snapshot: {ref}")
+            deleted_refs.append(ref)
+        else:
+            try:
+                repo.git.update_ref("-d", ref)
+                print(f"Deleted snapshot: {ref}")
+                deleted_refs.append(ref)
+            except git.GitCommandError as e:
+                print(f"Error deleting snapshot '{ref}': {str(e)}")
+
+    if dry_run:
+        print(f"\nDry run complete. {len(deleted_refs)} snapshots would be deleted.")
+    else:
+        print(f"\nCleanup complete. {len(deleted_refs)} snapshots deleted.")
+
+    return deleted_refs
+
+# %% ../../nbs/project/experiments.ipynb 29
 @t.runtime_checkable
 class ExperimentProtocol(t.Protocol):
     async def __call__(self, *args, **kwargs): ...
-    async def run_async(self, name: str, dataset: Dataset): ...
-
-# %% ../../nbs/project/experiments.ipynb 25
+    async def run_async(
+        self,
+        dataset: Dataset,
+        name: t.Optional[str] = None,
+        save_to_git: bool = True,
+        stage_all: bool = True,
+        max_concurrency: int = 16,
+        rate: t.Optional[float] = None,
+        timeout: t.Optional[float] = None,
+        retries: int = 0,
+        speculate_after: t.Optional[float] = None,
+        checkpoint: bool = False,
+        resume: t.Optional[str] = None,
+        incremental_from: t.Optional[t.Union[str, Experiment]] = None,
+        executor: t.Literal["async", "process"] = "async",
+        workers: t.Optional[int] = None,
+        initializer: t.Optional[t.Callable[[], t.Any]] = None,
+        observers: t.Sequence[t.Callable[[RunStats], None]] = (),
+        log_path: t.Optional[t.Union[str, Path]] = None,
+        report_interval: float = 5.0,
+        keep_results: bool = False,
+    ): ...
+    async def publish_async(
+        self,
+        dataset: Dataset,
+        queue: t.Union[WorkQueue, str, Path],
+        name: t.Optional[str] = None,
+        save_to_git: bool = True,
+        stage_all: bool = True,
+    ) -> str: ...
+    async def work_async(
+        self,
+        queue: t.Union[WorkQueue, str, Path],
+        name: str,
+        worker_id: t.Optional[str] = None,
+        max_concurrency: int = 16,
+        timeout: t.Optional[float] = None,
+        speculate_after: t.Optional[float] = None,
+        lease_seconds: float = 60,
+        poll_interval: float = 5,
+        observers: t.Sequence[t.Callable[[RunStats], None]] = (),
+        log_path: t.Optional[t.Union[str, Path]] = None,
+        report_interval: float = 5.0,
+    ) -> t.Dict[str, int]: ...
+    async def run_sweep(
+        self,
+        dataset: Dataset,
+        variants: t.Union[
+            t.Sequence[t.Dict[str, t.Any]], t.Dict[str, t.Dict[str, t.Any]]
+        ],
+        name: t.Optional[str] = None,
+        save_to_git: bool = True,
+        stage_all: bool = True,
+        max_concurrency: int = 16,
+        rate: t.Optional[float] = None,
+        timeout: t.Optional[float] = None,
+        retries: int = 0,
+        speculate_after: t.Optional[float] = None,
+        observers: t.Sequence[t.Callable[[RunStats], None]] = (),
+        log_path: t.Optional[t.Union[str, Path]] = None,
+        report_interval: float = 5.0,
+        keep_results: bool = False,
+    ) -> t.Dict[str, Experiment]: ...
+
+# %% ../../nbs/project/experiments.ipynb 30
 from .naming import MemorableNames
 
-# %% ../../nbs/project/experiments.ipynb 26
+# %% ../../nbs/project/experiments.ipynb 31
 memorable_names = MemorableNames()
 
-# %% ../../nbs/project/experiments.ipynb 27
+# %% ../../nbs/project/experiments.ipynb 32
 @patch
 def experiment(
     self: Project,
@@ -301,12 +527,25 @@ def experiment(
     name_prefix: str = "",
     save_to_git: bool = True,
     stage_all: bool = True,
+    cache: t.Union[bool, ResultCache] = False,
+    config: t.Any = None,
+    versioning: t.Literal["branch", "snapshot"] = "branch",
 ):
     """Decorator for creating experiment functions without Langfuse integration.
 
     Args:
         experiment_model: The NotionModel type to use for experiment results
         name_prefix: Optional prefix for experiment names
+        cache: Reuse the results of items whose input and function did not
+            change since a previous run. Pass a `ResultCache` to choose where
+            results are stored and how much space they take.
+        config: Settings the results depend on that are not visible in the
+            function's code, e.g. the name of the model or the metrics used, to
+            key cached results by. Objects are compared by their attributes.
+        versioning: How `save_to_git` records the code. "branch" commits the
+            changes and creates a branch per experiment. "snapshot" stores the
+            work tree as a commit under `refs/ragas/` without touching the index
+            or the branches, in the background while the experiment runs.
 
     Returns:
         Decorator function that wraps experiment functions
@@ -316,7 +555,52 @@ def experiment(
         @wraps(func)
         async def wrapped_experiment(*args, **kwargs):
             # Simply call the function without Langfuse observation
-            return await func(*args, **kwargs)
+            result = func(*args, **kwargs)
+            return await result if inspect.isawaitable(result) else result
+
+        if isinstance(cache, ResultCache):
+            result_cache = cache
+        else:
+            result_cache = ResultCache() if cache else None
+
+        def fingerprint():
+            # computed when a run starts, to see the current values of globals
+            return function_fingerprint(
+                func,
+                {"config": config, "model": experiment_model.model_json_schema()},
+            )
+
+        def start_versioning(name, stage_all):
+            # snapshots are taken in a thread while the items run and upload
+            if versioning != "snapshot":
+                return None
+            return asyncio.ensure_future(
+                asyncio.to_thread(
+                    snapshot_experiment,
+                    name,
+                    repo_path=find_git_root(),
+                    include_untracked=stage_all,
+                )
+            )
+
+        async def discard_versioning(name, snapshot):
+            # the thread cannot be stopped, so wait for it and delete its snapshot
+            if snapshot is None:
+                return
+            try:
+                await snapshot
+                repo = git.Repo(find_git_root())
+                await asyncio.to_thread(repo.git.update_ref, "-d", f"refs/ragas/{name}")
+            except Exception as e:
+                print(f"Failed to delete the snapshot of '{name}': {e}")
+
+        async def finish_versioning(name, stage_all, snapshot):
+            if snapshot is not None:
+                await snapshot
+            else:
+                version_experiment(
+                    experiment_name=name, repo_path=find_git_root(), stage_all=stage_all
+                )
 
         # Add run method to the wrapped function
         async def run_async(
@@ -324,51 +608,247 @@ def experiment(
             name: t.Optional[str] = None,
             save_to_git: bool = save_to_git,
             stage_all: bool = stage_all,
+            max_concurrency: int = 16,
+            rate: t.Optional[float] = None,
+            timeout: t.Optional[float] = None,
+            retries: int = 0,
+            speculate_after: t.Optional[float] = None,
+            checkpoint: bool = False,
+            resume: t.Optional[str] = None,
+            incremental_from: t.Optional[t.Union[str, Experiment]] = None,
+            executor: t.Literal["async", "process"] = "async",
+            workers: t.Optional[int] = None,
+            initializer: t.Optional[t.Callable[[], t.Any]] = None,
+            observers: t.Sequence[t.Callable[[RunStats], None]] = (),
+            log_path: t.Optional[t.Union[str, Path]] = None,
+            report_interval: float = 5.0,
+            keep_results: bool = False,
         ):
-            # if name is not provided, generate a memorable name
-            if name is None:
-                name = memorable_names.generate_unique_name()
-            if name_prefix:
-                name = f"{name_prefix}-{name}"
+            """Run the experiment on every item of the dataset.
+
+            Args:
+                dataset: Items to run the experiment on
+                name: Name of the experiment, a memorable name by default
+                save_to_git: Commit the state of the repo for this experiment
+                stage_all: Stage all changes before committing
+                max_concurrency: Maximum number of items processed at once
+                rate: Maximum number of items started per second, unlimited by default
+                timeout: Seconds an item may take before it is cancelled and
+                    counted as failed
+                retries: Number of times a failed or timed out item is tried again
+                speculate_after: Quantile of the latencies seen so far, e.g. 0.95,
+                    after which a straggling item is started a second time. The
+                    first result wins and the other call is cancelled.
+                checkpoint: Journal finished items so that a failed run is kept and
+                    can be resumed. Off by default, a failed run then deletes its
+                    experiment.
+                resume: Name of an interrupted run to continue. Items it finished
+                    are skipped and new results go to its experiment.
+                incremental_from: A previous experiment of this function, or its
+                    name. Only the items that are new or changed since it ran are
+                    run, the results of the others are copied from it.
+                executor: "async" runs the function on this event loop. "process"
+                    runs it in a pool of worker processes, for CPU-bound functions
+                    defined at the top level of a module. Tracing wrappers are not
+                    applied in the workers.
+                workers: Number of worker processes, the number of CPUs by default
+                initializer: Called once in every worker process before it runs
+                    items, e.g. to load a model
+                observers: Called with a `RunStats` snapshot every `report_interval`
+                    seconds and with the final summary of the run
+                log_path: File to append the snapshots to, as JSON lines
+                report_interval: Seconds between snapshots
+                keep_results: Also keep the results in the returned experiment. By
+                    default they are only uploaded, so memory does not grow with the
+                    dataset; call `load()` on the experiment to read them back.
+            """
+            if executor not in ("async", "process"):
+                raise ValueError(
+                    f"Unknown executor {executor!r}, use 'async' or 'process'"
+                )
+            if executor == "process" and (
+                rate is not None
+                or timeout is not None
+                or retries
+                or speculate_after is not None
+            ):
+                raise ValueError(
+                    "rate, timeout, retries and speculate_after are only supported with executor='async'"
+                )
+            if resume is not None:
+                name = resume
+            else:
+                # if name is not provided, generate a memorable name
+                if name is None:
+                    name = memorable_names.generate_unique_name()
+                if name_prefix:
+                    name = f"{name_prefix}-{name}"
 
             experiment_view = None
+            journal = None
+            progress_bar = None
+            telemetry = RunTelemetry(name, observers, log_path, report_interval)
+            snapshot = start_versioning(name, stage_all) if save_to_git else None
+            # LLM calls of this run share quotas fairly with other runs
+            tenant = current_tenant.set(name)
             try:
-                # Create the experiment view upfront
-                experiment_view = self.create_experiment(
-                    name=name, model=experiment_model
-                )
+                if resume is not None:
+                    # Reattach to the experiment of the interrupted run
+                    journal = RunJournal.open(checkpoint_path(self.project_id, name))
+                    experiment_view = self.get_experiment_by_id(
+                        journal.experiment_id, experiment_model
+                    )
+                else:
+                    # Create the experiment view upfront
+                    experiment_view = self.create_experiment(
+                        name=name, model=experiment_model
+                    )
+                    if checkpoint:
+                        journal = RunJournal.create(
+                            checkpoint_path(self.project_id, name),
+                            experiment_id=experiment_view.experiment_id,
+                            name=name,
+                        )
 
-                # Create tasks for all items
-                tasks = []
-                for item in dataset:
-                    tasks.append(wrapped_experiment(item))
+                items = list(dataset)
+                keys = [item_key(item) for item in items]
+                # results are stored under ids derived from their items
+                row_ids = input_row_ids(items, experiment_view.experiment_id)
+                row_id_by_key = dict(zip(keys, row_ids))
+
+                # Skip the items a previous attempt already finished
+                if journal is not None:
+                    todo = [
+                        i for i, key in enumerate(keys) if key not in journal.finished
+                    ]
+                    items, keys, row_ids = (
+                        [xs[i] for i in todo] for xs in (items, keys, row_ids)
+                    )
+
+                # Copy the results of the items that did not change since the base
+                # experiment, found by the row ids they have in it
+                reused = []
+                if incremental_from is not None:
+                    base = incremental_from
+                    if not isinstance(base, Experiment):
+                        base = self.get_experiment(base, experiment_model)
+                    base_row_ids = input_row_ids(items, base.experiment_id)
+                    positions = {
+                        row_id: i
+                        for i, row_id in enumerate(base_row_ids)
+                        if row_id is not None
+                    }
+                    reused_positions = set()
+                    base_size = 0
+                    async for entry in base:
+                        base_size += 1
+                        i = positions.pop(entry._row_id, None)
+                        if i is not None:
+                            reused_positions.add(i)
+                            reused.append((keys[i], row_ids[i], entry.model_copy()))
+                    if base_size and not reused:
+                        warnings.warn(
+                            f"None of the {base_size} results of '{base.name}' match an item "
+                            "of the dataset, so every item is run again. Experiments run "
+                            "before results were stored under ids derived from their items "
+                            "cannot be used as a base."
+                        )
+                    todo = [i for i in range(len(items)) if i not in reused_positions]
+                    items, keys, row_ids = (
+                        [xs[i] for i in todo] for xs in (items, keys, row_ids)
+                    )
 
-                # Calculate total operations (processing + appending)
-                total_operations = (
-                    len(tasks) * 2
-                )  # Each item requires processing and appending
+                # Calculate total operations (processing + appending), reused results
+                # are only appended
+                total_operations = len(items) * 2 + len(reused)
 
                 # Use tqdm for combined progress tracking
-                results = []
                 progress_bar = tqdm(total=total_operations, desc="Running experiment")
+                if incremental_from is not None:
+                    progress_bar.set_postfix(reused=len(reused), new=len(items))
+                telemetry.start()
 
-                # Process all items
-                for future in asyncio.as_completed(tasks):
-                    result = await future
-                    if result is not None:
-                        results.append(result)
-                    progress_bar.update(1)  # Update for task completion
+                # the item key of each result waiting to be uploaded
+                upload_keys = {}
 
-                # Append results to experiment view
-                for result in results:
-                    experiment_view.append(result)
+                def on_append(entry):
                     progress_bar.update(1)  # Update for append operation
+                    telemetry.result_uploaded(entry)
+                    key = upload_keys.pop(id(entry), None)
+                    if journal is not None and key is not None:
+                        journal.record_uploaded(key, entry._row_id)
+
+                # Process all items, with at most max_concurrency in flight, and
+                # upload the results in the background as they complete
+                async with experiment_view.appender(
+                    on_append=on_append, keep_entries=keep_results
+                ) as appender:
+                    if journal is not None:
+                        async for key, entry in journal.aentries_to_upload(
+                            experiment_view
+                        ):
+                            progress_bar.total += 1
+                            upload_keys[id(entry)] = key
+                            telemetry.result_ready(entry)
+                            await appender.put(entry, row_id_by_key.get(key))
+
+                    for key, row_id, entry in reused:
+                        if journal is not None:
+                            journal.record_result(
+                                key, experiment_view._entry_to_row_data(entry)
+                            )
+                            upload_keys[id(entry)] = key
+                        await appender.put(entry, row_id)
+
+                    def run_items(items):
+                        if executor == "process":
+                            return map_in_processes(
+                                func, items, workers=workers, initializer=initializer
+                            )
+                        return map_bounded(
+                            guarded(
+                                telemetry.timed(wrapped_experiment),
+                                timeout,
+                                retries,
+                                speculate_after,
+                                on_retry=telemetry.retried,
+                            ),
+                            items,
+                            max_concurrency=max_concurrency,
+                            rate=rate,
+                        )
 
-                progress_bar.close()
+                    if result_cache is not None:
+                        outcomes = result_cache.amap(fingerprint(), items, run_items)
+                    else:
+                        outcomes = run_items(items)
+                    async for index, result in outcomes:
+                        progress_bar.update(1)  # Update for task completion
+                        telemetry.item_completed()
+                        if journal is not None and result is None:
+                            journal.record_uploaded(keys[index], None)
+                        elif result is not None:
+                            if id(result) in upload_keys or result._row_id is not None:
+                                # the same object was returned for another item
+                                result = result.model_copy()
+                            if journal is not None:
+                                row_data = experiment_view._entry_to_row_data(result)
+                                journal.record_result(keys[index], row_data)
+                            upload_keys[id(result)] = keys[index]
+                            telemetry.result_ready(result)
+                            await appender.put(result, row_ids[index])
 
             except Exception as e:
+                await discard_versioning(name, snapshot)
+                if journal is not None:
+                    # Keep the experiment and the journal so the run can be resumed
+                    journal.close()
+                    print(
+                        f"Experiment '{name}' failed, finished items are saved. "
+                        f"Resume it with run_async(dataset, resume='{name}')"
+                    )
                 # Clean up the experiment if there was an error and it was created
-                if experiment_view is not None:
+                elif experiment_view is not None:
                     try:
                         # Delete the experiment (you might need to implement this method)
                         sync_version = async_to_sync(
@@ -385,26 +865,359 @@ def experiment(
 
                 # Re-raise the original exception
                 raise e
+            finally:
+                if progress_bar is not None:
+                    progress_bar.close()
+                current_tenant.reset(tenant)
+                summary = telemetry.stop()
+                if experiment_view is not None:
+                    experiment_view.run_summary = summary
+                if journal is not None:
+                    journal.close()
+
+            # the run is complete, its journal is no longer needed
+            if journal is not None:
+                journal.remove()
 
             # save to git if requested
             if save_to_git:
-                repo_path = find_git_root()
-                version_experiment(
-                    experiment_name=name, repo_path=repo_path, stage_all=stage_all
-                )
+                await finish_versioning(name, stage_all, snapshot)
 
             return experiment_view
 
+        async def publish_async(
+            dataset: Dataset,
+            queue: t.Union[WorkQueue, str, Path],
+            name: t.Optional[str] = None,
+            save_to_git: bool = save_to_git,
+            stage_all: bool = stage_all,
+        ) -> str:
+            """Publish a run of the experiment for workers to pick up.
+
+            Creates the experiment and puts every item of the dataset on the queue.
+            Start `work_async` with the returned name on each machine to run it.
+
+            Args:
+                dataset: Items to run the experiment on
+                queue: Work queue, or the path of its database on a shared disk
+                name: Name of the experiment, a memorable name by default
+                save_to_git: Commit the state of the repo for this experiment
+                stage_all: Stage all changes before committing
+            """
+            if name is None:
+                name = memorable_names.generate_unique_name()
+            if name_prefix:
+                name = f"{name_prefix}-{name}"
+            if not isinstance(queue, WorkQueue):
+                queue = WorkQueue(queue)
+
+            try:
+                experiment_id = queue.experiment_id(name)
+            except KeyError:
+                experiment_id = self.create_experiment(
+                    name=name, model=experiment_model
+                ).experiment_id
+            # publishing the same run again only adds the items it is missing
+            queue.publish(
+                name, experiment_id, ((item_key(item), item) for item in dataset)
+            )
+
+            if save_to_git:
+                await finish_versioning(
+                    name, stage_all, start_versioning(name, stage_all)
+                )
+            return name
+
+        async def work_async(
+            queue: t.Union[WorkQueue, str, Path],
+            name: str,
+            worker_id: t.Optional[str] = None,
+            max_concurrency: int = 16,
+            timeout: t.Optional[float] = None,
+            speculate_after: t.Optional[float] = None,
+            lease_seconds: float = 60,
+            poll_interval: float = 5,
+            observers: t.Sequence[t.Callable[[RunStats], None]] = (),
+            log_path: t.Optional[t.Union[str, Path]] = None,
+            report_interval: float = 5.0,
+        ) -> t.Dict[str, int]:
+            """Work on a published run until none of its items are left.
+
+            Items are leased from the queue a batch at a time and their leases are
+            renewed while they run. The result of an item is uploaded with a row id
+            derived from the item, so it lands in the experiment exactly once even
+            when a worker dies and another one takes the item over. An item that
+            fails is retried until the queue's `max_attempts` is reached.
+
+            Args:
+                queue: Work queue, or the path of its database on a shared disk
+                name: Name of the run returned by `publish_async`
+                worker_id: Identifies this worker, the host name and process id by
+                    default
+                max_concurrency: Maximum number of items processed at once
+                timeout: Seconds an item may take before it is given back to the
+                    queue as failed
+                speculate_after: Quantile of the latencies seen so far after which
+                    a straggling item is started a second time
+                lease_seconds: How long a lease lasts without a heartbeat
+                poll_interval: Seconds to wait for the items other workers hold
+                observers: Called with a `RunStats` snapshot every `report_interval`
+                    seconds and with the final summary of this worker's part of the run
+                log_path: File to append the snapshots to, as JSON lines
+                report_interval: Seconds between snapshots
+
+            Returns:
+                The number of items of the run in each state
+            """
+            if not isinstance(queue, WorkQueue):
+                queue = WorkQueue(queue)
+            worker_id = worker_id or default_worker_id()
+            experiment_view = self.get_experiment_by_id(
+                queue.experiment_id(name), experiment_model
+            )
+            held = set()
+            telemetry = RunTelemetry(name, observers, log_path, report_interval)
+            run_item = guarded(
+                telemetry.timed(wrapped_experiment),
+                timeout,
+                speculate_after=speculate_after,
+            )
+            compute = run_item
+            if result_cache is not None:
+                key = fingerprint()
+                compute = lambda item: result_cache.acall(key, run_item, item)
+
+            async def heartbeat():
+                while True:
+                    await asyncio.sleep(lease_seconds / 3)
+                    queue.heartbeat(name, worker_id, list(held), lease_seconds)
+
+            async def process(lease):
+                try:
+                    result = await compute(lease.item)
+                    if result is not None:
+                        row_id = input_row_ids(
+                            [lease.item], experiment_view.experiment_id
+                        )[0]
+                        # an earlier lease may have uploaded it before expiring
+                        if lease.attempt == 1 or not (
+                            await experiment_view._arow_exists(row_id)
+                        ):
+                            telemetry.result_ready(result)
+                            try:
+                                await experiment_view._aappend(
+                                    result, row_id, keep=False
+                                )
+                            except ApiConflictError:
+                                # another worker uploaded it since the check
+                                pass
+                            telemetry.result_uploaded(result)
+                except Exception as e:
+                    queue.fail(name, worker_id, lease.key, repr(e))
+                else:
+                    queue.complete(name, lease.key)
+                    telemetry.item_completed()
+                held.discard(lease.key)
+
+            beat = asyncio.create_task(heartbeat())
+            tenant = current_tenant.set(name)
+            progress_bar = tqdm(desc=f"Working on {name}")
+            telemetry.start()
+            try:
+                while True:
+                    leases = queue.lease(
+                        name, worker_id, max_concurrency, lease_seconds
+                    )
+                    if not leases:
+                        status = queue.status(name)
+                        if status["pending"] + status["leased"] == 0:
+                            break
+                        # wait for the other workers to finish, or their leases to expire
+                        await asyncio.sleep(poll_interval)
+                        continue
+                    held.update(lease.key for lease in leases)
+                    async for _ in map_bounded(
+                        process, leases, max_concurrency=max_concurrency
+                    ):
+                        progress_bar.update(1)
+            finally:
+                current_tenant.reset(tenant)
+                telemetry.stop()
+                beat.cancel()
+                progress_bar.close()
+            return queue.status(name)
+
+        async def run_sweep(
+            dataset: Dataset,
+            variants: t.Union[
+                t.Sequence[t.Dict[str, t.Any]], t.Dict[str, t.Dict[str, t.Any]]
+            ],
+            name: t.Optional[str] = None,
+            save_to_git: bool = save_to_git,
+            stage_all: bool = stage_all,
+            max_concurrency: int = 16,
+            rate: t.Optional[float] = None,
+            timeout: t.Optional[float] = None,
+            retries: int = 0,
+            speculate_after: t.Optional[float] = None,
+            observers: t.Sequence[t.Callable[[RunStats], None]] = (),
+            log_path: t.Optional[t.Union[str, Path]] = None,
+            report_interval: float = 5.0,
+            keep_results: bool = False,
+        ) -> t.Dict[str, Experiment]:
+            """Run the experiment once per variant, with one experiment per variant.
+
+            The dataset is read once and the items of all variants go through one
+            scheduler, so the variants run side by side instead of one after the
+            other. If the sweep fails, the experiments it created are deleted.
+
+            Args:
+                dataset: Items to run the experiment on
+                variants: Keyword arguments to call the experiment function with,
+                    one dict per variant. Variants given as a dict of dicts are
+                    named by their keys, otherwise they are numbered.
+                name: Name of the sweep, a memorable name by default. Each variant's
+                    experiment is named after the sweep and the variant.
+                save_to_git: Commit the state of the repo for this sweep
+                stage_all: Stage all changes before committing
+                max_concurrency: Maximum number of items processed at once, over
+                    all variants
+                rate: Maximum number of items started per second, unlimited by default
+                timeout: Seconds an item may take before it is cancelled and
+                    counted as failed
+                retries: Number of times a failed or timed out item is tried again
+                speculate_after: Quantile of the latencies seen so far after which
+                    a straggling item is started a second time
+                observers: Called with a `RunStats` snapshot of the whole sweep
+                    every `report_interval` seconds and with its final summary
+                log_path: File to append the snapshots to, as JSON lines
+                report_interval: Seconds between snapshots
+                keep_results: Also keep the results in the returned experiments,
+                    see `run_async`
+
+            Returns:
+                The experiment of each variant, by variant name
+            """
+            if isinstance(variants, dict):
+                named_variants = list(variants.items())
+            else:
+                named_variants = [
+                    (f"v{i}", kwargs) for i, kwargs in enumerate(variants)
+                ]
+            if not named_variants:
+                raise ValueError("run_sweep needs at least one variant")
+            if name is None:
+                name = memorable_names.generate_unique_name()
+            if name_prefix:
+                name = f"{name_prefix}-{name}"
+
+            # read the dataset once for all the variants
+            items = list(dataset)
+            # item by item, so every variant makes progress from the start
+            jobs = [
+                (v, i) for i in range(len(items)) for v in range(len(named_variants))
+            ]
+
+            if result_cache is not None:
+                base = fingerprint()
+                variant_keys = [
+                    content_hash([base, kwargs]) for _, kwargs in named_variants
+                ]
+
+            async def run_job(job):
+                v, i = job
+                kwargs = named_variants[v][1]
+                call = lambda item: wrapped_experiment(item, **kwargs)
+                if result_cache is not None:
+                    return await result_cache.acall(variant_keys[v], call, items[i])
+                return await call(items[i])
+
+            experiments = {}
+            telemetry = RunTelemetry(name, observers, log_path, report_interval)
+            snapshot = start_versioning(name, stage_all) if save_to_git else None
+            tenant = current_tenant.set(name)
+            progress_bar = tqdm(
+                total=len(jobs), desc=f"Running sweep of {len(named_variants)} variants"
+            )
+            try:
+                for variant_name, _ in named_variants:
+                    experiments[variant_name] = self.create_experiment(
+                        name=f"{name}-{variant_name}", model=experiment_model
+                    )
+                row_ids = [
+                    input_row_ids(items, experiments[variant_name].experiment_id)
+                    for variant_name, _ in named_variants
+                ]
+
+                telemetry.start()
+                async with AsyncExitStack() as stack:
+                    # every variant's results are uploaded to its own experiment
+                    appenders = [
+                        await stack.enter_async_context(
+                            experiments[variant_name].appender(
+                                on_append=telemetry.result_uploaded,
+                                keep_entries=keep_results,
+                            )
+                        )
+                        for variant_name, _ in named_variants
+                    ]
+                    outcomes = map_bounded(
+                        guarded(
+                            telemetry.timed(run_job),
+                            timeout,
+                            retries,
+                            speculate_after,
+                            on_retry=telemetry.retried,
+                        ),
+                        jobs,
+                        max_concurrency=max_concurrency,
+                        rate=rate,
+                    )
+                    async for index, result in outcomes:
+                        progress_bar.update(1)
+                        telemetry.item_completed()
+                        if result is not None:
+                            telemetry.result_ready(result)
+                            v, i = jobs[index]
+                            await appenders[v].put(result, row_ids[v][i])
+            except Exception:
+                await discard_versioning(name, snapshot)
+                for experiment in experiments.values():
+                    try:
+                        await self._ragas_api_client.delete_experiment(
+                            project_id=self.project_id,
+                            experiment_id=experiment.experiment_id,
+                        )
+                    except Exception as cleanup_error:
+                        print(
+                            f"Failed to clean up experiment after error: {cleanup_error}"
+                        )
+                raise
+            finally:
+                current_tenant.reset(tenant)
+                summary = telemetry.stop()
+                for experiment in experiments.values():
+                    experiment.run_summary = summary
+                progress_bar.close()
+
+            if save_to_git:
+                await finish_versioning(name, stage_all, snapshot)
+
+            return experiments
+
         wrapped_experiment.__setattr__("run_async", run_async)
+        wrapped_experiment.__setattr__("publish_async", publish_async)
+        wrapped_experiment.__setattr__("work_async", work_async)
+        wrapped_experiment.__setattr__("run_sweep", run_sweep)
         return t.cast(ExperimentProtocol, wrapped_experiment)
 
     return decorator
 
-# %% ../../nbs/project/experiments.ipynb 31
+# %% ../../nbs/project/experiments.ipynb 36
 # this one we have to clean up
 from langfuse.decorators import observe
 
-# %% ../../nbs/project/experiments.ipynb 32
+# %% ../../nbs/project/experiments.ipynb 37
 @patch
 def langfuse_experiment(
     self: Project,
@@ -412,12 +1225,18 @@ def langfuse_experiment(
     name_prefix: str = "",
     save_to_git: bool = True,
     stage_all: bool = True,
+    cache: t.Union[bool, ResultCache] = False,
+    config: t.Any = None,
+    versioning: t.Literal["branch", "snapshot"] = "branch",
 ):
     """Decorator for creating experiment functions with Langfuse integration.
 
     Args:
         experiment_model: The NotionModel type to use for experiment results
         name_prefix: Optional prefix for experiment names
+        cache: Reuse the results of unchanged items, see `Project.experiment`
+        config: Settings the results depend on, to key cached results by
+        versioning: How `save_to_git` records the code, see `Project.experiment`
 
     Returns:
         Decorator function that wraps experiment functions with Langfuse observation
@@ -435,14 +1254,20 @@ def langfuse_experiment(
 
         # Now create the experiment wrapper with our already-observed function
         experiment_wrapper = self.experiment(
-            experiment_model, name_prefix, save_to_git, stage_all
+            experiment_model,
+            name_prefix,
+            save_to_git,
+            stage_all,
+            cache,
+            config,
+            versioning,
         )(langfuse_wrapped_func)
 
         return t.cast(ExperimentProtocol, experiment_wrapper)
 
     return decorator
 
-# %% ../../nbs/project/experiments.ipynb 39
+# %% ../../nbs/project/experiments.ipynb 44
 from mlflow import trace
 
 
@@ -453,12 +1278,18 @@ def mlflow_experiment(
     name_prefix: str = "",
     save_to_git: bool = True,
     stage_all: bool = True,
+    cache: t.Union[bool, ResultCache] = False,
+    config: t.Any = None,
+    versioning: t.Literal["branch", "snapshot"] = "branch",
 ):
     """Decorator for creating experiment functions with mlflow integration.
 
     Args:
         experiment_model: The NotionModel type to use for experiment results
         name_prefix: Optional prefix for experiment names
+        cache: Reuse the results of unchanged items, see `Project.experiment`
+        config: Settings the results depend on, to key cached results by
+        versioning: How `save_to_git` records the code, see `Project.experiment`
 
     Returns:
         Decorator function that wraps experiment functions with mlflow observation
@@ -477,14 +1308,20 @@ def mlflow_experiment(
 
         # Now create the experiment wrapper with our already-observed function
         experiment_wrapper = self.experiment(
-            experiment_model, name_prefix, save_to_git, stage_all
+            experiment_model,
+            name_prefix,
+            save_to_git,
+            stage_all,
+            cache,
+            config,
+            versioning,
         )(mlflow_wrapped_func)
 
         return t.cast(ExperimentProtocol, experiment_wrapper)
 
     return decorator
 
-# %% ../../nbs/project/experiments.ipynb 40
+# %% ../../nbs/project/experiments.ipynb 45
 import logging
 from ..utils import plot_experiments_as_subplots
 
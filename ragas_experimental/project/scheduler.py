@@ -0,0 +1,354 @@
+"""Run an async function over many items with bounded concurrency."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/project/scheduler.ipynb.
+
+# %% auto 0
+__all__ = ['RateLimiter', 'map_bounded', 'LatencyTracker', 'guarded', 'FunctionRef', 'map_in_processes']
+
+# %% ../../nbs/project/scheduler.ipynb 3
+import asyncio
+import time
+import typing as t
+
+# %% ../../nbs/project/scheduler.ipynb 5
+class RateLimiter:
+    """Token bucket that allows `rate` acquisitions per second on average.
+
+    Up to `burst` acquisitions can happen at once after a quiet period.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until `tokens` can be taken from the bucket."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+# %% ../../nbs/project/scheduler.ipynb 9
+class _Failure(t.NamedTuple):
+    error: BaseException
+
+
+_DONE = object()
+
+
+async def map_bounded(
+    func: t.Callable[[t.Any], t.Awaitable[t.Any]],
+    items: t.Union[t.Iterable, t.AsyncIterable],
+    max_concurrency: int = 16,
+    rate: t.Optional[float] = None,
+    max_pending: t.Optional[int] = None,
+) -> t.AsyncIterator[t.Tuple[int, t.Any]]:
+    """Apply `func` to every item with bounded concurrency.
+
+    Args:
+        func: Async function called once per item
+        items: Items to process, read lazily
+        max_concurrency: Maximum number of calls in flight
+        rate: Maximum number of calls started per second, unlimited by default
+        max_pending: Maximum number of items read ahead of the workers, twice
+            `max_concurrency` by default
+
+    Yields:
+        The position of the item and the result of `func`, in completion order
+
+    Raises:
+        The first error raised by `func` or while reading `items`. The calls still
+        in flight are cancelled.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    pending: asyncio.Queue = asyncio.Queue(maxsize=max_pending or 2 * max_concurrency)
+    done: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency)
+    limiter = RateLimiter(rate) if rate else None
+    # set once the consumer stops, when cancelling the tasks is expected
+    closing = False
+
+    async def produce():
+        try:
+            if isinstance(items, t.AsyncIterable):
+                index = 0
+                async for item in items:
+                    await pending.put((index, item))
+                    index += 1
+            else:
+                for index, item in enumerate(items):
+                    await pending.put((index, item))
+        except (Exception, asyncio.CancelledError) as e:
+            if closing:
+                raise
+            await done.put(_Failure(e))
+        for _ in range(max_concurrency):
+            await pending.put(_DONE)
+
+    async def work():
+        while (job := await pending.get()) is not _DONE:
+            index, item = job
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
+                result = await func(item)
+            except (Exception, asyncio.CancelledError) as e:
+                if closing:
+                    raise
+                # an item that cancelled itself fails the map like any other error
+                await done.put(_Failure(e))
+                return
+            await done.put((index, result))
+        await done.put(_DONE)
+
+    tasks = [asyncio.create_task(produce())]
+    tasks += [asyncio.create_task(work()) for _ in range(max_concurrency)]
+    try:
+        running = max_concurrency
+        while running:
+            outcome = await done.get()
+            if outcome is _DONE:
+                running -= 1
+            elif isinstance(outcome, _Failure):
+                raise outcome.error
+            else:
+                yield outcome
+    finally:
+        closing = True
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# %% ../../nbs/project/scheduler.ipynb 13
+import collections
+
+
+class LatencyTracker:
+    """Latencies of the most recent items, to tell when an item is a straggler."""
+
+    def __init__(self, window: int = 1000, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = collections.deque(maxlen=window)
+        self._sorted: t.Optional[t.List[float]] = None
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def quantile(self, q: float) -> t.Optional[float]:
+        """Latency below which a fraction `q` of the items finished, or None
+        while there are fewer than `min_samples` of them."""
+        if len(self._samples) < self.min_samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        return self._sorted[min(int(q * len(self._sorted)), len(self._sorted) - 1)]
+
+
+def guarded(
+    func: t.Callable[[t.Any], t.Awaitable],
+    timeout: t.Optional[float] = None,
+    retries: int = 0,
+    speculate_after: t.Optional[float] = None,
+    tracker: t.Optional[LatencyTracker] = None,
+    on_retry: t.Optional[t.Callable[[BaseException], None]] = None,
+) -> t.Callable[[t.Any], t.Awaitable]:
+    """Wrap `func` with a per-item timeout, retries and speculative duplicates.
+
+    Args:
+        func: Async function to call on each item
+        timeout: Seconds an attempt may take before it is cancelled
+        retries: Number of times a failed or timed out item is tried again
+        speculate_after: Quantile of the observed latencies, e.g. 0.95, after
+            which a straggling item is started a second time
+        tracker: Latencies to compare against, shared by all calls by default
+        on_retry: Called with the error of each attempt that is retried
+    """
+    if timeout is None and not retries and speculate_after is None:
+        return func
+    tracker = tracker or LatencyTracker()
+
+    async def attempt(item):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + timeout if timeout is not None else None
+        pending = {asyncio.ensure_future(func(item))}
+        try:
+            while speculate_after is not None and len(pending) == 1:
+                threshold = tracker.quantile(speculate_after)
+                elapsed = loop.time() - start
+                if threshold is not None and elapsed >= threshold:
+                    pending.add(asyncio.ensure_future(func(item)))
+                    break
+                # wait for the item to become a straggler, or for enough samples
+                # to tell whether it is one
+                wait = threshold - elapsed if threshold is not None else 0.1
+                if deadline is not None:
+                    wait = min(wait, deadline - loop.time())
+                    if wait <= 0:
+                        break
+                done, _ = await asyncio.wait(pending, timeout=wait)
+                if done:
+                    break
+            error: BaseException = RuntimeError(
+                "Every attempt of the item was cancelled"
+            )
+            while pending:
+                remaining = deadline - loop.time() if deadline is not None else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise asyncio.TimeoutError(
+                        f"Item did not finish within {timeout} seconds"
+                    )
+                for task in done:
+                    if task.cancelled():
+                        # the call cancelled itself, the other copy may still finish
+                        continue
+                    if task.exception() is None:
+                        tracker.record(loop.time() - start)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run(item):
+        for retry in range(retries + 1):
+            try:
+                return await attempt(item)
+            except Exception as e:
+                if retry == retries:
+                    raise
+                if on_retry is not None:
+                    on_retry(e)
+
+    return run
+
+# %% ../../nbs/project/scheduler.ipynb 17
+import importlib
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+class FunctionRef(t.NamedTuple):
+    """Picklable reference to a function defined at the top level of a module."""
+
+    module: str
+    qualname: str
+
+    @classmethod
+    def of(cls, func: t.Callable) -> "FunctionRef":
+        func = inspect.unwrap(func)
+        if "<locals>" in func.__qualname__ or func.__name__ == "<lambda>":
+            raise ValueError(
+                f"{func.__qualname__} must be defined at the top level of a module "
+                "to run in a process pool"
+            )
+        return cls(func.__module__, func.__qualname__)
+
+    def resolve(self) -> t.Callable:
+        obj = importlib.import_module(self.module)
+        for name in self.qualname.split("."):
+            obj = getattr(obj, name)
+        # the name may be bound to a decorated version of the function
+        return inspect.unwrap(obj)
+
+
+_worker_func: t.Optional[t.Callable] = None
+_worker_loop: t.Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker(
+    ref: FunctionRef, initializer: t.Optional[t.Callable[[], t.Any]]
+) -> None:
+    global _worker_func
+    _worker_func = ref.resolve()
+    if initializer is not None:
+        initializer()
+
+
+async def _gather_chunk(items: t.List[t.Any]) -> t.List[t.Any]:
+    return await asyncio.gather(*(_worker_func(item) for item in items))
+
+
+def _run_chunk(items: t.List[t.Any]) -> t.List[t.Any]:
+    global _worker_loop
+    if not inspect.iscoroutinefunction(_worker_func):
+        return [_worker_func(item) for item in items]
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop.run_until_complete(_gather_chunk(items))
+
+
+def _chunked(items: t.Iterable, size: int) -> t.Iterator[t.List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def map_in_processes(
+    func: t.Callable,
+    items: t.Iterable,
+    workers: t.Optional[int] = None,
+    initializer: t.Optional[t.Callable[[], t.Any]] = None,
+    chunk_size: int = 8,
+) -> t.AsyncIterator[t.Tuple[int, t.Any]]:
+    """Apply `func` to every item in a pool of worker processes.
+
+    Args:
+        func: Sync or async function defined at the top level of a module
+        items: Items to process, they and the results must be picklable
+        workers: Number of worker processes, the number of CPUs by default
+        initializer: Called once in every worker before it processes items
+        chunk_size: Number of items sent to a worker at a time
+
+    Yields:
+        The position of the item and the result of `func`, in completion order
+    """
+    workers = workers or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(FunctionRef.of(func), initializer),
+    )
+
+    async def run_chunk(chunk):
+        indices, chunk_items = zip(*chunk)
+        results = await loop.run_in_executor(pool, _run_chunk, list(chunk_items))
+        return zip(indices, results)
+
+    try:
+        # keep a second chunk queued for every worker so none of them waits on us
+        async for _, results in map_bounded(
+            run_chunk,
+            _chunked(enumerate(items), chunk_size),
+            max_concurrency=2 * workers,
+        ):
+            for result in results:
+                yield result
+    finally:
+        # wait for the workers in a thread, so none outlives the map and the
+        # loop is not blocked meanwhile
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
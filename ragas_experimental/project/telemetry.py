@@ -0,0 +1,159 @@
+"""Throughput, latency, errors and upload lag of experiment runs while they happen."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/project/telemetry.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'RunStats', 'RunTelemetry']
+
+# %% ../../nbs/project/telemetry.ipynb 3
+import asyncio
+import dataclasses
+import json
+import logging
+import time
+import typing as t
+from pathlib import Path
+
+from .scheduler import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+# %% ../../nbs/project/telemetry.ipynb 5
+@dataclasses.dataclass
+class RunStats:
+    """Snapshot of the progress of an experiment run."""
+
+    name: str
+    elapsed: float
+    completed: int
+    errors: int
+    retries: int
+    in_flight: int
+    uploaded: int
+    pending_uploads: int
+    items_per_second: float
+    latency_p50: t.Optional[float] = None
+    latency_p90: t.Optional[float] = None
+    latency_p99: t.Optional[float] = None
+    upload_lag_p50: t.Optional[float] = None
+    upload_lag_p95: t.Optional[float] = None
+    final: bool = False
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return dataclasses.asdict(self)
+
+
+class RunTelemetry:
+    """Counters and latencies of one experiment run, reported periodically."""
+
+    def __init__(
+        self,
+        name: str,
+        observers: t.Sequence[t.Callable[[RunStats], None]] = (),
+        log_path: t.Optional[t.Union[str, Path]] = None,
+        report_interval: float = 5.0,
+    ):
+        self.name = name
+        self.observers = list(observers)
+        self.log_path = Path(log_path) if log_path is not None else None
+        self.report_interval = report_interval
+        self.completed = 0
+        self.errors = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.uploaded = 0
+        self._latencies = LatencyTracker(window=10_000, min_samples=1)
+        self._upload_lags = LatencyTracker(window=10_000, min_samples=1)
+        self._ready: t.Dict[int, float] = {}
+        self._started = time.monotonic()
+        self._reporter: t.Optional[asyncio.Task] = None
+
+    def timed(
+        self, func: t.Callable[[t.Any], t.Awaitable]
+    ) -> t.Callable[[t.Any], t.Awaitable]:
+        """Wrap `func` to measure the latency and errors of each call."""
+
+        async def run(item):
+            self.in_flight += 1
+            start = time.monotonic()
+            try:
+                result = await func(item)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.in_flight -= 1
+            self._latencies.record(time.monotonic() - start)
+            return result
+
+        return run
+
+    def retried(self, error: BaseException) -> None:
+        self.retries += 1
+
+    def item_completed(self) -> None:
+        self.completed += 1
+
+    def result_ready(self, entry: t.Any) -> None:
+        """Note that a result is waiting to be uploaded."""
+        self._ready[id(entry)] = time.monotonic()
+
+    def result_uploaded(self, entry: t.Any) -> None:
+        self.uploaded += 1
+        ready = self._ready.pop(id(entry), None)
+        if ready is not None:
+            self._upload_lags.record(time.monotonic() - ready)
+
+    def snapshot(self, final: bool = False) -> RunStats:
+        elapsed = time.monotonic() - self._started
+        return RunStats(
+            name=self.name,
+            elapsed=elapsed,
+            completed=self.completed,
+            errors=self.errors,
+            retries=self.retries,
+            in_flight=self.in_flight,
+            uploaded=self.uploaded,
+            pending_uploads=len(self._ready),
+            items_per_second=self.completed / elapsed if elapsed > 0 else 0.0,
+            latency_p50=self._latencies.quantile(0.5),
+            latency_p90=self._latencies.quantile(0.9),
+            latency_p99=self._latencies.quantile(0.99),
+            upload_lag_p50=self._upload_lags.quantile(0.5),
+            upload_lag_p95=self._upload_lags.quantile(0.95),
+            final=final,
+        )
+
+    def report(self, final: bool = False) -> RunStats:
+        """Pass a snapshot to the observers and the log."""
+        stats = self.snapshot(final)
+        for observer in self.observers:
+            try:
+                observer(stats)
+            except Exception:
+                # a broken observer should not fail the run
+                logger.exception("Run telemetry observer failed")
+        if self.log_path is not None:
+            with self.log_path.open("a") as f:
+                f.write(json.dumps(stats.to_dict()) + "\n")
+        return stats
+
+    async def _report_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            self.report()
+
+    def start(self) -> None:
+        """Start reporting every `report_interval` seconds."""
+        self._started = time.monotonic()
+        if self.observers or self.log_path is not None:
+            self._reporter = asyncio.get_running_loop().create_task(
+                self._report_periodically()
+            )
+
+    def stop(self) -> RunStats:
+        """Stop reporting and report the final summary of the run."""
+        if self._reporter is not None:
+            self._reporter.cancel()
+            self._reporter = None
+        return self.report(final=True)
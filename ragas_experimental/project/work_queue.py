@@ -0,0 +1,171 @@
+"""A lease-based queue that splits an experiment run between workers on several machines."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/project/work_queue.ipynb.
+
+# %% auto 0
+__all__ = ['Lease', 'default_worker_id', 'WorkQueue']
+
+# %% ../../nbs/project/work_queue.ipynb 3
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+from pathlib import Path
+
+# %% ../../nbs/project/work_queue.ipynb 5
+class Lease(t.NamedTuple):
+    """An item leased to a worker."""
+
+    key: str
+    item: t.Any
+    attempt: int
+
+
+def default_worker_id() -> str:
+    """Identify this process among the workers of a queue."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkQueue:
+    """Queue of work items shared by the workers of experiment runs, stored in SQLite."""
+
+    def __init__(self, path: t.Union[str, Path], max_attempts: int = 3):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                name TEXT PRIMARY KEY,
+                experiment_id TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS items (
+                run TEXT NOT NULL,
+                key TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                PRIMARY KEY (run, key)
+            );
+            CREATE INDEX IF NOT EXISTS items_by_state ON items (run, state, position);
+            """)
+
+    @contextmanager
+    def _transaction(self) -> t.Iterator[sqlite3.Connection]:
+        """Run statements in a transaction that holds the write lock from the start."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def publish(
+        self, run: str, experiment_id: str, items: t.Iterable[t.Tuple[str, t.Any]]
+    ) -> int:
+        """Publish the `(key, item)` pairs of a run. Returns the number of new items."""
+        with self._transaction() as db:
+            db.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?)",
+                (run, experiment_id, time.time()),
+            )
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO items (run, key, position, payload) VALUES (?, ?, ?, ?)",
+                (
+                    (run, key, position, pickle.dumps(item))
+                    for position, (key, item) in enumerate(items)
+                ),
+            )
+            return db.total_changes - before
+
+    def experiment_id(self, run: str) -> str:
+        """Get the id of the experiment the results of a run go to."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT experiment_id FROM runs WHERE name = ?", (run,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No run named '{run}' in {self.path}")
+        return row[0]
+
+    def lease(
+        self, run: str, worker_id: str, n: int, lease_seconds: float = 60
+    ) -> t.List[Lease]:
+        """Lease up to `n` items that are pending or whose lease has expired."""
+        now = time.time()
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE items SET state = 'failed', error = 'lease expired too many times' "
+                "WHERE run = ? AND state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (run, now, self.max_attempts),
+            )
+            rows = db.execute(
+                "SELECT key, payload, attempts FROM items WHERE run = ? AND "
+                "(state = 'pending' OR (state = 'leased' AND lease_expires < ?)) "
+                "ORDER BY position LIMIT ?",
+                (run, now, n),
+            ).fetchall()
+            db.executemany(
+                "UPDATE items SET state = 'leased', owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE run = ? AND key = ?",
+                ((worker_id, now + lease_seconds, run, key) for key, _, _ in rows),
+            )
+        return [
+            Lease(key, pickle.loads(payload), attempts + 1)
+            for key, payload, attempts in rows
+        ]
+
+    def heartbeat(
+        self, run: str, worker_id: str, keys: t.Iterable[str], lease_seconds: float = 60
+    ) -> None:
+        """Extend the leases this worker still holds on `keys`."""
+        expires = time.time() + lease_seconds
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE items SET lease_expires = ? "
+                "WHERE run = ? AND key = ? AND owner = ? AND state = 'leased'",
+                ((expires, run, key, worker_id) for key in keys),
+            )
+
+    def complete(self, run: str, key: str) -> None:
+        """Mark an item as done, whichever worker finished it."""
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE items SET state = 'done', lease_expires = NULL WHERE run = ? AND key = ?",
+                (run, key),
+            )
+
+    def fail(self, run: str, worker_id: str, key: str, error: str) -> None:
+        """Give up the lease on an item after an error, retrying it later if allowed."""
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE items SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, owner = NULL, lease_expires = NULL "
+                "WHERE run = ? AND key = ? AND owner = ? AND state = 'leased'",
+                (self.max_attempts, error, run, key, worker_id),
+            )
+
+    def status(self, run: str) -> t.Dict[str, int]:
+        """Count the items of a run in each state."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT state, COUNT(*) FROM items WHERE run = ? GROUP BY state", (run,)
+            ).fetchall()
+        return {"pending": 0, "leased": 0, "done": 0, "failed": 0, **dict(rows)}
+
+    def close(self) -> None:
+        self._db.close()
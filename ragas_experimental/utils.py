@@ -1,13 +1,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/utils.ipynb.
 
 # %% auto 0
-__all__ = ['create_nano_id', 'async_to_sync', 'plot_experiments_as_subplots']
+__all__ = ['create_nano_id', 'async_to_sync', 'content_hash', 'plot_experiments_as_subplots']
 
 # %% ../nbs/utils.ipynb 2
 import string
 import uuid
 import functools
 import asyncio
+import typing as t
 
 # %% ../nbs/utils.ipynb 3
 def create_nano_id(size=12):
@@ -48,6 +49,16 @@ def async_to_sync(async_func):
     return sync_wrapper
 
 # %% ../nbs/utils.ipynb 5
+import hashlib
+import json
+
+
+def content_hash(obj: t.Any) -> str:
+    """Get a stable hash of JSON-like content, independent of dict key order."""
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+# %% ../nbs/utils.ipynb 7
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots